@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from Columns import Columns
+from Plotter import Plotter
+from Rescorer import Rescorer
+from synthetic import synthetic_records, synthetic_frame
+
+from typing import Any, Dict, List, Tuple
+
+import argparse
+import numpy as np
+import pandas as pd
+
+
+def legacy_metrics(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the metrics the way Plotter did before, with eval and row-wise apply.
+
+    :param data: Data frame with the columns of the results CSV file.
+    :return: Tuple of the average time per square and the accuracy.
+    """
+    def average_time_per_square(row: pd.Series) -> float:
+        click_times: List[float] = eval(row["Click_times"])
+        if len(eval(row["Selected_squares"])) == 0 or not click_times:
+            return np.nan
+        return np.abs(np.mean(click_times))
+
+    def calculate_accuracy(row: pd.Series) -> float:
+        selected_squares: List[Tuple[int, int]] = eval(row["Selected_squares"])
+        clicked_positions: List[Tuple[int, int]] = eval(row["Clicked_positions"])
+        correct_clicks: int = sum([1 for pos in clicked_positions if pos in selected_squares])
+        return correct_clicks / len(clicked_positions) if clicked_positions else 0.0
+
+    return (data.apply(average_time_per_square, axis=1).to_numpy(),
+            data.apply(calculate_accuracy, axis=1).to_numpy())
+
+
+def main() -> int:
+    """
+    Times the vectorized parsing and metrics of Plotter against the legacy implementation.
+
+    The legacy accuracy counts every logged click, Plotter counts the clicks scored by the rules of Round
+    (no repeated clicks on a square, no clicks after the round finished), so the accuracies are compared
+    on the rounds in which every logged click is scored, and the raw accuracy of Plotter on all rounds.
+
+    :return: 0 if the results of both implementations are equal.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Plotter._prepare_data benchmark")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="number of rounds")
+    parser.add_argument("--legacy-rounds", type=int, default=20_000,
+                        help="number of rounds for the legacy implementation (extrapolated)")
+    args: argparse.Namespace = parser.parse_args()
+
+    data: pd.DataFrame = synthetic_frame(synthetic_records(args.rounds))
+
+    start: float = time.perf_counter()
+    columns: Columns = Columns.from_strings(data)
+    parsed: float = time.perf_counter()
+    average_time, accuracy, raw_accuracy = Plotter._compute_metrics(columns)
+    computed: float = time.perf_counter()
+
+    sample: pd.DataFrame = data.iloc[:args.legacy_rounds]
+    legacy_start: float = time.perf_counter()
+    legacy_average_time, legacy_accuracy = legacy_metrics(sample)
+    legacy_seconds: float = (time.perf_counter() - legacy_start) * args.rounds / len(sample)
+
+    scored_clicks: np.ndarray = Rescorer().score(columns)["Scored_clicks"][:len(sample)]
+    comparable: np.ndarray = scored_clicks == columns.lengths("Clicked_positions")[:len(sample)]
+    equal: bool = (np.allclose(average_time[:len(sample)], legacy_average_time, equal_nan=True)
+                   and np.allclose(accuracy[:len(sample)][comparable], legacy_accuracy[comparable])
+                   and np.allclose(raw_accuracy[:len(sample)], legacy_accuracy))
+    results: Dict[str, Any] = {
+        "rounds": args.rounds,
+        "parse [s]": round(parsed - start, 3),
+        "metrics [s]": round(computed - parsed, 3),
+        "total [s]": round(computed - start, 3),
+        "legacy, extrapolated [s]": round(legacy_seconds, 3),
+        "speedup": round(legacy_seconds / (computed - start), 1),
+        "accuracy compared on rounds": f"{int(comparable.sum())} of {len(sample)} (all clicks scored)",
+        "equal to legacy": equal,
+    }
+    for name, value in results.items():
+        print(f"{name}: {value}")
+    return 0 if equal else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+import os
+import sys
+import time
+
+from typing import Any, List, Dict, Optional, Tuple
+
+import argparse
+import json
+import statistics
+import subprocess
+import tempfile
+
+SRC_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+DEFERRED_MODULES: Tuple[str, ...] = ("pandas", "matplotlib")
+HARNESS_MODULES: Tuple[str, ...] = ("ast", "importlib")
+
+ENTRY_POINT: str = """
+import ast
+import importlib
+import os
+
+import main
+with open("Experiment.py") as file:
+    tree = ast.parse(file.read())
+for node in tree.body:
+    if isinstance(node, ast.ImportFrom) and os.path.exists(f"{node.module}.py"):
+        try:
+            importlib.import_module(node.module)
+        except ImportError as error:
+            print(error)
+try:
+    import Experiment
+except ImportError as error:
+    print(error)
+"""
+
+FIRST_FRAME: str = """
+import sys
+import time
+import json
+
+start = float(sys.argv[1])
+try:
+    from Experiment import Experiment
+except ImportError:
+    print(json.dumps(None))
+    sys.exit(0)
+imported = time.time()
+experiment = Experiment(fullscreen=False, path_to_results=sys.argv[2])
+experiment.win.flip()
+flipped = time.time()
+print(json.dumps({"import [s]": imported - start, "first frame [s]": flipped - start,
+                  "deferred modules loaded": [name for name in sys.argv[3:] if name in sys.modules]}))
+experiment.win.close()
+"""
+
+
+def import_times() -> Tuple[float, List[Tuple[str, float]], List[str]]:
+    """
+    Measures the imports of the entry point with python -X importtime in a fresh interpreter.
+
+    The modules imported by Experiment are imported one by one first, so they are measured
+    even if PsychoPy is not installed.
+
+    :return: Tuple of the total import time in seconds, the cumulative times of the top-level imports
+             and all imported module names.
+    """
+    completed: subprocess.CompletedProcess = subprocess.run([sys.executable, "-X", "importtime", "-c", ENTRY_POINT],
+                                                            cwd=SRC_DIR, capture_output=True, text=True)
+    top_level: List[Tuple[str, float]] = []
+    modules: List[str] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append(name.strip())
+        if not name.startswith("  ") and name.strip() not in HARNESS_MODULES:
+            top_level.append((name.strip(), int(cumulative) / 1e6))
+    return sum(seconds for _, seconds in top_level), top_level, modules
+
+
+def first_frame() -> Optional[Dict[str, Any]]:
+    """
+    Measures the time from the start of a fresh interpreter to the first flip of the experiment window.
+
+    :return: Dictionary with the import and first frame times, or None if PsychoPy is not installed.
+    """
+    with tempfile.TemporaryDirectory() as path_to_results:
+        completed: subprocess.CompletedProcess = subprocess.run(
+            [sys.executable, "-c", FIRST_FRAME, repr(time.time()), path_to_results + os.sep, *DEFERRED_MODULES],
+            cwd=SRC_DIR, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    """
+    Runs the startup benchmark of the experiment entry point.
+
+    :return: 0 if none of the deferred analysis modules is imported at startup.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Startup benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measured interpreter starts")
+    parser.add_argument("--top", type=int, default=10, help="number of listed top-level imports")
+    parser.add_argument("--output", metavar="FILE", help="save the results to a JSON file")
+    args: argparse.Namespace = parser.parse_args()
+
+    totals: List[float] = []
+    breakdowns: Dict[str, List[float]] = {}
+    modules: List[str] = []
+    for _ in range(args.repeat):
+        total, top_level, modules = import_times()
+        totals.append(total)
+        for name, seconds in top_level:
+            breakdowns.setdefault(name, []).append(seconds)
+    frames: List[Dict[str, Any]] = [frame for frame in (first_frame() for _ in range(args.repeat)) if frame]
+
+    deferred: List[str] = [name for name in DEFERRED_MODULES
+                           if name in modules or any(name in frame["deferred modules loaded"] for frame in frames)]
+    breakdown: List[Tuple[str, float]] = sorted(((name, statistics.median(times)) for name, times in breakdowns.items()),
+                                                key=lambda item: item[1], reverse=True)[:args.top]
+    results: Dict[str, Any] = {
+        "import [s]": round(statistics.median(totals), 4),
+        "import breakdown [s]": {name: round(seconds, 4) for name, seconds in breakdown},
+        "first frame [s]": round(statistics.median(frame["first frame [s]"] for frame in frames), 4) if frames
+        else None,
+        "deferred modules loaded": deferred,
+    }
+
+    print(f"import (median of {args.repeat}): {results['import [s]']} s")
+    for name, seconds in results["import breakdown [s]"].items():
+        print(f"  {name}: {seconds} s")
+    print(f"first frame: {results['first frame [s]'] if frames else 'skipped (PsychoPy is not installed)'}")
+    print(f"deferred modules loaded at startup: {', '.join(deferred) or 'none'}")
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=4)
+    return 1 if deferred else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
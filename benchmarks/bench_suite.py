@@ -0,0 +1,371 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from Converter import Converter
+from Plotter import Plotter
+from Round import Round
+from Rescorer import Rescorer
+from Columns import Columns
+from synthetic import synthetic_records, synthetic_frame
+
+from typing import Any, List, Dict, Tuple, Callable, Optional, Iterator, Union
+from types import SimpleNamespace
+
+import argparse
+import contextlib
+import datetime
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import numpy as np
+
+RESULTS_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+Setup = Callable[[argparse.Namespace, str], Union[Callable[[], Any], Iterator[Callable[[], Any]]]]
+BENCHMARKS: Dict[str, Setup] = {}
+PARAMETERS: Tuple[str, ...] = ("rounds", "plot_rounds", "grid_sizes", "max_clicks", "seed")
+
+
+class SkipBenchmark(Exception):
+    """
+    Raised by the setup of a benchmark which cannot run in the current environment.
+    """
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """
+    Decorator registering the setup of a benchmark under a name.
+
+    The setup gets the arguments and a temporary directory, prepares the data (not timed)
+    and returns the measured function. A setup holding resources (e.g. a window) yields the function instead
+    and releases them in a finally block, which runs when the measurement is done.
+
+    :param name: The name of the benchmark, used in the results.
+    :return: The decorator.
+    """
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def records(args: argparse.Namespace, rounds: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Generates the synthetic results at the scale given by the arguments.
+
+    :param args: The arguments of the suite.
+    :param rounds: Number of rounds. Default is args.rounds.
+    :return: List of dictionaries containing the results of every round.
+    """
+    return synthetic_records(args.rounds if rounds is None else rounds, tuple(args.grid_sizes), args.max_clicks,
+                             seed=args.seed)
+
+
+def grid_size(record: Dict[str, Any]) -> int:
+    """
+    Returns the smallest grid containing all selected and clicked squares of a round.
+
+    :param record: The results of the round.
+    :return: The grid size.
+    """
+    return max(max(pos) for pos in record["Selected_squares"] + record["Clicked_positions"]) + 1
+
+
+def grid_class() -> Any:
+    """
+    Imports the grid stimulus class.
+
+    :return: The Grid class.
+    """
+    try:
+        from Grid import Grid
+    except ImportError:
+        raise SkipBenchmark("PsychoPy is not installed")
+    return Grid
+
+
+def open_window() -> Any:
+    """
+    Opens a small window for the drawing benchmarks.
+
+    :return: The window, to be closed by the caller.
+    """
+    grid_class()
+    from psychopy import visual
+    from Colors import Colors
+
+    try:
+        return visual.Window(size=(400, 400), fullscr=False, units="height", color=Colors.BACKGROUND.value)
+    except Exception as error:
+        raise SkipBenchmark(f"no window could be opened: {error}")
+
+
+@benchmark("converter_csv")
+def converter_csv(args: argparse.Namespace, workdir: str) -> Callable[[], Any]:
+    """
+    Saves the results to a CSV file with Converter.save_to_csv.
+    """
+    return Converter(records(args), os.path.join(workdir, "results")).save_to_csv
+
+
+@benchmark("converter_txt")
+def converter_txt(args: argparse.Namespace, workdir: str) -> Callable[[], Any]:
+    """
+    Saves the results to a TXT file with Converter.save_to_txt.
+    """
+    return Converter(records(args), os.path.join(workdir, "results")).save_to_txt
+
+
+@benchmark("converter_json")
+def converter_json(args: argparse.Namespace, workdir: str) -> Callable[[], Any]:
+    """
+    Saves the results to a JSON file with Converter.save_to_json.
+    """
+    return Converter(records(args), os.path.join(workdir, "results")).save_to_json
+
+
+@benchmark("prepare_data")
+def prepare_data(args: argparse.Namespace, workdir: str) -> Callable[[], Any]:
+    """
+    Parses the result lists and computes the metrics with Plotter._prepare_data.
+    """
+    csv_file: str = os.path.join(workdir, "prepare_data.csv")
+    synthetic_frame(records(args)).to_csv(csv_file, index=False)
+    return Plotter(csv_file, save_dir=workdir)._prepare_data
+
+
+@benchmark("plot_average_time_per_square")
+def plot_average_time_per_square(args: argparse.Namespace, workdir: str) -> Callable[[], Any]:
+    """
+    Renders and saves the average time per square plot of a session.
+    """
+    csv_file: str = os.path.join(workdir, "plot.csv")
+    synthetic_frame(records(args, args.plot_rounds)).to_csv(csv_file, index=False)
+    return Plotter(csv_file, save_dir=workdir).plot_average_time_per_square
+
+
+@benchmark("plot_overall_average_accuracy")
+def plot_overall_average_accuracy(args: argparse.Namespace, workdir: str) -> Callable[[], Any]:
+    """
+    Renders and saves the overall average accuracy plot of a session.
+    """
+    csv_file: str = os.path.join(workdir, "plot.csv")
+    synthetic_frame(records(args, args.plot_rounds)).to_csv(csv_file, index=False)
+    return Plotter(csv_file, save_dir=workdir).plot_overall_average_accuracy
+
+
+@benchmark("round_click")
+def round_click(args: argparse.Namespace, workdir: str) -> Callable[[], Any]:
+    """
+    Scores the clicks of all rounds with Round.click.
+    """
+    rounds: List[Dict[str, Any]] = records(args)
+    grid_sizes: List[int] = [grid_size(record) for record in rounds]
+
+    def run() -> None:
+        for record, size in zip(rounds, grid_sizes):
+            Round.replay(size, record["Selected_squares"], record["Clicked_positions"], record["Click_times"])
+    return run
+
+
+@benchmark("rescore")
+def rescore(args: argparse.Namespace, workdir: str) -> Callable[[], Any]:
+    """
+    Re-scores the clicks of all rounds at once with Rescorer.score.
+    """
+    columns: Columns = Columns.from_records(records(args))
+    return lambda: Rescorer().score(columns)
+
+
+@benchmark("draw_grid")
+def draw_grid(args: argparse.Namespace, workdir: str) -> Iterator[Callable[[], Any]]:
+    """
+    Prepares and draws the grid of every round in a small window, which is closed after the measurement.
+    """
+    win: Any = open_window()
+    try:
+        grid: Any = grid_class()(win)
+        rounds: List[Dict[str, Any]] = records(args, args.plot_rounds)
+        grid_sizes: List[int] = [grid_size(record) for record in rounds]
+
+        def run() -> None:
+            for record, size in zip(rounds, grid_sizes):
+                grid.resize(size)
+                grid.set_highlighted(record["Selected_squares"])
+                grid.draw()
+        yield run
+    finally:
+        win.close()
+
+
+@benchmark("hit_testing")
+def hit_testing(args: argparse.Namespace, workdir: str) -> Callable[[], Any]:
+    """
+    Maps click points to squares with Grid.cell_at, scores them and updates the grid states.
+
+    The grid is laid out without its element array, against a stub window, so no display is needed.
+    """
+    grid: Any = grid_class()(SimpleNamespace(units="height"))
+    rounds: List[Dict[str, Any]] = records(args, args.plot_rounds)
+    rng: np.random.Generator = np.random.default_rng(args.seed)
+    trials: List[Tuple[int, List[Tuple[int, int]], List[Tuple[float, float]], List[float]]] = []
+    for record in rounds:
+        size: int = grid_size(record)
+        pitch: float = grid.square_size + grid.gap
+        offset: float = pitch * (size - 1) / 2
+        cells: np.ndarray = np.array(record["Clicked_positions"], dtype=float).reshape(-1, 2)
+        points: np.ndarray = cells[:, ::-1] * pitch - offset + rng.uniform(-0.06, 0.06, size=cells.shape)
+        trials.append((size, record["Selected_squares"], [tuple(point) for point in points.tolist()],
+                       record["Click_times"]))
+
+    def run() -> None:
+        for size, selected_squares, points, click_times in trials:
+            grid.layout(size)
+            grid.set_highlighted(selected_squares)
+            round_: Round = Round(size, selected_squares)
+            for point, click_time in zip(points, click_times):
+                cell: Optional[Tuple[int, int]] = grid.cell_at(point)
+                state = round_.click(cell, click_time)
+                if state is not None:
+                    grid.set_state(cell, state)
+    return run
+
+
+def measure(function: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Times a function after a warm-up call.
+
+    :param function: The measured function.
+    :param repeat: Number of measured calls.
+    :return: Dictionary with the median and the best time in seconds.
+    """
+    function()
+    times: List[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return {"median [s]": round(statistics.median(times), 6), "min [s]": round(min(times), 6)}
+
+
+def commit() -> Optional[str]:
+    """
+    Returns the current git commit of the repository.
+
+    :return: The commit hash, or None outside a git repository.
+    """
+    try:
+        completed: subprocess.CompletedProcess = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                                                capture_output=True, text=True, check=True,
+                                                                cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compares the median times of the benchmarks with a baseline run.
+
+    :param results: The results of the current run.
+    :param baseline: The results of the baseline run.
+    :param threshold: The largest accepted ratio of the current to the baseline median time.
+    :return: Names of the regressed benchmarks.
+    """
+    regressions: List[str] = []
+    for name, result in results["benchmarks"].items():
+        reference: Optional[Dict[str, Any]] = baseline["benchmarks"].get(name)
+        if not result.get("median [s]") or not reference or not reference.get("median [s]"):
+            continue
+        ratio: float = result["median [s]"] / reference["median [s]"]
+        regressed: bool = ratio > threshold
+        print(f"  {name}: {ratio:.2f}x baseline{' - REGRESSION' if regressed else ''}")
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    """
+    Runs the benchmark suite, saves the results and compares them with the baseline.
+
+    :return: 0 if no benchmark is slower than the baseline by more than the threshold (or the baseline was saved),
+             1 if one is, 2 if there is no baseline run with the same parameters to compare with.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Benchmark suite")
+    parser.add_argument("--rounds", type=int, default=20_000, help="number of rounds saved and parsed")
+    parser.add_argument("--plot-rounds", type=int, default=80, help="number of rounds plotted and drawn")
+    parser.add_argument("--grid-sizes", type=int, nargs=2, default=[3, 8], metavar=("MIN", "MAX"),
+                        help="the smallest and the largest grid size")
+    parser.add_argument("--max-clicks", type=int, default=12, help="the largest number of clicks in a round")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic results")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measured calls of every benchmark")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run only the given benchmarks")
+    parser.add_argument("--results-dir", default=RESULTS_DIR, help="directory of the saved results")
+    parser.add_argument("--baseline", metavar="FILE", help="results to compare with "
+                                                           "(default: baseline.json in the results directory)")
+    parser.add_argument("--save-baseline", action="store_true", help="save the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="the largest accepted ratio of the median time to the baseline")
+    args: argparse.Namespace = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {name: getattr(args, name) for name in PARAMETERS},
+        "repeat": args.repeat,
+        "benchmarks": {},
+    }
+    for name in args.only or BENCHMARKS:
+        with tempfile.TemporaryDirectory() as workdir:
+            try:
+                setup: Any = BENCHMARKS[name](args, workdir)
+                if inspect.isgenerator(setup):
+                    with contextlib.closing(setup):
+                        results["benchmarks"][name] = measure(next(setup), args.repeat)
+                else:
+                    results["benchmarks"][name] = measure(setup, args.repeat)
+            except SkipBenchmark as reason:
+                results["benchmarks"][name] = {"skipped": str(reason)}
+        result: Dict[str, Any] = results["benchmarks"][name]
+        print(f"{name}: " + (f"skipped ({result['skipped']})" if "skipped" in result
+                             else f"{result['median [s]']} s (min {result['min [s]']} s)"))
+
+    if not os.path.exists(args.results_dir):
+        os.makedirs(args.results_dir)
+    filename: str = os.path.join(args.results_dir, f"bench_{datetime.datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(filename, 'w') as file:
+        json.dump(results, file, indent=4)
+    print(f"results saved to: {filename}")
+
+    baseline_file: str = args.baseline or os.path.join(args.results_dir, "baseline.json")
+    if args.save_baseline:
+        with open(baseline_file, 'w') as file:
+            json.dump(results, file, indent=4)
+        print(f"baseline saved to: {baseline_file}")
+        return 0
+    if not os.path.exists(baseline_file):
+        print(f"NOT COMPARED: no baseline {baseline_file}, save one with --save-baseline (make bench-baseline)")
+        return 2
+    with open(baseline_file) as file:
+        baseline: Dict[str, Any] = json.load(file)
+    if baseline["parameters"] != results["parameters"]:
+        print(f"NOT COMPARED: baseline {baseline_file} was run with other parameters {baseline['parameters']}")
+        return 2
+    print(f"compared with baseline {baseline_file} (commit {baseline['commit']}, threshold {args.threshold}x):")
+    return 1 if compare(results, baseline, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+from typing import Any, List, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def synthetic_records(rounds: int, grid_sizes: Tuple[int, int] = (3, 8), max_clicks: int = 12,
+                      stages: int = 4, rounds_per_stage: int = 20, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generates round results in the format recorded by Session.
+
+    Every round gets a random grid size, up to half of its squares highlighted and up to max_clicks distinct
+    clicked squares, part of them on highlighted squares, with increasing click times.
+
+    :param rounds: Number of rounds.
+    :param grid_sizes: The smallest and the largest grid size. Default is (3, 8).
+    :param max_clicks: The largest number of clicks in a round. Default is 12.
+    :param stages: Number of stages in a session. Default is 4.
+    :param rounds_per_stage: Number of rounds per stage. Default is 20.
+    :param seed: Seed of the generated data. Default is 0.
+    :return: List of dictionaries containing the results of every round.
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    grids: np.ndarray = rng.integers(grid_sizes[0], grid_sizes[1] + 1, size=rounds)
+    counts: np.ndarray = np.maximum(1, grids * grids // 2 - rng.integers(0, 3, size=rounds))
+    clicks: np.ndarray = np.minimum(rng.integers(0, max_clicks + 1, size=rounds), grids * grids)
+    offsets: np.ndarray = rng.integers(0, counts + 1)
+    mistakes: np.ndarray = rng.integers(0, 3, size=rounds)
+    intervals: np.ndarray = np.round(rng.lognormal(-0.5, 0.4, size=int(clicks.sum())), 4)
+    time_offsets: np.ndarray = np.concatenate(([0], np.cumsum(clicks)))
+
+    records: List[Dict[str, Any]] = []
+    for idx in range(rounds):
+        grid_size: int = int(grids[idx])
+        cells: np.ndarray = rng.permutation(grid_size * grid_size)
+        selected: np.ndarray = cells[:counts[idx]]
+        clicked: np.ndarray = np.roll(cells, -int(offsets[idx]))[:clicks[idx]]
+        times: np.ndarray = np.round(np.cumsum(intervals[time_offsets[idx]:time_offsets[idx + 1]]), 4)
+        records.append({
+            "Session": idx // (stages * rounds_per_stage) + 1,
+            "Stage": idx // rounds_per_stage % stages + 1,
+            "Round": idx % rounds_per_stage + 1,
+            "Selected_squares": list(zip(*(part.tolist() for part in np.divmod(selected, grid_size)))),
+            "Clicked_positions": list(zip(*(part.tolist() for part in np.divmod(clicked, grid_size)))),
+            "Mistakes_in_stage": int(mistakes[idx]),
+            "Click_times": times.tolist(),
+        })
+    return records
+
+
+def synthetic_frame(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Builds the data frame read from the CSV file of the given results, with the lists as strings.
+
+    :param records: List of dictionaries containing the results of every round.
+    :return: Data frame with the columns of the results CSV file.
+    """
+    return pd.DataFrame({name: [str(record[name]) if isinstance(record[name], list) else record[name]
+                                for record in records] for name in records[0]})
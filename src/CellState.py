@@ -0,0 +1,31 @@
+from typing import List
+
+from enum import IntEnum
+
+
+class CellState(IntEnum):
+    """
+    Enumerator class to store the state of a single grid square.
+    """
+
+    BLANK = 0
+    SELECTED = 1
+    REVEALED = 2
+    HIDDEN = 3
+
+    @classmethod
+    def list_members(cls) -> List["CellState"]:
+        """
+        Return a list of the cell states.
+
+        :return: List of cell states.
+        """
+        return list(cls)
+
+    def __str__(self) -> str:
+        """
+        Return the state name as a string.
+
+        :return: State name as a string.
+        """
+        return self.name
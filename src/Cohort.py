@@ -0,0 +1,186 @@
+from Columns import Columns
+from CohortStats import CohortStats
+
+from typing import List, Dict, Any, Optional, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+import glob
+import os
+
+
+class Cohort(object):
+    """
+    Class to aggregate the results of many sessions and plot them at the group level.
+
+    The result files are streamed in chunks to a pool of worker processes, every worker reduces its chunk
+    to partial aggregates (CohortStats) file by file and the partial aggregates are merged as they arrive,
+    so memory stays bounded no matter how many sessions there are.
+    """
+
+    def __init__(self, files: List[str], name: str = "cohort", chunk_size: int = 16,
+                 workers: Optional[int] = None) -> None:
+        """
+        Initializes the Cohort with the given result files.
+
+        :param files: Paths of the CSV or columnar .npz result files.
+        :param name: The name of the cohort used in the plot filenames. Default is "cohort".
+        :param chunk_size: Number of files aggregated by a worker at once. Default is 16.
+        :param workers: Number of worker processes, or None to use all CPUs.
+        """
+        self.files: List[str] = files
+        self.name: str = name
+        self.chunk_size: int = chunk_size
+        self.workers: Optional[int] = workers
+        self.save_dir: str = "plots"
+        self.stats: Optional[CohortStats] = None
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Cohort object.
+
+        :return: String representation of the Cohort object.
+        """
+        return f"Cohort {self.name} of {len(self.files)} result files."
+
+    @classmethod
+    def from_directory(cls, path: str = "results/", **kwargs: Any) -> "Cohort":
+        """
+        Builds the Cohort from all result files in a directory.
+
+        :param path: The directory with the result files. Default is "results/".
+        :param kwargs: Other arguments of the Cohort.
+        :return: The Cohort.
+        """
+        return cls(cls.result_files(path), **kwargs)
+
+    @staticmethod
+    def result_files(path: str = "results/") -> List[str]:
+        """
+        Lists the result files in a directory, one for every session file:
+        its .npz file if there is one, otherwise its CSV file.
+
+        :param path: The directory with the result files. Default is "results/".
+        :return: Paths of the result files.
+        """
+        files: Dict[str, str] = {}
+        for filename in sorted(glob.glob(os.path.join(path, "*.csv")) + glob.glob(os.path.join(path, "*.npz"))):
+            base, extension = os.path.splitext(filename)
+            if extension == ".npz" or base not in files:
+                files[base] = filename
+        return list(files.values())
+
+    @staticmethod
+    def load(filename: str) -> Columns:
+        """
+        Loads a result file as columns.
+
+        :param filename: The path of the CSV or .npz file.
+        :return: The columnar results.
+        """
+        if filename.endswith(".npz"):
+            return Columns.load(filename, mmap=True)
+        return Columns.from_strings(pd.read_csv(filename))
+
+    @staticmethod
+    def aggregate(files: List[str]) -> CohortStats:
+        """
+        Reduces result files to their aggregates, loading one file at a time.
+
+        Runs in the worker processes.
+
+        :param files: Paths of the result files.
+        :return: The merged aggregates of all sessions in the files.
+        """
+        stats: CohortStats = CohortStats()
+        for filename in files:
+            stats.merge(CohortStats.from_columns(Cohort.load(filename)))
+        return stats
+
+    def _chunks(self) -> Iterator[List[str]]:
+        """
+        Splits the result files into chunks.
+
+        :return: Iterator over the chunks of file paths.
+        """
+        for start in range(0, len(self.files), self.chunk_size):
+            yield self.files[start:start + self.chunk_size]
+
+    def run(self) -> CohortStats:
+        """
+        Aggregates all result files in the worker processes.
+
+        :return: The aggregates of all sessions of the cohort.
+        """
+        stats: CohortStats = CohortStats()
+        if self.workers == 1:
+            for chunk in self._chunks():
+                stats.merge(self.aggregate(chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                for partial in executor.map(Cohort.aggregate, self._chunks()):
+                    stats.merge(partial)
+        self.stats = stats
+        return stats
+
+    def _save_plot(self, fig: plt.Figure, filename: str) -> None:
+        """
+        Saves the given figure to the specified filename.
+
+        :param fig: The figure object to be saved.
+        :param filename: The filename to save the plot.
+        """
+        if not os.path.exists(self.save_dir):
+            os.makedirs(self.save_dir)
+        fig.savefig(os.path.join(self.save_dir, filename))
+        plt.close(fig)
+
+    def plot_average_time_per_square(self) -> None:
+        """
+        Plots the mean and SD over the cohort of the average time per square for each stage and saves the plot.
+        """
+        data: pd.DataFrame = (self.stats or self.run()).learning_curves()
+        stages: np.ndarray = data["Stage"].unique()
+        fig, axs = plt.subplots(2, 2, figsize=(15, 10))
+        axs = axs.flatten()
+        for idx in range(len(axs)):
+            if idx < len(stages):
+                stage: Any = stages[idx]
+                stage_data: pd.DataFrame = data[data["Stage"] == stage]
+                mean: np.ndarray = stage_data["Average_time_per_square"].to_numpy()
+                sd: np.ndarray = stage_data["Average_time_per_square_sd"].to_numpy()
+                axs[idx].plot(stage_data["Round"], mean, marker="o")
+                axs[idx].fill_between(stage_data["Round"], mean - sd, mean + sd, alpha=0.2)
+                axs[idx].set_title(f"Stage {stage} - Average time per square", fontsize=14, fontweight="bold")
+                axs[idx].set_ylabel("Average time per square [s]")
+                axs[idx].set_xlabel("Round [#]")
+                axs[idx].set_ylim(bottom=0)
+                axs[idx].grid(True, which="both", linestyle="-", linewidth=0.2)
+                axs[idx].xaxis.set_major_locator(plt.MaxNLocator(integer=True))
+                axs[idx].set_xticks(np.arange(1, stage_data["Round"].max() + 1))
+            else:
+                axs[idx].set_visible(False)
+        plt.tight_layout()
+        self._save_plot(fig, f"{self.name}_average_time_per_square.png")
+
+    def plot_overall_average_accuracy(self) -> None:
+        """
+        Plots the mean and SD over the cohort of the accuracy per round and saves the plot.
+        """
+        data: pd.DataFrame = (self.stats or self.run()).accuracy_per_round()
+        mean: np.ndarray = data["Accuracy"].to_numpy() * 100
+        sd: np.ndarray = data["Accuracy_sd"].to_numpy() * 100
+        fig, ax = plt.subplots(figsize=(10, 5))
+        ax.plot(data["Round"], mean, marker="o")
+        ax.fill_between(data["Round"], mean - sd, mean + sd, alpha=0.2)
+        ax.set_title("Overall average accuracy per round", fontsize=14, fontweight="bold")
+        ax.set_xlabel("Round [#]")
+        ax.set_ylabel("Average accuracy [%]")
+        ax.set_ylim(0, 110)
+        ax.set_xticks(np.arange(1, data["Round"].max() + 1))
+        ax.set_yticks(np.arange(0, 110, 10))
+        ax.grid(True, which="both", linestyle="-", linewidth=0.2)
+        ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
+        self._save_plot(fig, f"{self.name}_overall_average_accuracy.png")
@@ -0,0 +1,201 @@
+from Columns import Columns
+from Plotter import Plotter
+from Rescorer import Rescorer
+
+from typing import List, Tuple, Dict, Any
+
+import numpy as np
+import pandas as pd
+
+
+class CohortStats(object):
+    """
+    Class for the partial aggregates of the results of many sessions.
+
+    Only counts, sums and histograms are kept, indexed by stage and round, so the size of the aggregates
+    does not depend on the number of sessions and two aggregates are merged by adding them.
+    """
+
+    CLICK_TIME_BINS: np.ndarray = np.linspace(0.0, 10.0, 201)
+
+    def __init__(self) -> None:
+        """
+        Initializes empty aggregates.
+        """
+        self.sessions: int = 0
+        self.rounds: int = 0
+        self.round_counts: np.ndarray = np.zeros((0, 0), dtype=np.int64)
+        self.time_counts: np.ndarray = np.zeros((0, 0), dtype=np.int64)
+        self.time_sums: np.ndarray = np.zeros((0, 0))
+        self.time_squares: np.ndarray = np.zeros((0, 0))
+        self.accuracy_sums: np.ndarray = np.zeros((0, 0))
+        self.accuracy_squares: np.ndarray = np.zeros((0, 0))
+        self.span_counts: np.ndarray = np.zeros((0, 0), dtype=np.int64)
+        self.click_time_counts: np.ndarray = np.zeros(len(self.CLICK_TIME_BINS), dtype=np.int64)
+        self.click_time_sum: float = 0.0
+        self.click_time_square: float = 0.0
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the CohortStats object.
+
+        :return: String representation of the CohortStats object.
+        """
+        return f"CohortStats of {self.sessions} sessions and {self.rounds} rounds."
+
+    @classmethod
+    def from_columns(cls, columns: Columns) -> "CohortStats":
+        """
+        Computes the aggregates of the sessions in one result file.
+
+        The span of a session in a stage is the largest number of squares recalled correctly
+        (a correct round as scored by Rescorer), 0 if no round was correct. Repeated clicks on a square
+        and clicks after a round finished are not scored, so for logs containing them (e.g. from versions
+        which logged every click) the accuracy and the spans can differ from the raw counts of all clicks.
+
+        :param columns: The columnar results of one or more sessions.
+        :return: The aggregates of the sessions.
+        """
+        stats: CohortStats = cls()
+        if len(columns) == 0:
+            return stats
+
+        stages: np.ndarray = np.asarray(columns["Stage"], dtype=np.int64) - 1
+        rounds: np.ndarray = np.asarray(columns["Round"], dtype=np.int64) - 1
+        average_time, accuracy, _ = Plotter._compute_metrics(columns)
+        shape: Tuple[int, int] = (int(stages.max()) + 1, int(rounds.max()) + 1)
+        cells: np.ndarray = np.ravel_multi_index((stages, rounds), shape)
+        timed: np.ndarray = ~np.isnan(average_time)
+
+        def per_cell(weights: Any = None, where: Any = slice(None)) -> np.ndarray:
+            return np.bincount(cells[where], weights=None if weights is None else weights[where],
+                               minlength=shape[0] * shape[1]).reshape(shape)
+
+        stats.rounds = len(columns)
+        stats.round_counts = per_cell().astype(np.int64)
+        stats.time_counts = per_cell(where=timed).astype(np.int64)
+        stats.time_sums = per_cell(average_time, timed)
+        stats.time_squares = per_cell(average_time ** 2, timed)
+        stats.accuracy_sums = per_cell(accuracy)
+        stats.accuracy_squares = per_cell(accuracy ** 2)
+
+        recalled: np.ndarray = np.where(Rescorer().score(columns)["Correct"], columns.lengths("Selected_squares"), 0)
+        sessions, session_ids = np.unique(np.asarray(columns["Session"]), return_inverse=True)
+        session_stages: np.ndarray = session_ids * shape[0] + stages
+        spans: np.ndarray = np.zeros(len(sessions) * shape[0], dtype=np.int64)
+        np.maximum.at(spans, session_stages, recalled)
+        played: np.ndarray = np.unique(session_stages)
+        span_range: int = int(spans.max()) + 1
+        stats.sessions = len(sessions)
+        stats.span_counts = np.bincount((played % shape[0]) * span_range + spans[played],
+                                        minlength=shape[0] * span_range).reshape(shape[0], span_range)
+
+        times: np.ndarray = np.abs(np.asarray(columns["Click_times"]))
+        bins: np.ndarray = np.minimum(np.searchsorted(cls.CLICK_TIME_BINS, times, side="right") - 1,
+                                      len(cls.CLICK_TIME_BINS) - 1)
+        stats.click_time_counts = np.bincount(bins, minlength=len(cls.CLICK_TIME_BINS))
+        stats.click_time_sum = float(times.sum())
+        stats.click_time_square = float((times ** 2).sum())
+        return stats
+
+    def merge(self, other: "CohortStats") -> "CohortStats":
+        """
+        Adds the aggregates of other sessions to these aggregates.
+
+        :param other: The aggregates of the other sessions.
+        :return: These aggregates.
+        """
+        def add(ours: np.ndarray, theirs: np.ndarray) -> np.ndarray:
+            shape: Tuple[int, ...] = tuple(np.maximum(ours.shape, theirs.shape))
+            total: np.ndarray = np.zeros(shape, dtype=np.result_type(ours, theirs))
+            total[tuple(slice(0, size) for size in ours.shape)] += ours
+            total[tuple(slice(0, size) for size in theirs.shape)] += theirs
+            return total
+
+        self.sessions += other.sessions
+        self.rounds += other.rounds
+        for name in ("round_counts", "time_counts", "time_sums", "time_squares",
+                     "accuracy_sums", "accuracy_squares", "span_counts"):
+            setattr(self, name, add(getattr(self, name), getattr(other, name)))
+        self.click_time_counts = self.click_time_counts + other.click_time_counts
+        self.click_time_sum += other.click_time_sum
+        self.click_time_square += other.click_time_square
+        return self
+
+    @staticmethod
+    def _mean_and_sd(counts: np.ndarray, sums: np.ndarray, squares: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes means and standard deviations from counts, sums and sums of squares.
+
+        :param counts: Number of values.
+        :param sums: Sum of the values.
+        :param squares: Sum of the squared values.
+        :return: Tuple of the means and standard deviations, NaN where there are no values.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean: np.ndarray = sums / counts
+            sd: np.ndarray = np.sqrt(np.maximum(squares / counts - mean ** 2, 0.0))
+        return mean, sd
+
+    def learning_curves(self) -> pd.DataFrame:
+        """
+        Returns the average time per square and the accuracy of every round of every stage.
+
+        :return: Data frame with one row per stage and round played by any session.
+        """
+        stages, rounds = np.nonzero(self.round_counts)
+        time_mean, time_sd = self._mean_and_sd(self.time_counts, self.time_sums, self.time_squares)
+        accuracy_mean, accuracy_sd = self._mean_and_sd(self.round_counts, self.accuracy_sums, self.accuracy_squares)
+        return pd.DataFrame({
+            "Stage": stages + 1,
+            "Round": rounds + 1,
+            "Sessions": self.round_counts[stages, rounds],
+            "Average_time_per_square": time_mean[stages, rounds],
+            "Average_time_per_square_sd": time_sd[stages, rounds],
+            "Accuracy": accuracy_mean[stages, rounds],
+            "Accuracy_sd": accuracy_sd[stages, rounds],
+        })
+
+    def accuracy_per_round(self) -> pd.DataFrame:
+        """
+        Returns the accuracy of every round over all stages, weighted by the number of rounds played.
+
+        :return: Data frame with one row per round.
+        """
+        rounds: np.ndarray = np.flatnonzero(self.round_counts.sum(axis=0))
+        mean, sd = self._mean_and_sd(self.round_counts.sum(axis=0), self.accuracy_sums.sum(axis=0),
+                                     self.accuracy_squares.sum(axis=0))
+        return pd.DataFrame({"Round": rounds + 1, "Sessions": self.round_counts.sum(axis=0)[rounds],
+                             "Accuracy": mean[rounds], "Accuracy_sd": sd[rounds]})
+
+    def span_per_stage(self) -> pd.DataFrame:
+        """
+        Returns the distribution of the span of the sessions in every stage.
+
+        :return: Data frame with one row per stage, with the number of sessions, mean, SD and maximum span.
+        """
+        spans: np.ndarray = np.arange(self.span_counts.shape[1])
+        counts: np.ndarray = self.span_counts.sum(axis=1)
+        stages: np.ndarray = np.flatnonzero(counts)
+        mean, sd = self._mean_and_sd(counts, self.span_counts @ spans, self.span_counts @ spans ** 2)
+        maximum: np.ndarray = np.array([spans[row > 0].max() for row in self.span_counts[stages]], dtype=np.int64)
+        return pd.DataFrame({"Stage": stages + 1, "Sessions": counts[stages], "Span": mean[stages],
+                             "Span_sd": sd[stages], "Span_max": maximum})
+
+    def click_time_distribution(self) -> Dict[str, Any]:
+        """
+        Returns the distribution of the click times of all rounds.
+
+        :return: Dictionary with the number, mean and SD of the click times and a histogram
+                 (the last bin counts all times above the last edge).
+        """
+        count: int = int(self.click_time_counts.sum())
+        mean, sd = self._mean_and_sd(np.array(count), np.array(self.click_time_sum),
+                                     np.array(self.click_time_square))
+        edges: List[float] = self.CLICK_TIME_BINS.tolist()
+        return {
+            "count": count,
+            "mean": float(mean),
+            "sd": float(sd),
+            "histogram": {"edges": edges, "counts": self.click_time_counts.tolist()},
+        }
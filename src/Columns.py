@@ -0,0 +1,226 @@
+from typing import List, Tuple, Dict, Any, Sequence
+
+import zipfile
+import warnings
+import numpy as np
+
+
+class Columns(object):
+    """
+    Class to hold round results as typed columns.
+
+    Scalar columns are one value per round. Ragged columns (selected squares, clicked positions and click times)
+    are stored as one flat array of values plus an offsets array of length rounds + 1,
+    the values of round i being values[offsets[i]:offsets[i + 1]].
+    """
+
+    SCALAR_COLUMNS: Tuple[str, ...] = ("Session", "Stage", "Round", "Mistakes_in_stage")
+    POSITION_COLUMNS: Tuple[str, ...] = ("Selected_squares", "Clicked_positions")
+    TIME_COLUMNS: Tuple[str, ...] = ("Click_times",)
+    _SEPARATORS: bytes = bytes.maketrans(b"[](),\n", b"      ")
+
+    def __init__(self, arrays: Dict[str, np.ndarray]) -> None:
+        """
+        Initializes the Columns with the given arrays.
+
+        :param arrays: Dictionary with an array for every scalar column,
+                       and a values and an "_offsets" array for every ragged column.
+        """
+        self.arrays: Dict[str, np.ndarray] = arrays
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Columns object.
+
+        :return: String representation of the Columns object.
+        """
+        return f"Columns with {len(self)} rounds."
+
+    def __len__(self) -> int:
+        """
+        Return the number of rounds.
+
+        :return: Number of rounds.
+        """
+        return len(self.arrays["Round"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """
+        Return the array of a column.
+
+        :param name: The name of the column, with the "_offsets" suffix for the offsets of a ragged column.
+        :return: The array of the column.
+        """
+        return self.arrays[name]
+
+    @classmethod
+    def from_records(cls, results_list: List[Dict[str, Any]]) -> "Columns":
+        """
+        Builds the columns from a list of round results.
+
+        :param results_list: List of dictionaries containing the results of every round.
+        :return: The built Columns.
+        """
+        arrays: Dict[str, np.ndarray] = {}
+        for name in cls.SCALAR_COLUMNS:
+            arrays[name] = np.fromiter((result[name] for result in results_list), dtype=np.int32,
+                                       count=len(results_list))
+        for name in cls.POSITION_COLUMNS + cls.TIME_COLUMNS:
+            lengths: np.ndarray = np.fromiter((len(result[name]) for result in results_list), dtype=np.int64,
+                                              count=len(results_list))
+            offsets: np.ndarray = np.zeros(len(results_list) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            if name in cls.POSITION_COLUMNS:
+                values: np.ndarray = np.fromiter((coordinate for result in results_list
+                                                  for pos in result[name] for coordinate in pos),
+                                                 dtype=np.int16, count=2 * int(offsets[-1])).reshape(-1, 2)
+            else:
+                values = np.fromiter((time for result in results_list for time in result[name]),
+                                     dtype=np.float64, count=int(offsets[-1]))
+            arrays[name] = values
+            arrays[f"{name}_offsets"] = offsets
+        return cls(arrays)
+
+    @classmethod
+    def from_strings(cls, data: Any) -> "Columns":
+        """
+        Builds the columns from result files in which the ragged columns are stringified lists,
+        e.g. "[(0, 1), (2, 2)]" and "[0.51, 1.2]" as written to CSV.
+
+        Every ragged column is decoded once for all rounds into flat values with offsets.
+        Nothing is evaluated, text other than numbers raises ValueError.
+
+        :param data: DataFrame or mapping with a sequence for every column.
+        :return: The built Columns.
+        """
+        arrays: Dict[str, np.ndarray] = {name: np.asarray(data[name], dtype=np.int32) for name in cls.SCALAR_COLUMNS}
+        for name in cls.POSITION_COLUMNS + cls.TIME_COLUMNS:
+            strings: Any = data[name]
+            if hasattr(strings, "fillna"):
+                strings = strings.fillna("[]")
+            if name in cls.POSITION_COLUMNS:
+                values, offsets = cls._parse_ragged(strings, 2, np.int64)
+                arrays[name] = values.astype(np.int16).reshape(-1, 2)
+            else:
+                arrays[name], offsets = cls._parse_ragged(strings, 1, np.float64)
+            arrays[f"{name}_offsets"] = offsets
+        return cls(arrays)
+
+    @classmethod
+    def _parse_ragged(cls, strings: Sequence[str], per_item: int, dtype: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parses stringified lists of numbers or number tuples.
+
+        The number of items in a round follows from its commas ("[]" is empty), the numbers of all rounds
+        are parsed at once and their total is checked against the counted items.
+
+        :param strings: One string per round.
+        :param per_item: Number of numbers in every item (2 for positions, 1 for times).
+        :param dtype: The type of the parsed numbers.
+        :return: Tuple of the flat values and the offsets of every round.
+        """
+        strings = strings.tolist() if hasattr(strings, "tolist") else [str(string) for string in strings]
+        lengths: np.ndarray = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+        starts: np.ndarray = np.zeros(len(strings), dtype=np.int64)
+        np.cumsum(lengths[:-1] + 1, out=starts[1:])
+        joined: bytes = "\n".join(strings).encode("ascii") + b"\n"
+        chars: np.ndarray = np.frombuffer(joined, dtype=np.uint8)
+        commas: np.ndarray = np.add.reduceat(chars == ord(","), starts, dtype=np.int64) if len(strings) else starts
+        numbers: np.ndarray = np.where(lengths > 2, commas + 1, 0)
+        offsets: np.ndarray = np.zeros(len(strings) + 1, dtype=np.int64)
+        np.cumsum(numbers // per_item, out=offsets[1:])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            values: np.ndarray = np.fromstring(joined.translate(cls._SEPARATORS).decode("ascii"),
+                                               dtype=dtype, sep=" ")
+        if len(values) != numbers.sum() or np.any(numbers % per_item):
+            raise ValueError("Malformed list column: expected only numbers separated by commas.")
+        return values, offsets
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Converts the columns back to a list of round results.
+
+        :return: List of dictionaries containing the results of every round, positions as tuples.
+        """
+        scalars: Dict[str, List[int]] = {name: self.arrays[name].tolist() for name in self.SCALAR_COLUMNS}
+        ragged: Dict[str, List[Any]] = {}
+        for name in self.POSITION_COLUMNS + self.TIME_COLUMNS:
+            values: List[Any] = self.arrays[name].tolist()
+            if name in self.POSITION_COLUMNS:
+                values = [tuple(pos) for pos in values]
+            offsets: List[int] = self.arrays[f"{name}_offsets"].tolist()
+            ragged[name] = [values[offsets[i]:offsets[i + 1]] for i in range(len(self))]
+        return [{"Session": scalars["Session"][i], "Stage": scalars["Stage"][i], "Round": scalars["Round"][i],
+                 "Selected_squares": ragged["Selected_squares"][i],
+                 "Clicked_positions": ragged["Clicked_positions"][i],
+                 "Mistakes_in_stage": scalars["Mistakes_in_stage"][i],
+                 "Click_times": ragged["Click_times"][i]} for i in range(len(self))]
+
+    def lengths(self, name: str) -> np.ndarray:
+        """
+        Returns the number of values of a ragged column in every round.
+
+        :param name: The name of the ragged column.
+        :return: Array of lengths, one per round.
+        """
+        return np.diff(self.arrays[f"{name}_offsets"])
+
+    def row_ids(self, name: str) -> np.ndarray:
+        """
+        Returns the round index of every value of a ragged column.
+
+        :param name: The name of the ragged column.
+        :return: Array of round indices, one per value.
+        """
+        return np.repeat(np.arange(len(self)), self.lengths(name))
+
+    def save(self, filename: str) -> None:
+        """
+        Saves the columns to an uncompressed NumPy .npz file, which can be loaded without parsing.
+
+        :param filename: The path of the file (with the .npz extension).
+        :return: None
+        """
+        np.savez(filename, **self.arrays)
+
+    @classmethod
+    def load(cls, filename: str, mmap: bool = False) -> "Columns":
+        """
+        Loads columns saved with save.
+
+        :param filename: The path of the file (with the .npz extension).
+        :param mmap: Boolean indicating whether to memory-map the arrays instead of reading them. Default is False.
+        :return: The loaded Columns.
+        """
+        if not mmap:
+            with np.load(filename) as data:
+                return cls({name: data[name] for name in data.files})
+        arrays: Dict[str, np.ndarray] = {}
+        with zipfile.ZipFile(filename) as archive, open(filename, "rb") as file:
+            for info in archive.infolist():
+                arrays[info.filename[:-len(".npy")]] = cls._memmap_member(filename, file, info)
+        return cls(arrays)
+
+    @staticmethod
+    def _memmap_member(filename: str, file: Any, info: zipfile.ZipInfo) -> np.ndarray:
+        """
+        Memory-maps a single array stored uncompressed in an .npz file.
+
+        :param filename: The path of the .npz file.
+        :param file: The .npz file opened for binary reading.
+        :param info: The zip entry of the array.
+        :return: The memory-mapped array.
+        """
+        file.seek(info.header_offset + 26)
+        name_length, extra_length = np.frombuffer(file.read(4), dtype="<u2")
+        file.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+        version: Tuple[int, int] = np.lib.format.read_magic(file)
+        read_header: Any = np.lib.format.read_array_header_1_0 if version == (1, 0) \
+            else np.lib.format.read_array_header_2_0
+        shape, fortran_order, dtype = read_header(file)
+        if len(shape) == 0 or 0 in shape:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(filename, dtype=dtype, mode="r", offset=file.tell(), shape=shape,
+                         order="F" if fortran_order else "C")
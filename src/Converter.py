@@ -1,26 +1,44 @@
-from typing import List, Dict, Any
+from Writer import Writer
+from Columns import Columns
+from SessionStore import SessionStore
+from RoundRecords import RoundRecords
+
+from typing import List, Dict, Any, Iterable, Optional, Sequence, TYPE_CHECKING
+from threading import Thread
+from queue import Queue
 
-import pandas as pd
 import json
-import os
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Converter(object):
     """
     Class to convert and save results data to different file formats.
+
+    The formats are provided by the writers registered with Writer.register,
+    all requested files are written in a single pass over the results.
     """
 
-    def __init__(self, results_list: List[Dict[str, Any]], filename: str) -> None:
+    DEFAULT_FORMATS: Sequence[str] = ("csv", "txt", "json")
+    _END: object = object()
+
+    def __init__(self, results_list: Iterable[Dict[str, Any]], filename: str, compact_json: bool = False) -> None:
         """
         Initialize the Converter with a list of results and a filename.
 
-        :param results_list: List of dictionaries containing the results data.
+        :param results_list: List of dictionaries containing the results data. Any iterable is accepted,
+                             a one-shot iterator (e.g. Journal.read) can be saved only once.
+                             RoundRecords are written to .npz files directly from their buffers.
         :param filename: The base name of the file to save the data (without extension).
+        :param compact_json: Boolean indicating whether to write JSON without indentation. Default is False.
         :return: None
         """
         self.results_list = results_list
-        self.results_df = pd.DataFrame(results_list)
         self.filename = filename
+        self.compact_json = compact_json
+        self._results_df: Optional["pd.DataFrame"] = None
 
     def __str__(self) -> str:
         """
@@ -30,6 +48,95 @@ class Converter(object):
         """
         return f"Converter with results for: {self.filename}"
 
+    @property
+    def results_df(self) -> "pd.DataFrame":
+        """
+        Return the results data as a DataFrame, built on first use.
+
+        :return: DataFrame with one row per round.
+        """
+        if self._results_df is None:
+            import pandas as pd
+
+            self._results_df = pd.DataFrame(list(self.results_list))
+        return self._results_df
+
+    def save(self, formats: Sequence[str] = DEFAULT_FORMATS, concurrent: bool = True) -> None:
+        """
+        Save the results data to files in the given formats.
+
+        Every result is read once and handed to all writers. With several formats each writer runs
+        in its own thread, fed through a bounded queue. Every file is written to a temporary file first
+        and renamed when complete, if any writer fails no file is replaced.
+
+        :param formats: Names of the registered formats, e.g. ("csv", "json"). Default is CSV, TXT and JSON.
+        :param concurrent: Boolean indicating whether to run the writers in separate threads. Default is True.
+        :return: None
+        """
+        writers: List[Writer] = [Writer.registry[name](self.filename, compact_json=self.compact_json)
+                                 for name in formats]
+        try:
+            for writer in writers:
+                writer.open()
+            row_writers: List[Writer] = writers
+            if isinstance(self.results_list, RoundRecords):
+                columns: Columns = self.results_list.columns()
+                row_writers = [writer for writer in writers if not writer.write_columns(columns)]
+            if concurrent and len(row_writers) > 1:
+                self._save_concurrently(row_writers)
+            elif row_writers:
+                for record in self.results_list:
+                    for writer in row_writers:
+                        writer.write(record)
+            for writer in writers:
+                writer.finish()
+        except BaseException:
+            for writer in writers:
+                writer.abort()
+            raise
+        for writer in writers:
+            writer.commit()
+
+    def _save_concurrently(self, writers: List[Writer]) -> None:
+        """
+        Feed the results to the writers running in separate threads.
+
+        :param writers: The opened writers.
+        :return: None
+        """
+        queues: List[Queue] = [Queue(maxsize=256) for _ in writers]
+        errors: List[BaseException] = []
+
+        def consume(writer: Writer, queue: Queue) -> None:
+            failed: bool = False
+            while True:
+                record: Any = queue.get()
+                if record is self._END:
+                    return
+                if failed:
+                    continue
+                try:
+                    writer.write(record)
+                except BaseException as error:
+                    errors.append(error)
+                    failed = True
+
+        threads: List[Thread] = [Thread(target=consume, args=(writer, queue), daemon=True)
+                                 for writer, queue in zip(writers, queues)]
+        for thread in threads:
+            thread.start()
+        try:
+            for record in self.results_list:
+                for queue in queues:
+                    queue.put(record)
+        finally:
+            for queue in queues:
+                queue.put(self._END)
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+
     def save_to_csv(self) -> None:
         """
         Save the results data to a CSV file.
@@ -38,7 +145,7 @@ class Converter(object):
 
         :return: None
         """
-        self.results_df.to_csv(f"{self.filename}.csv", index=False)
+        self.save(("csv",))
 
     def save_to_txt(self) -> None:
         """
@@ -49,16 +156,7 @@ class Converter(object):
 
         :return: None
         """
-        with open(f"{self.filename}.txt", 'w') as file:
-            for result in self.results_list:
-                file.write(f"Session: {result['Session']}\n")
-                file.write(f"Stage: {result['Stage']}\n")
-                file.write(f"Round: {result['Round']}\n")
-                file.write(f"Selected_squares: {result['Selected_squares']}\n")
-                file.write(f"Clicked_positions: {result['Clicked_positions']}\n")
-                file.write(f"Mistakes_in_stage: {result['Mistakes_in_stage']}\n")
-                file.write(f"Click_times: {result['Click_times']}\n")
-                file.write("\n")
+        self.save(("txt",))
 
     def save_to_json(self) -> None:
         """
@@ -68,5 +166,41 @@ class Converter(object):
 
         :return: None
         """
-        with open(f"{self.filename}.json", 'w') as file:
-            json.dump(self.results_list, file, indent=4)
+        self.save(("json",))
+
+    def save_to_npz(self) -> None:
+        """
+        Save the results data to a typed columnar NumPy file.
+
+        The file will be named with the provided filename and a .npz extension.
+        Positions and click times are stored as flat arrays with offsets instead of strings,
+        so the file can be loaded (and memory-mapped) with Columns.load without parsing.
+
+        :return: None
+        """
+        self.save(("npz",))
+
+    def save_to_store(self, path: str) -> None:
+        """
+        Insert the results data into the session store in a single transaction.
+
+        :param path: The path of the session store database.
+        :return: None
+        """
+        store: SessionStore = SessionStore(path)
+        try:
+            store.insert(self.results_list)
+        finally:
+            store.close()
+
+    def save_timing_to_json(self, timing: Dict[str, Any]) -> None:
+        """
+        Save the frame timing summary of the session to a JSON file.
+
+        The file will be named with the provided filename and a _timing.json suffix.
+
+        :param timing: Dictionary with the timing summary.
+        :return: None
+        """
+        with open(f"{self.filename}_timing.json", 'w') as file:
+            json.dump(timing, file, indent=4)
@@ -0,0 +1,325 @@
+from Round import Round
+from Schedule import Schedule
+
+from typing import List, Tuple, Dict, Any, Type, Callable, Optional
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class DifficultyScheduler(ABC):
+    """
+    Base class of the difficulty schedulers deciding the number of highlighted squares and the grid size
+    of every round of a stage, and when the stage ends.
+
+    The scheduler sees the outcome of every round, including rounds replayed from a journal,
+    so its decisions are restored exactly when an interrupted session is resumed.
+    Subclasses are registered under a name with DifficultyScheduler.register.
+    The scheduler also supplies the instruction lines explaining its rules, and the number of failed rounds
+    ending a stage (MAX_MISTAKES, None if failed rounds do not end it) shown as chances before every round.
+    """
+
+    registry: Dict[str, Type["DifficultyScheduler"]] = {}
+    MAX_MISTAKES: Optional[int] = None
+    RULES: Tuple[str, ...] = ()
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the DifficultyScheduler object.
+
+        :return: String representation of the DifficultyScheduler object.
+        """
+        return f"{self.__class__.__name__} with span estimate: {self.span()}"
+
+    @classmethod
+    def register(cls, name: str) -> Callable[[Type["DifficultyScheduler"]], Type["DifficultyScheduler"]]:
+        """
+        Class decorator registering a scheduler under a name.
+
+        :param name: The name of the scheduler, e.g. "step".
+        :return: The decorator.
+        """
+        def decorator(scheduler_class: Type["DifficultyScheduler"]) -> Type["DifficultyScheduler"]:
+            cls.registry[name] = scheduler_class
+            return scheduler_class
+        return decorator
+
+    @classmethod
+    def create(cls, name: str, **options: Any) -> "DifficultyScheduler":
+        """
+        Creates a registered scheduler.
+
+        :param name: The name of the scheduler.
+        :param options: Arguments of the scheduler.
+        :return: The created scheduler.
+        """
+        if name not in cls.registry:
+            raise ValueError(f"Unknown difficulty scheduler: {name} (available: {', '.join(cls.registry)}).")
+        return cls.registry[name](**options)
+
+    @abstractmethod
+    def max_squares(self, rounds_per_stage: int) -> int:
+        """
+        Returns the largest number of highlighted squares the scheduler can reach in a stage,
+        which the Schedule has to cover.
+
+        :param rounds_per_stage: Number of rounds per stage.
+        :return: The largest number of highlighted squares.
+        """
+
+    def max_grid_size(self, rounds_per_stage: int) -> int:
+        """
+        Returns the largest grid size the scheduler can reach in a stage.
+
+        :param rounds_per_stage: Number of rounds per stage.
+        :return: The largest grid size.
+        """
+        return Schedule.max_grid_size_for(self.max_squares(rounds_per_stage))
+
+    @abstractmethod
+    def start_stage(self, stage_number: int) -> None:
+        """
+        Resets the scheduler for a new stage.
+
+        :param stage_number: The stage number.
+        :return: None
+        """
+
+    @abstractmethod
+    def next_round(self) -> Tuple[int, int]:
+        """
+        Decides the difficulty of the next round.
+
+        :return: Tuple of the grid size and the number of highlighted squares.
+        """
+
+    @abstractmethod
+    def update(self, round_: Round) -> None:
+        """
+        Updates the scheduler with the outcome of the last round.
+
+        :param round_: The played (or replayed) round.
+        :return: None
+        """
+
+    def finished(self, mistakes_in_stage: int) -> bool:
+        """
+        Decides whether the stage ends before its last round.
+
+        :param mistakes_in_stage: The number of failed rounds in the stage.
+        :return: True if the stage ends.
+        """
+        return False
+
+    def span(self) -> Optional[float]:
+        """
+        Returns the estimate of the span of the participant in the current stage.
+
+        :return: The largest number of squares recalled, or None if there is no estimate yet.
+        """
+        return None
+
+    def chances_text(self, mistakes_in_stage: int) -> Optional[str]:
+        """
+        Returns the text of the chances left in the stage, shown before every round.
+
+        :param mistakes_in_stage: The number of failed rounds in the stage.
+        :return: The text, or None if failed rounds do not end the stage.
+        """
+        if self.MAX_MISTAKES is None:
+            return None
+        return f"Szanse: {self.MAX_MISTAKES - mistakes_in_stage}/{self.MAX_MISTAKES}"
+
+
+@DifficultyScheduler.register("step")
+class StepScheduler(DifficultyScheduler):
+    """
+    The default difficulty rule: a stage starts with 3 squares on a 3x3 grid, every correct round adds a square,
+    the grid grows by one when the squares fill half of it and the stage ends after 3 failed rounds.
+    """
+
+    START_SQUARES: int = 3
+    MAX_MISTAKES: int = 3
+    RULES: Tuple[str, ...] = (
+        f"Każda przerwana runda zmniejsza liczbę szans o 1. Po {MAX_MISTAKES} błędach etap zostanie przerwany.",
+        "W przypadku wskazania wszystkich poprawnych pól, przejdziesz do kolejnej rundy, "
+        "gdzie liczba żółtych kwadratów wzrośnie o jeden.",
+        "Rozmiar planszy będzie się stopniowo zwiększał wraz ze wzrostem liczby żółtych kwadratów "
+        "w kolejnych rundach.",
+    )
+
+    def __init__(self) -> None:
+        """
+        Initializes the StepScheduler.
+        """
+        self.grid_size: int = Schedule.MIN_GRID_SIZE
+        self.selected_squares_count: int = self.START_SQUARES
+        self.best: Optional[int] = None
+
+    def max_squares(self, rounds_per_stage: int) -> int:
+        """
+        Returns the number of squares reached when every round of a stage is correct.
+
+        :param rounds_per_stage: Number of rounds per stage.
+        :return: The largest number of highlighted squares.
+        """
+        return self.START_SQUARES + rounds_per_stage - 1
+
+    def start_stage(self, stage_number: int) -> None:
+        """
+        Starts the stage with 3 squares on a 3x3 grid.
+
+        :param stage_number: The stage number.
+        :return: None
+        """
+        self.grid_size = Schedule.MIN_GRID_SIZE
+        self.selected_squares_count = self.START_SQUARES
+        self.best = None
+
+    def next_round(self) -> Tuple[int, int]:
+        """
+        Grows the grid by one if the squares fill half of it.
+
+        :return: Tuple of the grid size and the number of highlighted squares.
+        """
+        if self.selected_squares_count >= (self.grid_size * self.grid_size) / 2:
+            self.grid_size += 1
+        return self.grid_size, self.selected_squares_count
+
+    def update(self, round_: Round) -> None:
+        """
+        Adds a square after a correct round.
+
+        :param round_: The played (or replayed) round.
+        :return: None
+        """
+        if round_.correct:
+            self.best = self.selected_squares_count
+            self.selected_squares_count += 1
+
+    def finished(self, mistakes_in_stage: int) -> bool:
+        """
+        Ends the stage after 3 failed rounds.
+
+        :param mistakes_in_stage: The number of failed rounds in the stage.
+        :return: True if the stage ends.
+        """
+        return mistakes_in_stage == self.MAX_MISTAKES
+
+    def span(self) -> Optional[float]:
+        """
+        Returns the number of squares of the last correct round of the stage.
+
+        :return: The span, or None if no round was correct.
+        """
+        return None if self.best is None else float(self.best)
+
+
+@DifficultyScheduler.register("staircase")
+class StaircaseScheduler(DifficultyScheduler):
+    """
+    Adaptive 1-up/1-down staircase on the number of highlighted squares.
+
+    A correct round adds `step` squares, a failed round removes them, and the step is halved at every
+    reversal of the direction, so the count quickly closes in on the span of the participant and then
+    oscillates around it. The span is estimated as the mean count at the last reversals and the stage ends
+    early once these counts are stable. The grid is the smallest one the squares fill less than half of.
+    """
+
+    RULES: Tuple[str, ...] = (
+        "Po poprawnej rundzie liczba żółtych kwadratów wzrośnie, a po przerwanej zmaleje. "
+        "Zmiany liczby kwadratów będą stopniowo coraz mniejsze.",
+        "Rozmiar planszy będzie dopasowany do liczby żółtych kwadratów.",
+        "Etap może zakończyć się wcześniej, gdy liczba kwadratów ustabilizuje się.",
+    )
+
+    def __init__(self, start: int = 3, step: int = 3, min_squares: int = 2, max_squares: int = 20,
+                 estimate_reversals: int = 3, tolerance: float = 1.0, max_reversals: int = 8) -> None:
+        """
+        Initializes the StaircaseScheduler.
+
+        :param start: Number of squares in the first round of a stage. Default is 3.
+        :param step: Initial change of the number of squares. Default is 3.
+        :param min_squares: The smallest number of squares. Default is 2.
+        :param max_squares: The largest number of squares. Default is 20.
+        :param estimate_reversals: Number of last reversals the span is estimated from. Default is 3.
+        :param tolerance: The largest SD of the counts at the last reversals of a stable estimate. Default is 1.0.
+        :param max_reversals: Number of reversals after which the stage ends in any case. Default is 8.
+        """
+        self.start: int = start
+        self.initial_step: int = step
+        self.min_squares: int = min_squares
+        self.max_squares_count: int = max_squares
+        self.estimate_reversals: int = estimate_reversals
+        self.tolerance: float = tolerance
+        self.max_reversals: int = max_reversals
+        self.selected_squares_count: int = start
+        self.step: int = step
+        self.direction: int = 0
+        self.reversals: List[int] = []
+
+    def max_squares(self, rounds_per_stage: int) -> int:
+        """
+        Returns the number of squares reached when every round of a stage is correct, at most max_squares.
+
+        :param rounds_per_stage: Number of rounds per stage.
+        :return: The largest number of highlighted squares.
+        """
+        return min(self.max_squares_count, self.start + self.initial_step * (rounds_per_stage - 1))
+
+    def start_stage(self, stage_number: int) -> None:
+        """
+        Starts the stage at the initial number of squares and step.
+
+        :param stage_number: The stage number.
+        :return: None
+        """
+        self.selected_squares_count = self.start
+        self.step = self.initial_step
+        self.direction = 0
+        self.reversals = []
+
+    def next_round(self) -> Tuple[int, int]:
+        """
+        Returns the current number of squares on the smallest grid they fill less than half of.
+
+        :return: Tuple of the grid size and the number of highlighted squares.
+        """
+        return Schedule.max_grid_size_for(self.selected_squares_count), self.selected_squares_count
+
+    def update(self, round_: Round) -> None:
+        """
+        Moves the number of squares up after a correct round and down otherwise, halving the step at reversals.
+
+        :param round_: The played (or replayed) round.
+        :return: None
+        """
+        direction: int = 1 if round_.correct else -1
+        if self.direction and direction != self.direction:
+            self.reversals.append(self.selected_squares_count)
+            self.step = max(1, self.step // 2)
+        self.direction = direction
+        self.selected_squares_count = int(np.clip(self.selected_squares_count + direction * self.step,
+                                                  self.min_squares, self.max_squares_count))
+
+    def finished(self, mistakes_in_stage: int) -> bool:
+        """
+        Ends the stage once the counts at the last reversals are stable, or after max_reversals reversals.
+
+        :param mistakes_in_stage: The number of failed rounds in the stage (not used by the staircase).
+        :return: True if the stage ends.
+        """
+        if len(self.reversals) >= self.max_reversals:
+            return True
+        last: List[int] = self.reversals[-self.estimate_reversals:]
+        return len(last) == self.estimate_reversals and float(np.std(last)) <= self.tolerance
+
+    def span(self) -> Optional[float]:
+        """
+        Returns the mean number of squares at the last reversals.
+
+        :return: The span estimate, or None before the first reversal.
+        """
+        if not self.reversals:
+            return None
+        return float(np.mean(self.reversals[-self.estimate_reversals:]))
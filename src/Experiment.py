@@ -1,22 +1,63 @@
 from Colors import Colors
-from Converter import Converter
-from Plotter import Plotter
-
-from typing import List, Tuple, Dict, Any
-
-import random
+from Grid import Grid
+from TextCache import TextCache
+from FrameTimer import FrameTimer
+from Participant import Participant
+from Round import Round
+from Session import Session
+from Schedule import Schedule
+from DifficultyScheduler import DifficultyScheduler, StepScheduler
+from Journal import Journal
+from SessionStore import SessionStore
+from CellState import CellState
+from PostProcessor import PostProcessor
+
+from typing import List, Tuple, Dict, Optional, Any
+
+import os
 import datetime
-import numpy as np
 from psychopy import visual, event, core
 
 
-class Experiment(object):
+class Experiment(Participant):
     """
-    Class to run the experiment and manage the stages and rounds.
+    Class to run the experiment in a window, presenting the rounds of a session to a person.
     """
 
+    INSTRUCTION_TEXT: str = """
+        Witamy w eksperymencie dotyczącym pamięci operacyjnej.\n
+        Celem badania jest ocena Twojej zdolności do zapamiętywania przedstawianych Ci sekwencji elementów.
+        Prosimy o dokładne zapoznanie się z poniższymi instrukcjami i postępowanie zgodnie z nimi.
+
+{rules}
+        
+        Twoje wyniki zostaną anonimowo zapisane, nie będą one w żaden sposób powiązane z Twoją tożsamością. 
+        W przypadku jakichkolwiek pytań prosimy o kontakt z prowadzącym badanie.
+
+        Jeżeli jesteś gotowy_a, kliknij spację, aby zacząć test.
+        """
+    ROUND_RULES: Tuple[str, ...] = (
+        "Na początku każdej rundy wyświetlana będzie plansza z losowo ułożonymi, żółtymi, kwadratowymi polami. Twoim zadaniem będzie zapamiętanie ich położenia.",
+        "Po 2 sekundach pojawi się nowa plansza, gdzie wszystkie kwadraty będą niebieskie. Twoim zadaniem jest wskazanie, które pola były żółte.",
+        "Jeżeli klikniesz w odpowiedni kwadrat zmieni on barwę z niebieskiej na żółtą. W przypadku kliknięcia w niewłaściwe pole, wciśnięty kwadrat zniknie.",
+        "W przypadku wybrania kolejnego niewłaściwego pola runda zostanie przerwana, przejdziesz do kolejnej.",
+    )
+    SESSION_RULES: Tuple[str, ...] = (
+        "Etap składa się z maksymalnie 20 rund.",
+        "Przed i po każdym etapie pojawi się krótka informacja o jego rozpoczęciu lub zakończeniu.",
+        "Po każdej rundzie zostanie wyświetlony komunikat o poprawności wykonania zadania.",
+        "Przed każdą rundą wyświetlana będzie informacja o numerze etapu i rundy{chances}.",
+        "Masz do wykonania łącznie 4 etapy, z czego pierwszy jest treningowy, a trzy pozostałe stanowią właściwe badanie.",
+        "Pamiętaj, że ważne jest by wykonywać zadanie w ciszy i skupieniu.",
+        "Mierzony będzie również czas wykonania zadania - jak szybko uda Ci się wskazać wszystkie żółte pola. Staraj się działać jak najszybciej, ale jednocześnie dokładnie.",
+    )
+    ENDING_TEXT: str = "Twoje wyniki zostały zapisane.\n\nDziękujemy za udział w badaniu!"
+    NEXT_PARTICIPANT_TEXT: str = "Naciśnij spację, aby rozpocząć badanie kolejnej osoby.\n\nEscape kończy badania."
+
     def __init__(self, stages: int = 1, rounds_per_stage: int = 5,
-                 path_to_results: str = "results/", fullscreen: bool = True) -> None:
+                 path_to_results: str = "results/", fullscreen: bool = True, seed: Optional[int] = None,
+                 schedule_file: Optional[str] = None, resume: bool = True, instrument: bool = False,
+                 difficulty: Optional[DifficultyScheduler] = None) -> None:
         """
         Initializes the Experiment object with the given parameters.
 
@@ -24,15 +65,39 @@ class Experiment(object):
         :param rounds_per_stage: Number of rounds per stage. Default is 20.
         :param path_to_results: Path where the results will be saved. Default is "results/".
         :param fullscreen: Boolean indicating whether to use fullscreen mode. Default is True.
+        :param seed: Seed of the trial schedule. Default is a random seed.
+        :param schedule_file: Path of a schedule file to load, or to create if it does not exist. Default is None.
+        :param resume: Boolean indicating whether to resume an interrupted session from its journal. Default is True.
+        :param instrument: Boolean indicating whether to record frame timing and save it with the results.
+                           Default is False.
+        :param difficulty: The scheduler of the difficulty of the rounds. Default is the StepScheduler.
         """
         self.stages: int = stages
         self.rounds_per_stage: int = rounds_per_stage
         self.path_to_results: str = path_to_results
+        self.difficulty: DifficultyScheduler = StepScheduler() if difficulty is None else difficulty
+        self.seed: Optional[int] = seed
+        self.schedule_file: Optional[str] = schedule_file
+        self.schedule: Schedule = self._make_schedule()
         self.win: visual.Window = visual.Window(fullscr=fullscreen, color=Colors.BACKGROUND.value, units='height')
-        self.session_number: int = 1
-        self.results_list: List[Dict[str, Any]] = []
+        self.session_number: int = 0
+        self.store_path: str = os.path.join(path_to_results, "sessions.sqlite")
+        self.resume: bool = resume
+        self.instrument: bool = instrument
+        self.timer: Optional[FrameTimer] = None
+        self.post_processor: PostProcessor = PostProcessor()
         self.mouse: event.Mouse = event.Mouse(win=self.win)
         self.mouse.setVisible(True)
+        self.grid: Grid = Grid(self.win)
+        self.texts: TextCache = TextCache(self.win)
+        self.texts.add("instruction", self._instruction_text(), height=0.03, wrapWidth=1.5)
+        self.texts.add("ending", self.ENDING_TEXT)
+        self.texts.add("stage_info", self._stage_info_text(0, 0, 0))
+        self.texts.add("stage_start", self._stage_start_text(0))
+        self.texts.add("stage_end", self._stage_end_text(0))
+        self.texts.add("correct", "Dobrze!", pos=(0, -0.1))
+        self.texts.add("wrong", "Źle!", pos=(0, -0.1))
+        self.texts.add("next_participant", self.NEXT_PARTICIPANT_TEXT)
 
     def __str__(self) -> str:
         """
@@ -42,28 +107,147 @@ class Experiment(object):
         """
         return f"Experiment with {self.stages} stages and {self.rounds_per_stage} rounds per stage."
 
+    def _make_schedule(self) -> Schedule:
+        """
+        Loads the schedule file, or generates the schedule and saves it to the schedule file if it does not exist.
+        A loaded schedule is checked against the stages, the rounds and the grid sizes of the experiment,
+        so a stale or edited file fails with a ValueError before the session starts.
+
+        :return: The trial schedule.
+        """
+        max_grid_size: int = self.difficulty.max_grid_size(self.rounds_per_stage)
+        if self.schedule_file is not None and os.path.exists(self.schedule_file):
+            schedule: Schedule = Schedule.load(self.schedule_file)
+            try:
+                schedule.check(self.stages, self.rounds_per_stage, max_grid_size)
+            except ValueError as error:
+                raise ValueError(f"Schedule file {self.schedule_file} does not fit the experiment: {error}") from error
+            return schedule
+        schedule = Schedule.generate(self.stages, self.rounds_per_stage, max_grid_size, seed=self.seed)
+        if self.schedule_file is not None:
+            schedule.save(self.schedule_file)
+        return schedule
+
+    def reset(self) -> None:
+        """
+        Resets the per-session state for the next participant.
+
+        The window, the mouse, the grid and text stimuli and the post-processor workers are kept.
+        The schedule is generated again, so it is random for every participant
+        unless it is fixed by the seed or the schedule file.
+
+        :return: None
+        """
+        self.session_number = 0
+        self.timer = None
+        self.schedule = self._make_schedule()
+        self.grid.set_highlighted([])
+        self.mouse.clickReset()
+        event.clearEvents()
+
     def draw_grid(self, grid_size: int, selected_squares: List[Tuple[int, int]],
-                  square_size: float = 0.1, gap: float = 0.02) -> List[Tuple[visual.Rect, Tuple[int, int]]]:
+                  square_size: float = 0.1, gap: float = 0.02) -> Grid:
         """
-        Draws a grid of squares on the screen, highlighting selected squares in yellow.
+        Prepares the grid of squares for drawing, highlighting selected squares in yellow.
+
+        The grid stimulus is reused between rounds and rebuilt only when its size or geometry changes.
 
         :param grid_size: The size of the grid (number of rows and columns).
         :param selected_squares: List of tuples indicating the positions of the squares to be highlighted in yellow.
         :param square_size: The size of each square. Default is 0.1 (height units).
         :param gap: The gap between the squares. Default is 0.02 (height units).
-        :return: List of tuples, each containing a visual.Rect object and its position.
-        """
-        offset: float = (square_size + gap) * (grid_size - 1) / 2
-        squares: List[Tuple[visual.Rect, Tuple[int, int]]] = []
-        for row in range(grid_size):
-            for col in range(grid_size):
-                x: float = col * (square_size + gap) - offset
-                y: float = row * (square_size + gap) - offset
-                color: str = Colors.YELLOW.value if (row, col) in selected_squares else Colors.BLUE.value
-                square: visual.Rect = visual.Rect(self.win, width=square_size, height=square_size,
-                                                  fillColor=color, pos=(x, y))
-                squares.append((square, (row, col)))
-        return squares
+        :return: The Grid object ready to be drawn.
+        """
+        self.grid.resize(grid_size, square_size, gap)
+        self.grid.set_highlighted(selected_squares)
+        return self.grid
+
+    def flip(self, hold: bool = False) -> float:
+        """
+        Flips the window and records the flip timestamp if timing is instrumented.
+
+        :param hold: True if the frame stays on screen while waiting, e.g. for a key. Default is False.
+        :return: The time of the flip in seconds.
+        """
+        flip_time: Optional[float] = self.win.flip()
+        if flip_time is None:
+            flip_time = core.getTime()
+        if self.timer is not None:
+            self.timer.record_flip(flip_time, hold)
+        return flip_time
+
+    def present(self, duration: float, *stimuli: Any, label: str = "stimulus") -> None:
+        """
+        Presents the given stimuli for a number of whole frames matching the duration.
+
+        The stimuli are redrawn on every flip, so the duration is locked to the screen refresh
+        instead of a sleep and the next screen appears on the first frame after it.
+
+        :param duration: The presentation time in seconds.
+        :param stimuli: The stimuli to be drawn on every frame.
+        :param label: The name under which the actual duration is recorded. Default is "stimulus".
+        :return: None
+        """
+        frame_period: float = self.win.monitorFramePeriod
+        frames: int = max(1, int(round(duration / frame_period)))
+        onset: Optional[float] = None
+        for _ in range(frames):
+            for stimulus in stimuli:
+                stimulus.draw()
+            flip_time: float = self.flip()
+            if onset is None:
+                onset = flip_time
+        if self.timer is not None:
+            self.timer.record_stimulus(label, duration, onset)
+
+    def _instruction_text(self) -> str:
+        """
+        Returns the instruction text, with the rules of the difficulty scheduler between the rules of a round
+        and of the session. The remaining chances are mentioned only if failed rounds end the stage.
+
+        :return: The text to be displayed.
+        """
+        chances: str = "" if self.difficulty.MAX_MISTAKES is None else " oraz liczbie pozostałych szans"
+        rules: List[str] = (list(self.ROUND_RULES) + list(self.difficulty.RULES)
+                            + [rule.format(chances=chances) for rule in self.SESSION_RULES])
+        return self.INSTRUCTION_TEXT.format(rules="\n".join(f"        {number}. {rule}"
+                                                             for number, rule in enumerate(rules, start=1)))
+
+    def _stage_info_text(self, stage_number: int, round_number: int, mistakes_in_stage: int) -> str:
+        """
+        Returns the stage information text, with the chances left if the difficulty scheduler supplies them.
+
+        :param stage_number: The current stage number.
+        :param round_number: The current round number.
+        :param mistakes_in_stage: The number of mistakes made in the current stage.
+        :return: The text to be displayed.
+        """
+        lines: List[str] = [f"Etap: {stage_number + 1}", f"Runda: {round_number + 1}"]
+        chances: Optional[str] = self.difficulty.chances_text(mistakes_in_stage)
+        if chances is not None:
+            lines.append(chances)
+        return "\n".join(lines)
+
+    @staticmethod
+    def _stage_start_text(stage_number: int) -> str:
+        """
+        Returns the start message of a stage.
+
+        :param stage_number: The current stage number.
+        :return: The text to be displayed.
+        """
+        return "Rozpoczynasz etap 1\n(treningowy)\n\nNaciśnij spację, aby kontynuować." if stage_number == 0 \
+            else f"Rozpoczynasz etap {stage_number + 1}\n\nNaciśnij spację, aby kontynuować."
+
+    @staticmethod
+    def _stage_end_text(stage_number: int) -> str:
+        """
+        Returns the end message of a stage.
+
+        :param stage_number: The current stage number.
+        :return: The text to be displayed.
+        """
+        return f"Zakończyłeś etap {stage_number + 1}\n\nNaciśnij spację, aby kontynuować."
 
     def show_stage_info(self, stage_number: int, round_number: int, mistakes_in_stage: int) -> None:
         """
@@ -74,10 +258,10 @@ class Experiment(object):
         :param mistakes_in_stage: The number of mistakes made in the current stage.
         :return: None
         """
-        info_text: str = f"Etap: {stage_number + 1}\nRunda: {round_number + 1}\nSzanse: {3 - mistakes_in_stage}/3"
-        info: visual.TextStim = visual.TextStim(self.win, text=info_text, color=Colors.WHITE.value, height=0.05)
+        info: visual.TextStim = self.texts.get("stage_info",
+                                               self._stage_info_text(stage_number, round_number, mistakes_in_stage))
         info.draw()
-        self.win.flip()
+        self.flip(hold=True)
         core.wait(1)
 
     def show_instruction(self) -> None:
@@ -86,35 +270,8 @@ class Experiment(object):
 
         :return: None
         """
-        instruction_text: str = """
-        Witamy w eksperymencie dotyczącym pamięci operacyjnej.\n
-        Celem badania jest ocena Twojej zdolności do zapamiętywania przedstawianych Ci sekwencji elementów.
-        Prosimy o dokładne zapoznanie się z poniższymi instrukcjami i postępowanie zgodnie z nimi.
-
-        1. Na początku każdej rundy wyświetlana będzie plansza z losowo ułożonymi, żółtymi, kwadratowymi polami. Twoim zadaniem będzie zapamiętanie ich położenia.
-        2. Po 2 sekundach pojawi się nowa plansza, gdzie wszystkie kwadraty będą niebieskie. Twoim zadaniem jest wskazanie, które pola były żółte.
-        3. Jeżeli klikniesz w odpowiedni kwadrat zmieni on barwę z niebieskiej na żółtą. W przypadku kliknięcia w niewłaściwe pole, wciśnięty kwadrat zniknie.
-        4. W przypadku wybrania kolejnego niewłaściwego pola, liczba szans zmniejszy się o 1, a runda zostanie przerwana, przejdziesz do kolejnej.
-        5. Po trzech błędach etap zostanie przerwany.
-        6. W przypadku wskazania wszystkich poprawnych pól, przejdziesz do kolejnej rundy, gdzie liczba żółtych kwadratów wzrośnie o jeden.
-        7. Rozmiar planszy będzie się stopniowo zwiększał wraz ze wzrostem liczby żółtych kwadratów w kolejnych rundach.
-        8. Etap składa się z maksymalnie 20 rund.
-        9. Przed i po każdym etapie pojawi się krótka informacja o jego rozpoczęciu lub zakończeniu.
-        10. Po każdej rundzie zostanie wyświetlony komunikat o poprawności wykonania zadania.
-        11. Pred każdą rundą wyświetlana będzie informacja o numerze etapu, rundy oraz liczbie pozostałych szans.
-        12. Masz do wykonania łącznie 4 etapy, z czego pierwszy jest treningowy, a trzy pozostałe stanowią właściwe badanie.
-        13. Pamiętaj, że ważne jest by wykonywać zadanie w ciszy i skupieniu.
-        14. Mierzony będzie również czas wykonania zadania - jak szybko uda Ci się wskazać wszystkie żółte pola. Staraj się działać jak najszybciej, ale jednocześnie dokładnie.
-        
-        Twoje wyniki zostaną anonimowo zapisane, nie będą one w żaden sposób powiązane z Twoją tożsamością. 
-        W przypadku jakichkolwiek pytań prosimy o kontakt z prowadzącym badanie.
-
-        Jeżeli jesteś gotowy_a, kliknij spację, aby zacząć test.
-        """
-        instruction: visual.TextStim = visual.TextStim(self.win, text=instruction_text, color=Colors.WHITE.value,
-                                                       height=0.03, wrapWidth=1.5)
-        instruction.draw()
-        self.win.flip()
+        self.texts.get("instruction").draw()
+        self.flip(hold=True)
         event.waitKeys(keyList=["space"])
 
     def show_ending(self) -> None:
@@ -123,12 +280,20 @@ class Experiment(object):
 
         :return: None
         """
-        ending_text: str = "Twoje wyniki zostały zapisane.\n\nDziękujemy za udział w badaniu!"
-        ending: visual.TextStim = visual.TextStim(self.win, text=ending_text, color=Colors.WHITE.value, height=0.05)
-        ending.draw()
-        self.win.flip()
+        self.texts.get("ending").draw()
+        self.flip(hold=True)
         core.wait(5)
 
+    def show_next_participant(self) -> bool:
+        """
+        Displays the message between participants and waits for the next one.
+
+        :return: True if the next session should start, False if escape was pressed.
+        """
+        self.texts.get("next_participant").draw()
+        self.flip(hold=True)
+        return event.waitKeys(keyList=["space", "escape"])[0] == "space"
+
     def show_stage_start(self, stage_number: int) -> None:
         """
         Displays the start message of a stage.
@@ -136,11 +301,8 @@ class Experiment(object):
         :param stage_number: The current stage number.
         :return: None
         """
-        text: str = "Rozpoczynasz etap 1\n(treningowy)\n\nNaciśnij spację, aby kontynuować." if stage_number == 0 \
-            else f"Rozpoczynasz etap {stage_number + 1}\n\nNaciśnij spację, aby kontynuować."
-        stage_start: visual.TextStim = visual.TextStim(self.win, text=text, color=Colors.WHITE.value, height=0.05)
-        stage_start.draw()
-        self.win.flip()
+        self.texts.get("stage_start", self._stage_start_text(stage_number)).draw()
+        self.flip(hold=True)
         event.waitKeys(keyList=["space"])
 
     def show_stage_end(self, stage_number: int) -> None:
@@ -150,182 +312,103 @@ class Experiment(object):
         :param stage_number: The current stage number.
         :return: None
         """
-        text: str = f"Zakończyłeś etap {stage_number + 1}\n\nNaciśnij spację, aby kontynuować."
-        stage_end: visual.TextStim = visual.TextStim(self.win, text=text, color=Colors.WHITE.value, height=0.05)
-        stage_end.draw()
-        self.win.flip()
+        self.texts.get("stage_end", self._stage_end_text(stage_number)).draw()
+        self.flip(hold=True)
         event.waitKeys(keyList=["space"])
 
+    def play_round(self, round_: Round) -> None:
+        """
+        Shows the highlighted squares for 2 seconds, then collects clicks on the blank grid until the round finishes.
+
+        The mouse is polled once per frame and a click is detected by a new time of the last left button press,
+        so at most one click is registered per frame: if the button is pressed twice between two flips
+        (only possible when frames are dropped), the earlier press is lost. The position of a click is
+        the mouse position at the poll, at most one frame after the press.
+
+        :param round_: The round to be played.
+        :return: None
+        """
+        grid: Grid = self.draw_grid(round_.grid_size, round_.selected_squares)
+        self.present(2, grid, label="memorization")
+
+        grid = self.draw_grid(round_.grid_size, [])
+        last_press_time: float = 0.0
+
+        self.win.callOnFlip(self.mouse.clickReset)
+        grid.draw()
+        response_onset: float = self.flip()
+
+        while not round_.finished:
+            feedback_for: Optional[float] = None
+            _, press_times = self.mouse.getPressed(getTime=True)
+            if press_times[0] != last_press_time:
+                last_press_time = press_times[0]
+                pos: Optional[Tuple[int, int]] = grid.cell_at(self.mouse.getPos())
+                state: Optional[CellState] = round_.click(pos, press_times[0])
+                if state is not None:
+                    grid.set_state(pos, state)
+                    feedback_for = response_onset + press_times[0]
+            grid.draw()
+            flip_time: float = self.flip()
+            if self.timer is not None and feedback_for is not None:
+                self.timer.record_latency(feedback_for, flip_time)
+
+        self.present(0.2, grid, label="last_click_feedback")
+
+    def show_result(self, correct: bool) -> None:
+        """
+        Displays whether the round was completed correctly.
+
+        :param correct: True if the round was completed correctly.
+        :return: None
+        """
+        self.present(2, self.texts.get("correct" if correct else "wrong"), label="result")
+
     def run(self) -> int:
         """
         Runs the experiment, displaying instructions, stages, rounds, and saving the results to files.
 
+        The results are saved and plotted in the background by the post-processor, which starts as soon as
+        the session is finished, while the ending message is shown. Call post_processor.shutdown before
+        exiting to wait for them.
+
         :return: 0 if the experiment was successful.
         """
+        self.timer = FrameTimer(self.win.monitorFramePeriod) if self.instrument else None
+        completed: List[Dict[str, Any]] = []
+        journal_file: Optional[str] = Journal.find_unfinished(self.path_to_results) if self.resume else None
+        if journal_file is not None:
+            journal: Journal = Journal.resume(journal_file)
+            self.session_number = journal.session_number
+            if journal.seed is not None and journal.seed != self.schedule.seed:
+                self.schedule = Schedule.generate(self.stages, self.rounds_per_stage,
+                                                  self.difficulty.max_grid_size(self.rounds_per_stage),
+                                                  seed=journal.seed)
+            completed = list(journal.records())
+        else:
+            store: SessionStore = SessionStore(self.store_path)
+            self.session_number = store.new_session()
+            store.close()
+            timestamp: str = datetime.datetime.now().strftime("%Y%m%d%H%M")
+            journal = Journal.create(f"{self.path_to_results}{timestamp}_{self.session_number}{Journal.EXTENSION}",
+                                     self.session_number,
+                                     self.schedule.seed)
+
+        self.post_processor.start()
         self.show_instruction()
 
-        for stage_number in range(self.stages):
-            self.show_stage_start(stage_number)
-            mistakes_in_stage: int = 0
-            selected_squares_count: int = 3
-            grid_size: int = 3
-
-            for round_number in range(self.rounds_per_stage):
-                self.show_stage_info(stage_number, round_number, mistakes_in_stage)
-
-                if selected_squares_count >= (grid_size * grid_size) / 2:
-                    grid_size += 1
-
-                selected_squares: List[Tuple[int, int]] = random.sample([(i, j)
-                                                                         for i in range(grid_size)
-                                                                         for j in range(grid_size)],
-                                                                        selected_squares_count)
-                squares: List[Tuple[visual.Rect, Tuple[int, int]]] = self.draw_grid(grid_size, selected_squares)
-                for square, _ in squares:
-                    square.draw()
-                self.win.flip()
-                core.wait(2)
-                #memorization_start_time: float = core.getTime()
-
-                squares = self.draw_grid(grid_size, [])
-                for square, _ in squares:
-                    square.draw()
-                self.win.flip()
-
-                clicked_squares: List[Tuple[int, int]] = []
-                click_times: List[float] = []
-                correct_clicks: int = 0
-                mistakes_in_round: int = 0
-                misclicked_square: Tuple[int, int] = ()
-
-                self.mouse.clickReset()
-
-                start_time: float = core.getTime()
-
-                while correct_clicks < selected_squares_count and mistakes_in_stage < 3:
-                    mouse_clicks = self.mouse.getPressed(getTime=True)
-                    if mouse_clicks[0][0]:
-                        mouse_click_pos = self.mouse.getPos()
-                        click_time = core.getTime()
-                        for square, pos in squares:
-                            if (square.contains(mouse_click_pos)
-                                    and pos not in clicked_squares
-                                    and not np.array_equal(square.fillColor, Colors.YELLOW.value)
-                                    and square.opacity != 0):
-                                if pos in selected_squares:
-                                    square.fillColor = Colors.YELLOW.value
-                                    correct_clicks += 1
-                                else:
-                                    square.opacity = 0
-                                    mistakes_in_round += 1
-                                    misclicked_square = pos
-                                clicked_squares.append(pos)
-                                click_times.append(click_time - start_time)
-                                print(click_times)
-                                for sq, _ in squares:
-                                    sq.draw()
-                                self.win.flip()
-                                core.wait(0.2)
-                        while self.mouse.getPressed()[0]:
-                            core.wait(0.01)
-                        if mistakes_in_round > 1:
-                            mistakes_in_stage += 1
-                            result_text: str = "Źle!"
-                            result: visual.TextStim = visual.TextStim(self.win, text=result_text, pos=(0, -0.1),
-                                                                      color=Colors.WHITE.value, height=0.05)
-                            result.draw()
-                            self.win.flip()
-                            core.wait(2)
-                            break
-
-                #memorization_time: float = core.getTime() - memorization_start_time
-
-                if mistakes_in_stage == 3:
-                    new_result: Dict[str, Any] = {
-                        "Session": self.session_number,
-                        "Stage": stage_number + 1,
-                        "Round": round_number + 1,
-                        "Selected_squares": selected_squares,
-                        "Clicked_positions": clicked_squares,
-                        "Mistakes_in_stage": mistakes_in_stage,
-                        "Click_times": click_times
-                    }
-                    self.results_list.append(new_result)
-                    break
-
-                if mistakes_in_round > 1:
-                    new_result = {
-                        "Session": self.session_number,
-                        "Stage": stage_number + 1,
-                        "Round": round_number + 1,
-                        "Selected_squares": selected_squares,
-                        "Clicked_positions": clicked_squares,
-                        "Mistakes_in_stage": mistakes_in_stage,
-                        "Click_times": click_times
-                    }
-                    self.results_list.append(new_result)
-                    continue
-
-                if mistakes_in_round == 1:
-                    clicked_squares_copy: List[Tuple[int, int]] = clicked_squares.copy()
-                    clicked_squares_copy.remove(misclicked_square)
-                    correct: bool = all(pos in clicked_squares_copy for pos in selected_squares)
-                else:
-                    correct = all(pos in clicked_squares for pos in selected_squares)
-
-                if correct:
-                    selected_squares_count += 1
-
-                new_result = {
-                    "Session": self.session_number,
-                    "Stage": stage_number + 1,
-                    "Round": round_number + 1,
-                    "Selected_squares": selected_squares,
-                    "Clicked_positions": clicked_squares,
-                    "Mistakes_in_stage": mistakes_in_stage,
-                    "Click_times": click_times
-                }
-                self.results_list.append(new_result)
-
-                result_text = "Dobrze!" if correct else "Źle!"
-                result = visual.TextStim(self.win, text=result_text, pos=(0, -0.1), color=Colors.WHITE.value, height=0.05)
-                result.draw()
-                self.win.flip()
-                core.wait(2)
-
-                self.show_stage_info(stage_number, round_number, mistakes_in_stage)
-
-                if mistakes_in_stage >= 3:
-                    break
-
-            for remaining_round in range(round_number + 1, self.rounds_per_stage):
-                new_result = {
-                    "Session": self.session_number,
-                    "Stage": stage_number + 1,
-                    "Round": remaining_round + 1,
-                    "Selected_squares": [],
-                    "Clicked_positions": [],
-                    "Mistakes_in_stage": mistakes_in_stage,
-                    "Click_times": []
-                }
-                self.results_list.append(new_result)
-
-            self.show_stage_end(stage_number)
-    
-        self.show_ending()
+        session: Session = Session(self, self.session_number, self.stages, self.rounds_per_stage, self.schedule,
+                                   journal, self.difficulty)
+        session.run(completed)
+        journal.finish()
 
         save_time_end: datetime.datetime = datetime.datetime.now()
-        timestamp: str = save_time_end.strftime("%Y%m%d%H%M")
-        filename: str = f"{self.path_to_results}{timestamp}"
+        timestamp = save_time_end.strftime("%Y%m%d%H%M")
+        filename: str = f"{self.path_to_results}{timestamp}_{self.session_number}"
 
-        converter: Converter = Converter(self.results_list, filename)
-        converter.save_to_csv()
-        converter.save_to_txt()
-        converter.save_to_json()
+        self.post_processor.submit(journal.filename, filename,
+                                   self.timer.summary() if self.timer is not None else None, self.store_path)
 
-        plotter: Plotter = Plotter(f"{filename}.csv")
-        plotter.plot_average_time_per_square()
-        plotter.plot_overall_average_accuracy()
+        self.show_ending()
 
         return 0
-    
\ No newline at end of file
@@ -0,0 +1,118 @@
+from typing import Any, List, Optional
+
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+class FigureTemplates(object):
+    """
+    Class for the figures of the Plotter, built once and reused for many sessions.
+
+    The figures, axes, labels and lines are created on first use, rendering a session
+    only replaces the line data, the ticks and the titles.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the FigureTemplates without building any figure yet.
+        """
+        self._time_fig: Optional[plt.Figure] = None
+        self._time_axes: List[Any] = []
+        self._time_lines: List[Any] = []
+        self._accuracy_fig: Optional[plt.Figure] = None
+        self._accuracy_ax: Any = None
+        self._accuracy_line: Any = None
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the FigureTemplates object.
+
+        :return: String representation of the FigureTemplates object.
+        """
+        built: int = (self._time_fig is not None) + (self._accuracy_fig is not None)
+        return f"FigureTemplates with {built} built figures."
+
+    def _build_time_figure(self) -> None:
+        """
+        Builds the figure of the average time per square with one subplot for each of the first four stages.
+        """
+        self._time_fig, axs = plt.subplots(2, 2, figsize=(15, 10))
+        self._time_axes = list(axs.flatten())
+        self._time_lines = []
+        for ax in self._time_axes:
+            self._time_lines.append(ax.plot([], [], marker="o")[0])
+            ax.set_ylabel("Average time per square [s]")
+            ax.set_xlabel("Round [#]")
+            ax.grid(True, which="both", linestyle="-", linewidth=0.2)
+
+    def _build_accuracy_figure(self) -> None:
+        """
+        Builds the figure of the overall average accuracy per round.
+        """
+        self._accuracy_fig, self._accuracy_ax = plt.subplots(figsize=(10, 5))
+        self._accuracy_line = self._accuracy_ax.plot([], [], marker="o")[0]
+        self._accuracy_ax.set_title("Overall average accuracy per round", fontsize=14, fontweight="bold")
+        self._accuracy_ax.set_xlabel("Round [#]")
+        self._accuracy_ax.set_ylabel("Average accuracy [%]")
+        self._accuracy_ax.grid(True, which="both", linestyle="-", linewidth=0.2)
+
+    def render_average_time_per_square(self, data: pd.DataFrame) -> plt.Figure:
+        """
+        Renders the average time per square for each stage of a session.
+
+        :param data: Data frame with the Stage, Round and Average_time_per_square columns.
+        :return: The rendered figure.
+        """
+        if self._time_fig is None:
+            self._build_time_figure()
+        stages: np.ndarray = data["Stage"].unique()
+        for idx, (ax, line) in enumerate(zip(self._time_axes, self._time_lines)):
+            if idx < len(stages):
+                stage: Any = stages[idx]
+                stage_data: pd.DataFrame = data[data["Stage"] == stage]
+                line.set_data(stage_data["Round"], stage_data["Average_time_per_square"])
+                ax.set_visible(True)
+                ax.set_title(f"Stage {stage} - Average time per square", fontsize=14, fontweight="bold")
+                ax.relim()
+                ax.autoscale(enable=True)
+                ax.set_ylim(bottom=0)
+                ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
+                ax.set_xticks(np.arange(1, stage_data["Round"].max() + 1))
+            else:
+                ax.set_visible(False)
+        self._time_fig.tight_layout()
+        return self._time_fig
+
+    def render_overall_average_accuracy(self, data: pd.DataFrame) -> plt.Figure:
+        """
+        Renders the overall average accuracy per round of a session.
+
+        :param data: Data frame with the Round and Accuracy columns.
+        :return: The rendered figure.
+        """
+        if self._accuracy_fig is None:
+            self._build_accuracy_figure()
+        ax: Any = self._accuracy_ax
+        rounds: np.ndarray = data["Round"].unique()
+        average_accuracy_per_round: pd.Series = data.groupby("Round")["Accuracy"].mean() * 100
+        self._accuracy_line.set_data(average_accuracy_per_round.index, average_accuracy_per_round.values)
+        ax.relim()
+        ax.autoscale(enable=True)
+        ax.set_ylim(0, 110)
+        ax.set_xticks(np.arange(1, rounds.max() + 1))
+        ax.set_yticks(np.arange(0, 110, 10))
+        ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
+        return self._accuracy_fig
+
+    def close(self) -> None:
+        """
+        Closes the built figures, they are built again on next use.
+
+        :return: None
+        """
+        for fig in (self._time_fig, self._accuracy_fig):
+            if fig is not None:
+                plt.close(fig)
+        self._time_fig = None
+        self._accuracy_fig = None
@@ -0,0 +1,143 @@
+from typing import List, Dict, Any, Optional, Tuple
+
+from array import array
+import numpy as np
+
+
+class FrameTimer(object):
+    """
+    Class to record flip timestamps, dropped frames, stimulus durations and click-to-feedback latencies
+    and to summarize them as histograms.
+    """
+
+    LATE_FACTOR: float = 1.5
+    HISTOGRAM_BINS_MS: np.ndarray = np.concatenate((np.arange(0, 50, 1), np.arange(50, 200, 10),
+                                                    np.arange(200, 1001, 100)))
+
+    def __init__(self, frame_period: float) -> None:
+        """
+        Initializes the FrameTimer with the nominal frame period of the monitor.
+
+        :param frame_period: The nominal time between flips in seconds.
+        """
+        self.frame_period: float = frame_period
+        self.flips: array = array("d")
+        self.flip_intervals: array = array("d")
+        self.latencies: array = array("d")
+        self.durations: Dict[str, Tuple[float, array]] = {}
+        self._pending_stimulus: Optional[Tuple[str, float, float]] = None
+        self._hold: bool = True
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the FrameTimer object.
+
+        :return: String representation of the FrameTimer object.
+        """
+        return f"FrameTimer with {len(self.flips)} flips and {self.dropped_frames()} dropped frames."
+
+    def record_flip(self, flip_time: float, hold: bool = False) -> None:
+        """
+        Records the timestamp of a flip and closes the stimulus presented before it.
+
+        :param flip_time: The time of the flip in seconds, as returned by win.flip.
+        :param hold: True if the frame is deliberately held (e.g. while waiting for a key),
+                     so the interval to the next flip is not a frame interval. Default is False.
+        :return: None
+        """
+        if not self._hold:
+            self.flip_intervals.append(flip_time - self.flips[-1])
+        self.flips.append(flip_time)
+        self._hold = hold
+        if self._pending_stimulus is not None:
+            label, target, onset = self._pending_stimulus
+            self.durations.setdefault(label, (target, array("d")))[1].append(flip_time - onset)
+            self._pending_stimulus = None
+
+    def record_stimulus(self, label: str, target: float, onset: float) -> None:
+        """
+        Records a stimulus whose presentation ends with the next flip.
+
+        :param label: The name of the stimulus.
+        :param target: The intended presentation time in seconds.
+        :param onset: The time of the first flip showing the stimulus in seconds.
+        :return: None
+        """
+        self._pending_stimulus = (label, target, onset)
+
+    def record_latency(self, event_time: float, feedback_time: float) -> None:
+        """
+        Records the time between an input event and the flip showing the feedback.
+
+        :param event_time: The time of the input event in seconds.
+        :param feedback_time: The time of the flip showing the feedback in seconds.
+        :return: None
+        """
+        self.latencies.append(feedback_time - event_time)
+
+    def intervals(self) -> np.ndarray:
+        """
+        Returns the times between consecutive flips, leaving out frames that were deliberately held.
+
+        :return: Array of flip intervals in seconds.
+        """
+        return np.frombuffer(self.flip_intervals, dtype=np.float64)
+
+    def dropped_frames(self) -> int:
+        """
+        Counts the flips that came later than the frame period allows.
+
+        :return: Number of late flips.
+        """
+        return int(np.count_nonzero(self.intervals() > self.LATE_FACTOR * self.frame_period))
+
+    @classmethod
+    def _histogram(cls, values_s: np.ndarray) -> Dict[str, List[float]]:
+        """
+        Builds a histogram of the values in milliseconds.
+
+        :param values_s: Values in seconds.
+        :return: Dictionary with the bin edges in milliseconds and the counts.
+        """
+        counts, edges = np.histogram(np.clip(values_s * 1000, 0, cls.HISTOGRAM_BINS_MS[-1]), cls.HISTOGRAM_BINS_MS)
+        return {"bin_edges_ms": edges.tolist(), "counts": counts.tolist()}
+
+    @staticmethod
+    def _stats(values_s: np.ndarray) -> Dict[str, float]:
+        """
+        Computes summary statistics of the values in milliseconds.
+
+        :param values_s: Values in seconds.
+        :return: Dictionary with the mean, standard deviation, median, 95th percentile and maximum.
+        """
+        if len(values_s) == 0:
+            return {}
+        values_ms: np.ndarray = values_s * 1000
+        return {"mean_ms": float(values_ms.mean()), "sd_ms": float(values_ms.std()),
+                "median_ms": float(np.median(values_ms)), "p95_ms": float(np.percentile(values_ms, 95)),
+                "max_ms": float(values_ms.max())}
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Aggregates the recorded timings.
+
+        :return: Dictionary with statistics and histograms of flip intervals, stimulus durations and latencies.
+        """
+        intervals: np.ndarray = self.intervals()
+        latencies: np.ndarray = np.frombuffer(self.latencies, dtype=np.float64)
+        durations: Dict[str, Any] = {}
+        for label, (target, actual) in self.durations.items():
+            errors: np.ndarray = np.frombuffer(actual, dtype=np.float64) - target
+            durations[label] = {"target_ms": target * 1000, "count": len(actual),
+                                "error": self._stats(errors), "abs_error_histogram": self._histogram(np.abs(errors))}
+        return {
+            "frame_period_ms": self.frame_period * 1000,
+            "flips": len(self.flips),
+            "dropped_frames": self.dropped_frames(),
+            "dropped_frame_ratio": self.dropped_frames() / len(intervals) if len(intervals) else 0.0,
+            "flip_intervals": self._stats(intervals),
+            "flip_interval_histogram": self._histogram(intervals),
+            "stimulus_durations": durations,
+            "click_to_feedback_latency": self._stats(latencies),
+            "click_to_feedback_latency_histogram": self._histogram(latencies)
+        }
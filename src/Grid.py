@@ -0,0 +1,176 @@
+from Colors import Colors
+from CellState import CellState
+
+from typing import List, Tuple, Optional
+
+import numpy as np
+from psychopy import visual
+from psychopy.colors import Color
+
+
+class Grid(object):
+    """
+    Class to draw the grid of squares as a single batched stimulus.
+
+    The underlying element array is rebuilt only when the grid size changes,
+    between rounds only the per-cell colors and opacities are updated.
+    The state of every square is kept in a (grid_size, grid_size) array of CellState values
+    and clicks are mapped to squares arithmetically, so both cost constant time.
+    """
+
+    def __init__(self, win: visual.Window, square_size: float = 0.1, gap: float = 0.02) -> None:
+        """
+        Initializes the Grid object for the given window.
+
+        :param win: The window in which the grid will be drawn.
+        :param square_size: The size of each square. Default is 0.1 (height units).
+        :param gap: The gap between the squares. Default is 0.02 (height units).
+        """
+        self.win: visual.Window = win
+        self.square_size: float = square_size
+        self.gap: float = gap
+        self.grid_size: int = 0
+        self.cells: List[Tuple[int, int]] = []
+        self.xys: np.ndarray = np.empty((0, 2))
+        self.offset: float = 0.0
+        self.states: np.ndarray = np.empty((0, 0), dtype=np.int8)
+        self.stim: Optional[visual.ElementArrayStim] = None
+        yellow: List[float] = list(Color(Colors.YELLOW.value).rgb)
+        blue: List[float] = list(Color(Colors.BLUE.value).rgb)
+        self._palette: np.ndarray = np.array([blue, yellow, yellow, blue], dtype=float)
+        self._alpha: np.ndarray = np.array([1.0, 1.0, 1.0, 0.0])
+        self._dirty: bool = False
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Grid object.
+
+        :return: String representation of the Grid object.
+        """
+        return f"Grid of {self.grid_size}x{self.grid_size} squares."
+
+    def layout(self, grid_size: int, square_size: Optional[float] = None, gap: Optional[float] = None) -> bool:
+        """
+        Sets the geometry and resets the square states if the grid size or geometry changed, without building
+        the element array, so the squares can be hit-tested without a window.
+
+        :param grid_size: The size of the grid (number of rows and columns).
+        :param square_size: The size of each square. Default is the current size.
+        :param gap: The gap between the squares. Default is the current gap.
+        :return: True if the geometry changed.
+        """
+        square_size = self.square_size if square_size is None else square_size
+        gap = self.gap if gap is None else gap
+        if grid_size == self.grid_size and square_size == self.square_size and gap == self.gap:
+            return False
+
+        self.grid_size = grid_size
+        self.square_size = square_size
+        self.gap = gap
+        self.offset = (square_size + gap) * (grid_size - 1) / 2
+        rows, cols = np.divmod(np.arange(grid_size * grid_size), grid_size)
+        self.cells = list(zip(rows.tolist(), cols.tolist()))
+        self.xys = np.column_stack((cols * (square_size + gap) - self.offset,
+                                    rows * (square_size + gap) - self.offset))
+        self.states = np.zeros((grid_size, grid_size), dtype=np.int8)
+        return True
+
+    def resize(self, grid_size: int, square_size: Optional[float] = None, gap: Optional[float] = None) -> None:
+        """
+        Rebuilds the element array if the grid size or geometry changed (or it was not built yet),
+        otherwise does nothing.
+
+        :param grid_size: The size of the grid (number of rows and columns).
+        :param square_size: The size of each square. Default is the current size.
+        :param gap: The gap between the squares. Default is the current gap.
+        :return: None
+        """
+        if not self.layout(grid_size, square_size, gap) and self.stim is not None:
+            return
+
+        self.stim = visual.ElementArrayStim(self.win, units=self.win.units, nElements=grid_size * grid_size,
+                                            xys=self.xys, sizes=self.square_size, elementTex=None, elementMask=None,
+                                            colors=self._colors(), colorSpace="rgb", opacities=self._opacities(),
+                                            fieldShape="square", fieldSize=(2, 2), sfs=0)
+        self._dirty = False
+
+    def set_highlighted(self, selected_squares: List[Tuple[int, int]]) -> None:
+        """
+        Resets all squares to blank and highlights the given positions in yellow.
+
+        :param selected_squares: List of tuples indicating the positions of the squares to be highlighted in yellow.
+        :return: None
+        """
+        self.states.fill(CellState.BLANK)
+        for row, col in selected_squares:
+            self.states[row, col] = CellState.SELECTED
+        self._dirty = True
+
+    def state(self, cell: Tuple[int, int]) -> CellState:
+        """
+        Returns the state of a single square.
+
+        :param cell: The (row, col) position of the square.
+        :return: The state of the square.
+        """
+        return CellState(self.states[cell])
+
+    def set_state(self, cell: Tuple[int, int], state: CellState) -> None:
+        """
+        Changes the state of a single square.
+
+        :param cell: The (row, col) position of the square.
+        :param state: The new state of the square.
+        :return: None
+        """
+        self.states[cell] = state
+        self._dirty = True
+
+    def cell_at(self, pos: Tuple[float, float]) -> Optional[Tuple[int, int]]:
+        """
+        Maps a point to the square under it using the grid geometry.
+
+        :param pos: The (x, y) point in window units.
+        :return: The (row, col) position of the square, or None if the point lies in a gap or outside the grid.
+        """
+        pitch: float = self.square_size + self.gap
+        half: float = self.square_size / 2
+        col_f: float = (pos[0] + self.offset + half) / pitch
+        row_f: float = (pos[1] + self.offset + half) / pitch
+        col: int = int(np.floor(col_f))
+        row: int = int(np.floor(row_f))
+        if not (0 <= row < self.grid_size and 0 <= col < self.grid_size):
+            return None
+        if (col_f - col) * pitch > self.square_size or (row_f - row) * pitch > self.square_size:
+            return None
+        return row, col
+
+    def draw(self) -> None:
+        """
+        Draws the whole grid with a single draw call, pushing pending color and opacity changes first.
+
+        :return: None
+        """
+        if self.stim is None:
+            return
+        if self._dirty:
+            self.stim.setColors(self._colors(), colorSpace="rgb")
+            self.stim.setOpacities(self._opacities())
+            self._dirty = False
+        self.stim.draw()
+
+    def _colors(self) -> np.ndarray:
+        """
+        Builds the per-element color array from the square states.
+
+        :return: Array of shape (n, 3) with colors in the rgb color space.
+        """
+        return self._palette[self.states.ravel()]
+
+    def _opacities(self) -> np.ndarray:
+        """
+        Builds the per-element opacity array from the square states.
+
+        :return: Array of shape (n,) with opacities.
+        """
+        return self._alpha[self.states.ravel()]
@@ -0,0 +1,194 @@
+from RoundRecord import RoundRecord
+
+from typing import List, Dict, Any, Iterator, Optional, Union
+
+import os
+import glob
+import json
+
+
+class Journal(object):
+    """
+    Class to stream round results to an append-only, line-delimited JSON file as the session runs.
+
+    The first line holds the session number and schedule seed, every following line one round result,
+    and the last line marks the session as finished. A journal without the last line belongs to
+    an interrupted session, which can be resumed from it.
+    """
+
+    EXTENSION: str = ".journal.jsonl"
+
+    def __init__(self, filename: str, session_number: int, seed: Optional[int], sync_every: int = 5) -> None:
+        """
+        Opens the journal file for appending.
+
+        Use create to start a new journal and resume to continue an existing one.
+
+        :param filename: The path of the journal file.
+        :param session_number: Number of the session written to the journal.
+        :param seed: Seed of the trial schedule used in the session.
+        :param sync_every: Number of rounds after which the file is synced to disk. Default is 5.
+        """
+        self.filename: str = filename
+        self.session_number: int = session_number
+        self.seed: Optional[int] = seed
+        self.sync_every: int = sync_every
+        self.rounds: int = 0
+        self._file = open(filename, "a", encoding="utf-8")
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Journal object.
+
+        :return: String representation of the Journal object.
+        """
+        return f"Journal of session {self.session_number}: {self.filename}"
+
+    @classmethod
+    def create(cls, filename: str, session_number: int, seed: Optional[int], sync_every: int = 5) -> "Journal":
+        """
+        Creates a new journal and writes its header line.
+
+        :param filename: The path of the journal file (with the .journal.jsonl extension).
+        :param session_number: Number of the session written to the journal.
+        :param seed: Seed of the trial schedule used in the session.
+        :param sync_every: Number of rounds after which the file is synced to disk. Default is 5.
+        :return: The created Journal.
+        """
+        journal: Journal = cls(filename, session_number, seed, sync_every)
+        journal._write({"type": "start", "session": session_number, "seed": None if seed is None else str(seed)})
+        journal.sync()
+        return journal
+
+    @classmethod
+    def resume(cls, filename: str, sync_every: int = 5) -> "Journal":
+        """
+        Reopens the journal of an interrupted session, dropping a partially written last line.
+
+        :param filename: The path of the journal file.
+        :param sync_every: Number of rounds after which the file is synced to disk. Default is 5.
+        :return: The reopened Journal.
+        """
+        header: Dict[str, Any] = {}
+        rounds: int = 0
+        valid_length: int = 0
+        with open(filename, "rb") as file:
+            for line in file:
+                try:
+                    entry: Dict[str, Any] = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                if entry["type"] == "start":
+                    header = entry
+                elif entry["type"] == "round":
+                    rounds += 1
+                valid_length += len(line)
+        with open(filename, "r+b") as file:
+            file.truncate(valid_length)
+        seed: Optional[int] = None if header.get("seed") is None else int(header["seed"])
+        journal: Journal = cls(filename, header["session"], seed, sync_every)
+        journal.rounds = rounds
+        return journal
+
+    @classmethod
+    def find_unfinished(cls, path: str) -> Optional[str]:
+        """
+        Finds the most recent journal in the directory that was not finished.
+
+        :param path: The directory with the results.
+        :return: The path of the journal file, or None if all sessions were finished.
+        """
+        for filename in sorted(glob.glob(os.path.join(path, f"*{cls.EXTENSION}")), reverse=True):
+            if not cls.is_finished(filename):
+                return filename
+        return None
+
+    @staticmethod
+    def is_finished(filename: str) -> bool:
+        """
+        Checks whether the journal ends with the finish line.
+
+        :param filename: The path of the journal file.
+        :return: True if the session was finished.
+        """
+        with open(filename, "rb") as file:
+            file.seek(0, os.SEEK_END)
+            file.seek(max(0, file.tell() - 64))
+            tail: List[bytes] = file.read().splitlines()
+        try:
+            return bool(tail) and json.loads(tail[-1]).get("type") == "end"
+        except ValueError:
+            return False
+
+    def append(self, record: Union[RoundRecord, Dict[str, Any]]) -> None:
+        """
+        Appends a round result, flushing it immediately and syncing it to disk every few rounds.
+
+        :param record: RoundRecord or dictionary containing the result of a round.
+        :return: None
+        """
+        self._write({"type": "round", "record": record.to_dict() if isinstance(record, RoundRecord) else record})
+        self.rounds += 1
+        if self.rounds % self.sync_every == 0:
+            self.sync()
+
+    def finish(self) -> None:
+        """
+        Marks the session as finished and closes the file.
+
+        :return: None
+        """
+        self._write({"type": "end"})
+        self.sync()
+        self._file.close()
+
+    def sync(self) -> None:
+        """
+        Forces the written lines to disk.
+
+        :return: None
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Reads back the round results written to the journal.
+
+        :return: Iterator over dictionaries containing the results of every round, positions as tuples.
+        """
+        if not self._file.closed:
+            self._file.flush()
+        return self.read(self.filename)
+
+    @staticmethod
+    def read(filename: str) -> Iterator[Dict[str, Any]]:
+        """
+        Reads the round results from a journal file without opening it for writing.
+
+        :param filename: The path of the journal file.
+        :return: Iterator over dictionaries containing the results of every round, positions as tuples.
+        """
+        with open(filename, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry: Dict[str, Any] = json.loads(line)
+                except ValueError:
+                    return
+                if entry["type"] == "round":
+                    record: Dict[str, Any] = entry["record"]
+                    record["Selected_squares"] = [tuple(pos) for pos in record["Selected_squares"]]
+                    record["Clicked_positions"] = [tuple(pos) for pos in record["Clicked_positions"]]
+                    yield record
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        """
+        Writes a single line and flushes it to the operating system.
+
+        :param entry: The entry to be written.
+        :return: None
+        """
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
@@ -0,0 +1,152 @@
+from typing import List, Dict, Tuple, Optional
+
+import numpy as np
+import hashlib
+import tempfile
+import os
+
+
+class MetricsCache(object):
+    """
+    Class for a size-bounded cache of metrics derived from result files.
+
+    Every entry is an uncompressed .npz file in the cache directory, named after the content hash
+    of the source file and the version of the code computing the metrics, so an entry is found again
+    only for an unchanged file and unchanged metrics. Entries are touched when read and the least recently
+    used ones are removed when the directory grows over its size limit.
+    """
+
+    EXTENSION: str = ".metrics.npz"
+
+    def __init__(self, cache_dir: str = "results/.cache", max_bytes: int = 256 * 2 ** 20) -> None:
+        """
+        Initializes the MetricsCache in the given directory, creating it if necessary.
+
+        :param cache_dir: The directory of the cache entries. Default is "results/.cache".
+        :param max_bytes: The maximum total size of the entries in bytes. Default is 256 MiB.
+        """
+        self.cache_dir: str = cache_dir
+        self.max_bytes: int = max_bytes
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the MetricsCache object.
+
+        :return: String representation of the MetricsCache object.
+        """
+        return f"MetricsCache in: {self.cache_dir} ({len(self._entries())} entries)"
+
+    @staticmethod
+    def fingerprint(filename: str) -> str:
+        """
+        Computes the hash of the content of a file.
+
+        :param filename: The path of the file.
+        :return: The hexadecimal BLAKE2b digest of the file content.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        with open(filename, "rb") as file:
+            for block in iter(lambda: file.read(2 ** 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def key(self, filename: str, version: int) -> str:
+        """
+        Builds the key of the metrics of a file.
+
+        :param filename: The path of the source file.
+        :param version: The version of the code computing the metrics.
+        :return: The key of the cache entry.
+        """
+        return f"{self.fingerprint(filename)}_v{version}"
+
+    def _path(self, key: str) -> str:
+        """
+        Returns the path of a cache entry.
+
+        :param key: The key of the cache entry.
+        :return: The path of the entry file.
+        """
+        return os.path.join(self.cache_dir, f"{key}{self.EXTENSION}")
+
+    def get(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Reads a cache entry and marks it as recently used.
+
+        :param key: The key of the cache entry.
+        :return: Dictionary of the cached arrays, or None if there is no (readable) entry.
+        """
+        path: str = self._path(key)
+        try:
+            with np.load(path) as entry:
+                arrays: Dict[str, np.ndarray] = {name: entry[name] for name in entry.files}
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return arrays
+
+    def put(self, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        """
+        Writes a cache entry atomically and evicts old entries if the cache is over its size limit.
+
+        :param key: The key of the cache entry.
+        :param arrays: Dictionary of the arrays to be cached.
+        :return: None
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.savez(file, **arrays)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self.evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """
+        Lists the cache entries.
+
+        :return: List of tuples of the last use time, the size and the path of every entry.
+        """
+        entries: List[Tuple[float, int, str]] = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(self.EXTENSION):
+                path: str = os.path.join(self.cache_dir, name)
+                try:
+                    stat: os.stat_result = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """
+        Removes the least recently used entries until the cache fits its size limit.
+
+        :return: The number of removed entries.
+        """
+        entries: List[Tuple[float, int, str]] = sorted(self._entries())
+        total: int = sum(size for _, size, _ in entries)
+        removed: int = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """
+        Removes all cache entries.
+
+        :return: None
+        """
+        for _, _, path in self._entries():
+            os.remove(path)
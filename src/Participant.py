@@ -0,0 +1,54 @@
+from Round import Round
+
+from abc import ABC, abstractmethod
+
+
+class Participant(ABC):
+    """
+    Interface between the session logic and whoever answers the rounds, a person at a window or a simulation.
+
+    Apart from play_round, all methods are optional hooks for displaying transitional screens.
+    """
+
+    def show_stage_start(self, stage_number: int) -> None:
+        """
+        Called before the first round of a stage.
+
+        :param stage_number: The current stage number.
+        :return: None
+        """
+
+    def show_stage_info(self, stage_number: int, round_number: int, mistakes_in_stage: int) -> None:
+        """
+        Called before each round and after each completed round.
+
+        :param stage_number: The current stage number.
+        :param round_number: The current round number.
+        :param mistakes_in_stage: The number of mistakes made in the current stage.
+        :return: None
+        """
+
+    @abstractmethod
+    def play_round(self, round_: Round) -> None:
+        """
+        Presents the round and feeds the participant's clicks into it until it has finished.
+
+        :param round_: The round to be played.
+        :return: None
+        """
+
+    def show_result(self, correct: bool) -> None:
+        """
+        Called after a round with the information whether it was completed correctly.
+
+        :param correct: True if the round was completed correctly.
+        :return: None
+        """
+
+    def show_stage_end(self, stage_number: int) -> None:
+        """
+        Called after the last round of a stage.
+
+        :param stage_number: The current stage number.
+        :return: None
+        """
@@ -1,4 +1,10 @@
-from typing import Any, List, Tuple
+from Columns import Columns
+from FigureTemplates import FigureTemplates
+from MetricsCache import MetricsCache
+from Rescorer import Rescorer
+
+from typing import List, Dict, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
 import numpy as np
@@ -11,41 +17,113 @@ class Plotter(object):
     A class to plot the experiment data.
     """
 
-    def __init__(self, csv_file: str) -> None:
+    METRICS_VERSION: int = 3
+    METRIC_COLUMNS: Tuple[str, ...] = Columns.SCALAR_COLUMNS + ("Average_time_per_square", "Accuracy",
+                                                                            "Raw_accuracy")
+
+    def __init__(self, csv_file: str, save_dir: str = "plots", templates: Optional[FigureTemplates] = None,
+                 cache: Optional[MetricsCache] = None, columns: Optional[Columns] = None) -> None:
         """
-        Initializes the Plotter with the given CSV file.
+        Initializes the Plotter with the given CSV or columnar .npz file.
 
-        :param csv_file: The path to the CSV file containing the experiment data.
+        With a cache, the data of an unchanged file is read from the cache instead of the file
+        and holds the scalar columns and the metrics only.
+
+        :param csv_file: The path to the CSV or .npz file containing the experiment data.
+        :param save_dir: The directory where the plots are saved. Default is "plots".
+        :param templates: Figure templates shared by many Plotters, which keep the figures open.
+                          Default is None (the figures are built for this Plotter and closed after saving).
+        :param cache: The cache of the derived metrics. Default is None (no caching).
+        :param columns: Columnar data already in memory (e.g. RoundRecords.columns()), plotted instead of reading
+                        csv_file, which then only names the plots. Default is None.
         """
-        self.data: pd.DataFrame = pd.read_csv(csv_file)
         self.csv_file: str = csv_file
-        self.save_dir: str = "plots"
+        self.save_dir: str = save_dir
+        self.templates: Optional[FigureTemplates] = templates
         if not os.path.exists(self.save_dir):
             os.makedirs(self.save_dir)
+        if columns is not None:
+            self.data: pd.DataFrame = self._frame_from_columns(columns)
+            return
+        if cache is None:
+            self.data = self._load_data()
+            return
+        key: str = cache.key(csv_file, self.METRICS_VERSION)
+        cached: Optional[Dict[str, np.ndarray]] = cache.get(key)
+        if cached is not None:
+            self.data = pd.DataFrame(cached)
+        else:
+            self.data = self._load_data()
+            cache.put(key, {name: self.data[name].to_numpy() for name in self.METRIC_COLUMNS})
+
+    def _load_data(self) -> pd.DataFrame:
+        """
+        Reads the experiment data and computes the metrics.
+
+        :return: Data frame with the experiment data and the computed metrics.
+        """
+        if self.csv_file.endswith(".npz"):
+            return self._frame_from_columns(Columns.load(self.csv_file, mmap=True))
+        self.data = pd.read_csv(self.csv_file)
         self._prepare_data()
+        return self.data
+
+    @staticmethod
+    def _frame_from_columns(columns: Columns) -> pd.DataFrame:
+        """
+        Builds the data frame with average time per square and accuracy directly from columnar data,
+        without parsing any strings.
+
+        :param columns: The columnar experiment data.
+        :return: Data frame with the scalar columns and the computed metrics.
+        """
+        data: pd.DataFrame = pd.DataFrame({name: np.asarray(columns[name]) for name in Columns.SCALAR_COLUMNS})
+        (data["Average_time_per_square"], data["Accuracy"],
+         data["Raw_accuracy"]) = Plotter._compute_metrics(columns)
+        return data
+
+    @staticmethod
+    def _compute_metrics(columns: Columns) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Computes the average time per square and the accuracies of every round at once.
+
+        The average time is NaN for rounds without selected squares or without clicks.
+        The accuracy is the fraction of the clicks scored by the rules of Round (see Rescorer) that hit
+        selected squares: repeated clicks on a square and clicks after the round finished are not counted.
+        The raw accuracy is the fraction of all logged clicks that hit selected squares, the accuracy
+        of metrics version 1. Both are equal for rounds recorded with Round, they differ for logs with
+        repeated or late clicks (e.g. from versions which logged every click). Both are 0 for rounds without clicks.
+
+        :param columns: The columnar experiment data.
+        :return: Tuple of the average time per square, the accuracy and the raw accuracy, one value per round.
+        """
+        rounds: int = len(columns)
+
+        times: np.ndarray = np.asarray(columns["Click_times"])
+        time_counts: np.ndarray = columns.lengths("Click_times")
+        time_sums: np.ndarray = np.bincount(columns.row_ids("Click_times"), weights=times, minlength=rounds)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            average_time: np.ndarray = np.abs(time_sums / time_counts)
+        average_time[(columns.lengths("Selected_squares") == 0) | (time_counts == 0)] = np.nan
+
+        scores: Dict[str, np.ndarray] = Rescorer().score(columns)
+        accuracy: np.ndarray = np.zeros(rounds)
+        np.divide(scores["Hits"], scores["Scored_clicks"], out=accuracy, where=scores["Scored_clicks"] > 0)
+        clicked: np.ndarray = columns.lengths("Clicked_positions")
+        raw_accuracy: np.ndarray = np.zeros(rounds)
+        np.divide(scores["Raw_hits"], clicked, out=raw_accuracy, where=clicked > 0)
+        return average_time, accuracy, raw_accuracy
 
     def _prepare_data(self) -> None:
         """
         Prepares the data by adding columns for average time per square and accuracy.
+
+        The stringified lists of the CSV file are parsed once per column with Columns.from_strings,
+        so no string is evaluated and the metrics are computed for all rounds at once.
         """
-        def average_time_per_square(row: pd.Series) -> float:
-            click_times: List[float] = eval(row["Click_times"])
-            num_squares: int = len(eval(row["Selected_squares"]))
-            if num_squares == 0:
-                return np.nan
-            return np.abs(np.mean(click_times))
-
-        def calculate_accuracy(row: pd.Series) -> float:
-            selected_squares: List[Tuple[int, int]] = eval(row["Selected_squares"])
-            clicked_positions: List[Tuple[int, int]] = eval(row["Clicked_positions"])
-            correct_clicks: int = sum([1 for pos in clicked_positions if pos in selected_squares])
-            total_clicks: int = len(clicked_positions)
-            if total_clicks == 0:
-                return 0.0
-            return correct_clicks / total_clicks
-
-        self.data["Average_time_per_square"] = self.data.apply(average_time_per_square, axis=1)
-        self.data["Accuracy"] = self.data.apply(calculate_accuracy, axis=1)
+        columns: Columns = Columns.from_strings(self.data)
+        (self.data["Average_time_per_square"], self.data["Accuracy"],
+         self.data["Raw_accuracy"]) = self._compute_metrics(columns)
 
     def _save_plot(self, fig: plt.Figure, filename: str) -> None:
         """
@@ -57,47 +135,75 @@ class Plotter(object):
         filepath: str = os.path.join(self.save_dir, filename)
         fig.savefig(filepath)
 
+    def _render(self, method: str, suffix: str) -> None:
+        """
+        Renders a plot with the shared figure templates, or with own figures which are closed afterwards.
+
+        :param method: The name of the FigureTemplates method rendering the plot.
+        :param suffix: The suffix of the plot filename.
+        """
+        templates: FigureTemplates = self.templates or FigureTemplates()
+        try:
+            fig: plt.Figure = getattr(templates, method)(self.data)
+            filename: str = os.path.splitext(os.path.basename(self.csv_file))[0]
+            self._save_plot(fig, f"{filename}_{suffix}.png")
+        finally:
+            if templates is not self.templates:
+                templates.close()
+
     def plot_average_time_per_square(self) -> None:
         """
         Plots the average time per square for each stage and saves the plot.
         """
-        stages: np.ndarray = self.data["Stage"].unique()
-        fig, axs = plt.subplots(2, 2, figsize=(15, 10))
-        axs = axs.flatten()
-        for idx in range(len(axs)):
-            if idx < len(stages):
-                stage: Any = stages[idx]
-                stage_data: pd.DataFrame = self.data[self.data["Stage"] == stage]
-                axs[idx].plot(stage_data["Round"], stage_data["Average_time_per_square"], marker="o")
-                axs[idx].set_title(f"Stage {stage} - Average time per square", fontsize=14, fontweight="bold")
-                axs[idx].set_ylabel("Average time per square [s]")
-                axs[idx].set_xlabel("Round [#]")
-                axs[idx].set_ylim(bottom=0)
-                axs[idx].grid(True, which="both", linestyle="-", linewidth=0.2)
-                axs[idx].xaxis.set_major_locator(plt.MaxNLocator(integer=True))
-                axs[idx].set_xticks(np.arange(1, stage_data["Round"].max() + 1))
-            else:
-                axs[idx].set_visible(False)
-        plt.tight_layout()
-        filename: str = os.path.splitext(os.path.basename(self.csv_file))[0]
-        self._save_plot(fig, f"{filename}_average_time_per_square.png")
+        self._render("render_average_time_per_square", "average_time_per_square")
 
     def plot_overall_average_accuracy(self) -> None:
         """
         Plots the overall average accuracy per round and saves the plot.
         """
-        rounds: np.ndarray = self.data["Round"].unique()
-        average_accuracy_per_round: pd.Series = self.data.groupby("Round")["Accuracy"].mean() * 100
-        fig, ax = plt.subplots(figsize=(10, 5))
-        ax.plot(average_accuracy_per_round.index, average_accuracy_per_round.values, marker="o")
-        ax.set_title("Overall average accuracy per round", fontsize=14, fontweight="bold")
-        ax.set_xlabel("Round [#]")
-        ax.set_ylabel("Average accuracy [%]")
-        ax.set_ylim(0, 110)
-        ax.set_xticks(np.arange(1, rounds.max() + 1))
-        ax.set_yticks(np.arange(0, 110, 10))
-        ax.grid(True, which="both", linestyle="-", linewidth=0.2)
-        ax.xaxis.set_major_locator(plt.MaxNLocator(integer=True))
-
-        filename: str = os.path.splitext(os.path.basename(self.csv_file))[0]
-        self._save_plot(fig, f"{filename}_overall_average_accuracy.png")
+        self._render("render_overall_average_accuracy", "overall_average_accuracy")
+
+    @staticmethod
+    def render_files(files: List[str], save_dir: str = "plots", cache_dir: Optional[str] = None) -> List[str]:
+        """
+        Plots the given result files one after another, reusing one set of figures.
+
+        Runs in the worker processes of render_all on the non-interactive Agg backend.
+
+        :param files: Paths of the CSV or .npz result files.
+        :param save_dir: The directory where the plots are saved. Default is "plots".
+        :param cache_dir: The directory of the metrics cache. Default is None (no caching).
+        :return: The paths of the plotted files.
+        """
+        plt.switch_backend("Agg")
+        templates: FigureTemplates = FigureTemplates()
+        cache: Optional[MetricsCache] = None if cache_dir is None else MetricsCache(cache_dir)
+        try:
+            for csv_file in files:
+                plotter: Plotter = Plotter(csv_file, save_dir, templates, cache)
+                plotter.plot_average_time_per_square()
+                plotter.plot_overall_average_accuracy()
+        finally:
+            templates.close()
+        return files
+
+    @staticmethod
+    def render_all(files: List[str], save_dir: str = "plots", workers: Optional[int] = None,
+                   chunk_size: int = 32, cache_dir: Optional[str] = None) -> int:
+        """
+        Plots many result files, spreading the chunks of files over worker processes.
+
+        :param files: Paths of the CSV or .npz result files.
+        :param save_dir: The directory where the plots are saved. Default is "plots".
+        :param workers: Number of worker processes, or None to use all CPUs.
+        :param chunk_size: Number of files plotted by a worker with the same figures. Default is 32.
+        :param cache_dir: The directory of the metrics cache. Default is None (no caching).
+        :return: The number of plotted files.
+        """
+        chunks: List[List[str]] = [files[start:start + chunk_size] for start in range(0, len(files), chunk_size)]
+        plotted: int = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for done in executor.map(Plotter.render_files, chunks, [save_dir] * len(chunks),
+                                     [cache_dir] * len(chunks)):
+                plotted += len(done)
+        return plotted
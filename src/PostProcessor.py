@@ -0,0 +1,152 @@
+from Journal import Journal
+
+from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor, Future, wait
+
+import multiprocessing
+
+
+class PostProcessor(object):
+    """
+    Class to export and plot finished sessions in a background process,
+    so the window is free for the next participant right away.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        """
+        Initializes the PostProcessor with a pool of worker processes.
+
+        The processes are started lazily with the first submitted session.
+
+        :param workers: Number of worker processes. Default is 1.
+        """
+        self.workers: int = workers
+        self.jobs: Dict[str, Future] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the PostProcessor object.
+
+        :return: String representation of the PostProcessor object.
+        """
+        return f"PostProcessor with {len(self.pending())} pending of {len(self.jobs)} submitted sessions."
+
+    @staticmethod
+    def preload() -> None:
+        """
+        Imports the analysis libraries used by process.
+
+        Runs in the worker process, so the first finished session does not wait for the imports.
+
+        :return: None
+        """
+        import matplotlib
+        matplotlib.use("Agg")
+        import Converter
+        import Plotter
+
+    def start(self) -> None:
+        """
+        Starts the worker processes and preloads the analysis libraries in the background.
+
+        Meant to be called while the participant reads the instructions, submit starts the processes too.
+        The processes are spawned rather than forked, because they are started after the window is opened
+        and a forked child would inherit the OpenGL context and the event loop of the window.
+
+        :return: None
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+            for _ in range(self.workers):
+                self._executor.submit(PostProcessor.preload)
+
+    @staticmethod
+    def process(journal_file: str, filename: str, timing: Optional[Dict[str, Any]] = None,
+                store_path: Optional[str] = None) -> str:
+        """
+        Saves the results of a finished session to CSV, TXT, JSON and NPZ files and the session store
+        and plots them.
+
+        Runs in the worker process, the analysis libraries are imported there only. The journal is read
+        once into RoundRecords, which the files, the session store and the plots are made from.
+
+        :param journal_file: The path of the session journal.
+        :param filename: The base name of the result files (without extension).
+        :param timing: Summary of the frame timing to be saved next to the results. Default is None.
+        :param store_path: The path of the session store the results are inserted into. Default is None.
+        :return: The base name of the result files.
+        """
+        import matplotlib
+        matplotlib.use("Agg")
+        from Converter import Converter
+        from Plotter import Plotter
+        from RoundRecords import RoundRecords
+
+        records: RoundRecords = RoundRecords()
+        records.extend(Journal.read(journal_file))
+        converter: Converter = Converter(records, filename)
+        converter.save(("csv", "txt", "json", "npz"))
+        if timing is not None:
+            converter.save_timing_to_json(timing)
+        if store_path is not None:
+            converter.save_to_store(store_path)
+
+        plotter: Plotter = Plotter(f"{filename}.csv", columns=records.columns())
+        plotter.plot_average_time_per_square()
+        plotter.plot_overall_average_accuracy()
+        return filename
+
+    def submit(self, journal_file: str, filename: str, timing: Optional[Dict[str, Any]] = None,
+               store_path: Optional[str] = None) -> Future:
+        """
+        Hands a finished session over to a worker process.
+
+        :param journal_file: The path of the session journal.
+        :param filename: The base name of the result files (without extension).
+        :param timing: Summary of the frame timing to be saved next to the results. Default is None.
+        :param store_path: The path of the session store the results are inserted into. Default is None.
+        :return: Future resolved with the base name of the result files.
+        """
+        self.start()
+        future: Future = self._executor.submit(PostProcessor.process, journal_file, filename, timing, store_path)
+        self.jobs[filename] = future
+        return future
+
+    def pending(self) -> List[str]:
+        """
+        Returns the sessions whose post-processing has not finished yet.
+
+        :return: List of base names of the result files.
+        """
+        return [filename for filename, future in self.jobs.items() if not future.done()]
+
+    def failed(self) -> Dict[str, BaseException]:
+        """
+        Returns the sessions whose post-processing raised an exception.
+
+        :return: Dictionary mapping base names of the result files to the exceptions.
+        """
+        return {filename: future.exception() for filename, future in self.jobs.items()
+                if future.done() and future.exception() is not None}
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the submitted sessions to be processed.
+
+        :param timeout: Maximum time to wait in seconds. Default is None (no limit).
+        :return: True if all sessions were processed.
+        """
+        _, not_done = wait(list(self.jobs.values()), timeout=timeout)
+        return not not_done
+
+    def shutdown(self) -> None:
+        """
+        Waits for all submitted sessions and stops the worker processes.
+
+        :return: None
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
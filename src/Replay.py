@@ -0,0 +1,135 @@
+from Round import Round
+from CellState import CellState
+from Colors import Colors
+from DifficultyScheduler import DifficultyScheduler
+
+from typing import List, Tuple, Dict, Any, Iterable, Iterator, Optional, Callable
+
+import os
+
+
+class Replay(object):
+    """
+    Class to replay logged sessions round by round through Round and the difficulty scheduler, without a window.
+
+    The scheduler sees the replayed rounds exactly as during the session, so the grid size of every round
+    is restored and a log which the scheduler could not have produced is detected.
+    Selected rounds can be re-rendered offscreen with matplotlib for quality assurance.
+    """
+
+    def __init__(self, difficulty: str = "step", **options: Any) -> None:
+        """
+        Initializes the Replay with the difficulty scheduler the sessions were run with.
+
+        :param difficulty: The name of the registered difficulty scheduler. Default is "step".
+        :param options: Arguments of the difficulty scheduler.
+        """
+        self.difficulty: str = difficulty
+        self.options: Dict[str, Any] = options
+        self.save_dir: str = "plots"
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Replay object.
+
+        :return: String representation of the Replay object.
+        """
+        return f"Replay with {self.difficulty} difficulty."
+
+    def rounds(self, records: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], Round]]:
+        """
+        Replays the played rounds of logged sessions.
+
+        Rounds without selected squares (recorded after the stage ended) are skipped.
+
+        :param records: Dictionaries (or RoundRecords) containing the result of every round,
+                        the rounds of every stage in order.
+        :return: Iterator over tuples of the record and the replayed Round.
+        """
+        scheduler: Optional[DifficultyScheduler] = None
+        stage: Optional[Tuple[int, int]] = None
+        for record in records:
+            if not record["Selected_squares"]:
+                continue
+            if (record["Session"], record["Stage"]) != stage:
+                stage = (record["Session"], record["Stage"])
+                scheduler = DifficultyScheduler.create(self.difficulty, **self.options)
+                scheduler.start_stage(record["Stage"] - 1)
+            grid_size, selected_squares_count = scheduler.next_round()
+            if len(record["Selected_squares"]) != selected_squares_count:
+                raise ValueError(f"Session {record['Session']}, stage {record['Stage']}, round {record['Round']} "
+                                 f"has {len(record['Selected_squares'])} squares, the {self.difficulty} scheduler "
+                                 f"selected {selected_squares_count}.")
+            round_: Round = Round.replay(grid_size, record["Selected_squares"], record["Clicked_positions"],
+                                         record["Click_times"])
+            scheduler.update(round_)
+            yield record, round_
+
+    def render(self, records: Iterable[Dict[str, Any]],
+               select: Callable[[Dict[str, Any], Round], bool] = lambda record, round_: round_.failed) -> List[str]:
+        """
+        Replays logged sessions and renders the selected rounds offscreen to PNG files.
+
+        :param records: Dictionaries (or RoundRecords) containing the result of every round.
+        :param select: Function deciding from the record and the replayed Round whether to render it.
+                       Default selects the failed rounds.
+        :return: Paths of the rendered files.
+        """
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        if not os.path.exists(self.save_dir):
+            os.makedirs(self.save_dir)
+        fig, ax = plt.subplots(figsize=(5, 5))
+        filenames: List[str] = []
+        try:
+            for record, round_ in self.rounds(records):
+                if select(record, round_):
+                    filename: str = os.path.join(self.save_dir, f"replay_{record['Session']}_{record['Stage']}"
+                                                                f"_{record['Round']}.png")
+                    self._draw_round(ax, record, round_)
+                    fig.savefig(filename, facecolor=fig.get_facecolor())
+                    filenames.append(filename)
+        finally:
+            plt.close(fig)
+        return filenames
+
+    @staticmethod
+    def _draw_round(ax: Any, record: Dict[str, Any], round_: Round) -> None:
+        """
+        Draws the final state of a round: found squares in yellow, missed squares outlined in yellow,
+        wrong clicks removed like on the screen, and the order of the clicks.
+
+        :param ax: The axes to draw on.
+        :param record: The logged result of the round.
+        :param round_: The replayed Round.
+        :return: None
+        """
+        from matplotlib.patches import Rectangle
+
+        ax.clear()
+        ax.figure.set_facecolor(Colors.BACKGROUND.value)
+        ax.set_facecolor(Colors.BACKGROUND.value)
+        order: Dict[Tuple[int, int], int] = {pos: idx + 1 for idx, pos in enumerate(round_.clicked_positions)}
+        for row in range(round_.grid_size):
+            for col in range(round_.grid_size):
+                state: CellState = CellState(round_.states[row, col])
+                if state == CellState.HIDDEN:
+                    edge: str = Colors.BLUE.value
+                    face: str = Colors.BACKGROUND.value
+                else:
+                    face = Colors.YELLOW.value if state == CellState.REVEALED else Colors.BLUE.value
+                    edge = Colors.YELLOW.value if (row, col) in round_.targets else face
+                ax.add_patch(Rectangle((col + 0.05, row + 0.05), 0.9, 0.9, facecolor=face, edgecolor=edge,
+                                       linewidth=3))
+                if (row, col) in order:
+                    ax.text(col + 0.5, row + 0.5, str(order[(row, col)]), ha="center", va="center",
+                            color=Colors.BACKGROUND.value if state == CellState.REVEALED else Colors.WHITE.value)
+        ax.set_xlim(0, round_.grid_size)
+        ax.set_ylim(0, round_.grid_size)
+        ax.set_aspect("equal")
+        ax.axis("off")
+        ax.set_title(f"Session {record['Session']}, stage {record['Stage']}, round {record['Round']}: "
+                     f"{'correct' if round_.correct else 'failed' if round_.failed else 'incomplete'}",
+                     color=Colors.WHITE.value)
@@ -0,0 +1,158 @@
+from Columns import Columns
+from Round import Round
+from DifficultyScheduler import StepScheduler
+
+from typing import List, Tuple, Dict, Optional, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+class Rescorer(object):
+    """
+    Class to re-score logged rounds with the scoring rules of Round, for all rounds of many sessions at once.
+
+    The logged clicks are fed through the rules as whole arrays: a click counts if it is the first one
+    on its square and the round has not finished before it (all squares found, or more than max_mistakes
+    mistakes). Failed rounds are counted per stage, and the rounds after the stage would have ended are marked.
+    With the default limits the scores reproduce the recorded sessions, with other limits they show
+    how the same clicks are scored under changed rules.
+    """
+
+    SCORE_COLUMNS: Tuple[str, ...] = ("Played", "Scored_clicks", "Hits", "Mistakes", "Failed", "Correct",
+                                      "Failed_in_stage", "Counted", "Changed", "Raw_hits")
+
+    def __init__(self, max_mistakes: int = Round.MAX_MISTAKES,
+                 max_failed_rounds: Optional[int] = StepScheduler.MAX_MISTAKES) -> None:
+        """
+        Initializes the Rescorer with the scoring rules.
+
+        :param max_mistakes: The number of mistakes allowed in a round, one more fails it. Default is Round's.
+        :param max_failed_rounds: The number of failed rounds ending a stage, or None if stages end only
+                                  after their last round. Default is the StepScheduler's, sessions run with
+                                  another scheduler are scored with its MAX_MISTAKES (None for the staircase).
+        """
+        self.max_mistakes: int = max_mistakes
+        self.max_failed_rounds: Optional[int] = max_failed_rounds
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Rescorer object.
+
+        :return: String representation of the Rescorer object.
+        """
+        return (f"Rescorer failing rounds after {self.max_mistakes + 1} mistakes and ending stages after "
+                f"{self.max_failed_rounds if self.max_failed_rounds is not None else 'no'} failed rounds.")
+
+    @staticmethod
+    def _segment_before(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """
+        Computes for every element the sum of the preceding elements of its segment.
+
+        :param values: The values, segment after segment.
+        :param starts: The index of the first element of the segment of every element.
+        :return: Array of exclusive segment sums, one per element.
+        """
+        before: np.ndarray = np.cumsum(values) - values
+        return before - before[starts]
+
+    def score(self, columns: Columns) -> Dict[str, np.ndarray]:
+        """
+        Scores all rounds.
+
+        Rounds without selected squares (recorded after the stage ended) are not played and score nothing.
+        Changed marks the played rounds whose scored clicks or failed rounds in the stage differ from the log.
+        Raw_hits counts all logged clicks on selected squares, including the ones the rules ignore.
+
+        :param columns: The columnar results, the rounds of every stage in order.
+        :return: Dictionary with an array per score column, one value per round.
+        """
+        rounds: int = len(columns)
+        selected: np.ndarray = columns.lengths("Selected_squares")
+        clicked: np.ndarray = columns.lengths("Clicked_positions")
+        click_rounds: np.ndarray = columns.row_ids("Clicked_positions")
+        grid_span: int = int(max(np.max(columns["Selected_squares"], initial=0),
+                                 np.max(columns["Clicked_positions"], initial=0))) + 1
+
+        def keys(name: str) -> np.ndarray:
+            positions: np.ndarray = np.asarray(columns[name], dtype=np.int64)
+            return (columns.row_ids(name) * grid_span + positions[:, 0]) * grid_span + positions[:, 1]
+
+        click_keys: np.ndarray = keys("Clicked_positions")
+        hit: np.ndarray = np.isin(click_keys, keys("Selected_squares"))
+        first: np.ndarray = np.zeros(len(click_keys), dtype=bool)
+        first[np.unique(click_keys, return_index=True)[1]] = True
+
+        round_starts: np.ndarray = np.asarray(columns["Clicked_positions_offsets"])[click_rounds]
+        hits_before: np.ndarray = self._segment_before((first & hit).astype(np.int64), round_starts)
+        mistakes_before: np.ndarray = self._segment_before((first & ~hit).astype(np.int64), round_starts)
+        scored: np.ndarray = first & (hits_before < selected[click_rounds]) & (mistakes_before <= self.max_mistakes)
+
+        hits: np.ndarray = np.bincount(click_rounds, weights=scored & hit, minlength=rounds).astype(np.int64)
+        mistakes: np.ndarray = np.bincount(click_rounds, weights=scored & ~hit, minlength=rounds).astype(np.int64)
+        scored_clicks: np.ndarray = hits + mistakes
+        raw_hits: np.ndarray = np.bincount(click_rounds, weights=hit, minlength=rounds).astype(np.int64)
+        played: np.ndarray = selected > 0
+        failed: np.ndarray = played & (mistakes > self.max_mistakes)
+        correct: np.ndarray = played & ~failed & (hits == selected)
+
+        sessions: np.ndarray = np.asarray(columns["Session"])
+        stages: np.ndarray = np.asarray(columns["Stage"])
+        new_stage: np.ndarray = np.ones(rounds, dtype=bool)
+        new_stage[1:] = (sessions[1:] != sessions[:-1]) | (stages[1:] != stages[:-1])
+        stage_starts: np.ndarray = np.flatnonzero(new_stage)[np.cumsum(new_stage) - 1]
+        failed_before: np.ndarray = self._segment_before(failed.astype(np.int64), stage_starts)
+        failed_in_stage: np.ndarray = failed_before + failed
+        counted: np.ndarray = played.copy()
+        if self.max_failed_rounds is not None:
+            counted &= failed_before < self.max_failed_rounds
+        changed: np.ndarray = played & ((scored_clicks != clicked)
+                                        | (failed_in_stage != np.asarray(columns["Mistakes_in_stage"])))
+
+        return {"Played": played, "Scored_clicks": scored_clicks, "Hits": hits, "Mistakes": mistakes,
+                "Failed": failed, "Correct": correct, "Failed_in_stage": failed_in_stage, "Counted": counted,
+                "Changed": changed, "Raw_hits": raw_hits}
+
+    def score_file(self, filename: str) -> Dict[str, np.ndarray]:
+        """
+        Scores all rounds of a result file.
+
+        :param filename: The path of the CSV or .npz file.
+        :return: Dictionary with an array per scalar and score column, one value per round.
+        """
+        from Cohort import Cohort
+
+        columns: Columns = Cohort.load(filename)
+        scores: Dict[str, np.ndarray] = {name: np.asarray(columns[name]) for name in Columns.SCALAR_COLUMNS}
+        scores.update(self.score(columns))
+        return scores
+
+    def score_files(self, files: List[str]) -> List[Tuple[str, Dict[str, np.ndarray]]]:
+        """
+        Scores result files one at a time.
+
+        Runs in the worker processes.
+
+        :param files: Paths of the result files.
+        :return: List of tuples of the path and the scores of every file.
+        """
+        return [(filename, self.score_file(filename)) for filename in files]
+
+    def rescore_all(self, files: List[str], workers: Optional[int] = None,
+                    chunk_size: int = 16) -> Iterator[Tuple[str, Dict[str, np.ndarray]]]:
+        """
+        Scores many result files in chunks in a pool of worker processes.
+
+        :param files: Paths of the CSV or .npz result files.
+        :param workers: Number of worker processes, or None to use all CPUs. 1 scores in this process.
+        :param chunk_size: Number of files scored by a worker at once. Default is 16.
+        :return: Iterator over tuples of the path and the scores of every file, in the order of the files.
+        """
+        chunks: List[List[str]] = [files[start:start + chunk_size] for start in range(0, len(files), chunk_size)]
+        if workers == 1:
+            for chunk in chunks:
+                yield from self.score_files(chunk)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for scored in executor.map(self.score_files, chunks):
+                yield from scored
@@ -0,0 +1,106 @@
+from CellState import CellState
+
+from typing import List, Tuple, Set, Optional
+
+import numpy as np
+
+
+class Round(object):
+    """
+    Class to hold the state and scoring rules of a single round, independent of any display.
+
+    The same rules are applied to logged rounds by Replay (round by round) and Rescorer (vectorized).
+    """
+
+    MAX_MISTAKES: int = 1
+
+    def __init__(self, grid_size: int, selected_squares: List[Tuple[int, int]]) -> None:
+        """
+        Initializes the Round with the grid size and the squares to be memorized.
+
+        :param grid_size: The size of the grid (number of rows and columns).
+        :param selected_squares: List of tuples indicating the positions of the highlighted squares.
+        """
+        self.grid_size: int = grid_size
+        self.selected_squares: List[Tuple[int, int]] = selected_squares
+        self.targets: Set[Tuple[int, int]] = set(selected_squares)
+        self.states: np.ndarray = np.zeros((grid_size, grid_size), dtype=np.int8)
+        self.clicked_positions: List[Tuple[int, int]] = []
+        self.click_times: List[float] = []
+        self.correct_clicks: int = 0
+        self.mistakes: int = 0
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Round object.
+
+        :return: String representation of the Round object.
+        """
+        return f"Round with {len(self.selected_squares)} squares on a {self.grid_size}x{self.grid_size} grid."
+
+    @classmethod
+    def replay(cls, grid_size: int, selected_squares: List[Tuple[int, int]],
+               clicked_positions: List[Tuple[int, int]], click_times: List[float]) -> "Round":
+        """
+        Rebuilds a round by feeding logged clicks through the scoring rules.
+
+        :param grid_size: The size of the grid (number of rows and columns).
+        :param selected_squares: Positions of the highlighted squares.
+        :param clicked_positions: Positions clicked by the participant, in order.
+        :param click_times: Times of the clicks in seconds since the response grid was shown.
+        :return: The replayed Round.
+        """
+        round_: Round = cls(grid_size, [tuple(pos) for pos in selected_squares])
+        for pos, click_time in zip(clicked_positions, click_times):
+            round_.click(tuple(pos), click_time)
+        return round_
+
+    def click(self, cell: Optional[Tuple[int, int]], click_time: float) -> Optional[CellState]:
+        """
+        Registers a click on a square.
+
+        Clicks outside the grid, on already revealed or hidden squares, or after the round has finished are ignored.
+
+        :param cell: The (row, col) position of the clicked square, or None if no square was hit.
+        :param click_time: Time of the click in seconds since the response grid was shown.
+        :return: The new state of the clicked square, or None if the click was ignored.
+        """
+        if cell is None or self.finished or self.states[cell] != CellState.BLANK:
+            return None
+        if cell in self.targets:
+            state: CellState = CellState.REVEALED
+            self.correct_clicks += 1
+        else:
+            state = CellState.HIDDEN
+            self.mistakes += 1
+        self.states[cell] = state
+        self.clicked_positions.append(cell)
+        self.click_times.append(click_time)
+        return state
+
+    @property
+    def finished(self) -> bool:
+        """
+        Checks whether the round has finished, either by finding all squares or by a second mistake.
+
+        :return: True if no more clicks are accepted.
+        """
+        return self.correct_clicks == len(self.selected_squares) or self.failed
+
+    @property
+    def failed(self) -> bool:
+        """
+        Checks whether the round was interrupted by a second mistake.
+
+        :return: True if the round was failed.
+        """
+        return self.mistakes > self.MAX_MISTAKES
+
+    @property
+    def correct(self) -> bool:
+        """
+        Checks whether all highlighted squares were found with at most one mistake.
+
+        :return: True if the round was completed correctly.
+        """
+        return not self.failed and self.targets.issubset(self.clicked_positions)
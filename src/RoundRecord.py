@@ -0,0 +1,80 @@
+from typing import List, Tuple, Dict, Any
+
+
+class RoundRecord(object):
+    """
+    Class for the result of a single round.
+
+    The fields are stored in slots instead of a per-instance dictionary. The fields can also be read
+    by the column names of the result files (e.g. record["Click_times"]), like the result dictionaries.
+    """
+
+    __slots__ = ("session", "stage", "round", "selected_squares", "clicked_positions", "mistakes_in_stage",
+                 "click_times")
+
+    COLUMNS: Dict[str, str] = {
+        "Session": "session",
+        "Stage": "stage",
+        "Round": "round",
+        "Selected_squares": "selected_squares",
+        "Clicked_positions": "clicked_positions",
+        "Mistakes_in_stage": "mistakes_in_stage",
+        "Click_times": "click_times",
+    }
+
+    def __init__(self, session: int, stage: int, round: int, selected_squares: List[Tuple[int, int]],
+                 clicked_positions: List[Tuple[int, int]], mistakes_in_stage: int, click_times: List[float]) -> None:
+        """
+        Initializes the RoundRecord with the result of a round.
+
+        :param session: The session number.
+        :param stage: The stage number (from 1).
+        :param round: The round number (from 1).
+        :param selected_squares: Positions of the highlighted squares.
+        :param clicked_positions: Positions clicked by the participant.
+        :param mistakes_in_stage: The number of mistakes made in the stage.
+        :param click_times: Times of the clicks in seconds since the response grid was shown.
+        """
+        self.session: int = session
+        self.stage: int = stage
+        self.round: int = round
+        self.selected_squares: List[Tuple[int, int]] = selected_squares
+        self.clicked_positions: List[Tuple[int, int]] = clicked_positions
+        self.mistakes_in_stage: int = mistakes_in_stage
+        self.click_times: List[float] = click_times
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the RoundRecord object.
+
+        :return: String representation of the RoundRecord object.
+        """
+        return (f"RoundRecord of session {self.session}, stage {self.stage}, round {self.round} "
+                f"with {len(self.clicked_positions)} clicks.")
+
+    def __getitem__(self, name: str) -> Any:
+        """
+        Return a field by the column name of the result files.
+
+        :param name: The column name, e.g. "Click_times".
+        :return: The value of the field.
+        """
+        return getattr(self, self.COLUMNS[name])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the record to a result dictionary, as written by the writers and the journal.
+
+        :return: Dictionary with the column names as keys.
+        """
+        return {name: getattr(self, field) for name, field in self.COLUMNS.items()}
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "RoundRecord":
+        """
+        Builds the record from a result dictionary.
+
+        :param record: Dictionary with the column names as keys.
+        :return: The built RoundRecord.
+        """
+        return cls(*(record[name] for name in cls.COLUMNS))
@@ -0,0 +1,195 @@
+from Columns import Columns
+from RoundRecord import RoundRecord
+
+from typing import List, Tuple, Dict, Any, Iterable, Iterator, Union
+
+import numpy as np
+
+
+class RoundRecords(object):
+    """
+    Class to hold the results of many rounds in preallocated typed buffers.
+
+    The buffers have the layout of Columns: one int32 array per scalar column, and for every ragged column
+    a flat array of values (int16 positions, float64 times) with int64 offsets. They grow by doubling,
+    so appending a round costs amortized constant time, and columns returns views of the filled part,
+    which Converter and Plotter consume without copying.
+    """
+
+    ITER_CHUNK: int = 1024
+
+    def __init__(self, rounds: int = 64, values: int = 256) -> None:
+        """
+        Initializes empty RoundRecords with the given capacity.
+
+        :param rounds: Initial number of rounds the buffers hold. Default is 64.
+        :param values: Initial number of values of every ragged column the buffers hold. Default is 256.
+        """
+        self.size: int = 0
+        self.arrays: Dict[str, np.ndarray] = {name: np.zeros(rounds, dtype=np.int32) for name in Columns.SCALAR_COLUMNS}
+        for name in Columns.POSITION_COLUMNS:
+            self.arrays[name] = np.zeros((values, 2), dtype=np.int16)
+        for name in Columns.TIME_COLUMNS:
+            self.arrays[name] = np.zeros(values, dtype=np.float64)
+        for name in Columns.POSITION_COLUMNS + Columns.TIME_COLUMNS:
+            self.arrays[f"{name}_offsets"] = np.zeros(rounds + 1, dtype=np.int64)
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the RoundRecords object.
+
+        :return: String representation of the RoundRecords object.
+        """
+        return f"RoundRecords with {self.size} rounds (capacity {len(self.arrays['Round'])})."
+
+    def __len__(self) -> int:
+        """
+        Return the number of rounds.
+
+        :return: Number of rounds.
+        """
+        return self.size
+
+    def __getitem__(self, index: int) -> RoundRecord:
+        """
+        Return the result of a single round.
+
+        :param index: The index of the round.
+        :return: The RoundRecord of the round.
+        """
+        if not -self.size <= index < self.size:
+            raise IndexError(f"Round index {index} out of range for {self.size} rounds.")
+        index %= self.size
+        fields: Dict[str, Any] = {name: int(self.arrays[name][index]) for name in Columns.SCALAR_COLUMNS}
+        for name in Columns.POSITION_COLUMNS + Columns.TIME_COLUMNS:
+            offsets: np.ndarray = self.arrays[f"{name}_offsets"]
+            values: List[Any] = self.arrays[name][offsets[index]:offsets[index + 1]].tolist()
+            fields[name] = [tuple(pos) for pos in values] if name in Columns.POSITION_COLUMNS else values
+        return RoundRecord.from_dict(fields)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over the results as dictionaries, converted in chunks of rounds.
+
+        :return: Iterator over dictionaries containing the result of every round.
+        """
+        for start in range(0, self.size, self.ITER_CHUNK):
+            yield from self._slice(start, min(start + self.ITER_CHUNK, self.size)).to_records()
+
+    def __getstate__(self) -> Dict[str, np.ndarray]:
+        """
+        Return the filled part of the buffers for pickling, e.g. to send the results between processes.
+
+        :return: Dictionary of the arrays of the columns.
+        """
+        return self.columns().arrays
+
+    def __setstate__(self, state: Dict[str, np.ndarray]) -> None:
+        """
+        Restores the RoundRecords from pickled arrays.
+
+        :param state: Dictionary of the arrays of the columns.
+        :return: None
+        """
+        self.arrays = state
+        self.size = len(state["Round"])
+
+    @classmethod
+    def from_columns(cls, columns: Columns) -> "RoundRecords":
+        """
+        Wraps columnar results, e.g. loaded from an .npz file, using their arrays as the buffers.
+
+        :param columns: The columnar results.
+        :return: The RoundRecords.
+        """
+        records: RoundRecords = cls.__new__(cls)
+        records.__setstate__(dict(columns.arrays))
+        return records
+
+    def columns(self) -> Columns:
+        """
+        Returns views of the filled part of the buffers.
+
+        The views are valid until the next append, which may move the buffers.
+
+        :return: The columnar results.
+        """
+        return self._slice(0, self.size)
+
+    def _slice(self, start: int, stop: int) -> Columns:
+        """
+        Returns views of the buffers for a range of rounds.
+
+        :param start: The index of the first round.
+        :param stop: The index after the last round.
+        :return: The columnar results of the rounds, with offsets starting at 0.
+        """
+        arrays: Dict[str, np.ndarray] = {name: self.arrays[name][start:stop] for name in Columns.SCALAR_COLUMNS}
+        for name in Columns.POSITION_COLUMNS + Columns.TIME_COLUMNS:
+            offsets: np.ndarray = self.arrays[f"{name}_offsets"][start:stop + 1]
+            arrays[name] = self.arrays[name][offsets[0]:offsets[-1]]
+            arrays[f"{name}_offsets"] = offsets - offsets[0] if start else offsets
+        return Columns(arrays)
+
+    def _reserve(self, rounds: int, values: Dict[str, int]) -> None:
+        """
+        Grows the buffers, doubling their capacity, so they hold the given number of additional values.
+
+        :param rounds: Number of additional rounds.
+        :param values: Number of additional values of every ragged column.
+        :return: None
+        """
+        def grow(name: str, needed: int) -> None:
+            array: np.ndarray = self.arrays[name]
+            if needed > len(array):
+                grown: np.ndarray = np.zeros((max(needed, 2 * len(array)),) + array.shape[1:], dtype=array.dtype)
+                grown[:len(array)] = array
+                self.arrays[name] = grown
+
+        for name in Columns.SCALAR_COLUMNS:
+            grow(name, self.size + rounds)
+        for name, count in values.items():
+            grow(f"{name}_offsets", self.size + rounds + 1)
+            grow(name, int(self.arrays[f"{name}_offsets"][self.size]) + count)
+
+    def append(self, record: Union[RoundRecord, Dict[str, Any]]) -> None:
+        """
+        Appends the result of a round.
+
+        :param record: RoundRecord or dictionary containing the result of the round.
+        :return: None
+        """
+        ragged: Dict[str, Any] = {name: record[name] for name in Columns.POSITION_COLUMNS + Columns.TIME_COLUMNS}
+        self._reserve(1, {name: len(values) for name, values in ragged.items()})
+        for name in Columns.SCALAR_COLUMNS:
+            self.arrays[name][self.size] = record[name]
+        for name, values in ragged.items():
+            offsets: np.ndarray = self.arrays[f"{name}_offsets"]
+            start: int = int(offsets[self.size])
+            offsets[self.size + 1] = start + len(values)
+            if values:
+                self.arrays[name][start:start + len(values)] = values
+        self.size += 1
+
+    def extend(self, records: Union["RoundRecords", Iterable[Union[RoundRecord, Dict[str, Any]]]]) -> None:
+        """
+        Appends the results of many rounds, copying the buffers at once if they are RoundRecords.
+
+        :param records: RoundRecords, or RoundRecords or dictionaries containing the result of every round.
+        :return: None
+        """
+        if not isinstance(records, RoundRecords):
+            for record in records:
+                self.append(record)
+            return
+        columns: Columns = records.columns()
+        ragged: Tuple[str, ...] = Columns.POSITION_COLUMNS + Columns.TIME_COLUMNS
+        self._reserve(len(columns), {name: len(columns[name]) for name in ragged})
+        for name in Columns.SCALAR_COLUMNS:
+            self.arrays[name][self.size:self.size + len(columns)] = columns[name]
+        for name in ragged:
+            offsets: np.ndarray = self.arrays[f"{name}_offsets"]
+            start: int = int(offsets[self.size])
+            offsets[self.size + 1:self.size + len(columns) + 1] = columns[f"{name}_offsets"][1:] + start
+            self.arrays[name][start:start + len(columns[name])] = columns[name]
+        self.size += len(columns)
@@ -0,0 +1,147 @@
+from typing import List, Tuple, Optional
+
+import numpy as np
+
+
+class Schedule(object):
+    """
+    Class to hold the precomputed positions of the highlighted squares for every stage, round and grid size.
+
+    For every stage, round and grid size a random permutation of the grid cells is stored,
+    the first n cells of it are the n squares highlighted in that round.
+    """
+
+    MIN_GRID_SIZE: int = 3
+
+    def __init__(self, permutations: np.ndarray, seed: int) -> None:
+        """
+        Initializes the Schedule with precomputed permutations.
+
+        :param permutations: Array of shape (stages, rounds, grid sizes, cells) with flat cell indices, padded with -1.
+        :param seed: Seed the permutations were generated from.
+        """
+        self.permutations: np.ndarray = permutations
+        self.seed: int = seed
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Schedule object.
+
+        :return: String representation of the Schedule object.
+        """
+        stages, rounds, grid_sizes, _ = self.permutations.shape
+        return (f"Schedule for {stages} stages, {rounds} rounds per stage and grids up to "
+                f"{self.max_grid_size}x{self.max_grid_size} (seed {self.seed}).")
+
+    @property
+    def max_grid_size(self) -> int:
+        """
+        Returns the largest grid size covered by the schedule.
+
+        :return: The largest grid size.
+        """
+        return self.MIN_GRID_SIZE + self.permutations.shape[2] - 1
+
+    @staticmethod
+    def max_grid_size_for(max_squares: int) -> int:
+        """
+        Returns the largest grid size reached when the grid grows once the squares fill half of it.
+
+        :param max_squares: The largest number of highlighted squares in a round.
+        :return: The largest grid size.
+        """
+        grid_size: int = Schedule.MIN_GRID_SIZE
+        while grid_size * grid_size <= 2 * max_squares:
+            grid_size += 1
+        return grid_size
+
+    @classmethod
+    def generate(cls, stages: int, rounds_per_stage: int, max_grid_size: Optional[int] = None,
+                 seed: Optional[int] = None) -> "Schedule":
+        """
+        Generates the schedule with vectorized sampling from a seeded generator.
+
+        :param stages: Number of stages.
+        :param rounds_per_stage: Number of rounds per stage.
+        :param max_grid_size: The largest grid size. Default is the size reached by the default difficulty rule.
+        :param seed: Seed of the generator. Default is a random seed.
+        :return: The generated Schedule.
+        """
+        seed = np.random.SeedSequence().entropy if seed is None else seed
+        if max_grid_size is None:
+            max_grid_size = cls.max_grid_size_for(cls.MIN_GRID_SIZE + rounds_per_stage - 1)
+        rng: np.random.Generator = np.random.default_rng(seed)
+        grid_sizes: range = range(cls.MIN_GRID_SIZE, max_grid_size + 1)
+        permutations: np.ndarray = np.full((stages, rounds_per_stage, len(grid_sizes), max_grid_size * max_grid_size),
+                                           -1, dtype=np.int16)
+        for idx, grid_size in enumerate(grid_sizes):
+            keys: np.ndarray = rng.random((stages, rounds_per_stage, grid_size * grid_size))
+            permutations[:, :, idx, :grid_size * grid_size] = np.argsort(keys, axis=-1)
+        return cls(permutations, seed)
+
+    def get(self, stage_number: int, round_number: int, grid_size: int, count: int) -> List[Tuple[int, int]]:
+        """
+        Returns the highlighted squares of a round.
+
+        :param stage_number: The current stage number.
+        :param round_number: The current round number.
+        :param grid_size: The size of the grid (number of rows and columns).
+        :param count: Number of highlighted squares.
+        :return: List of (row, col) positions of the highlighted squares.
+        """
+        if count > grid_size * grid_size:
+            raise ValueError(f"Cannot select {count} squares on a {grid_size}x{grid_size} grid.")
+        cells: np.ndarray = self.permutations[stage_number, round_number, grid_size - self.MIN_GRID_SIZE, :count]
+        rows, cols = np.divmod(cells, grid_size)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def check(self, stages: int, rounds_per_stage: int, max_grid_size: int) -> None:
+        """
+        Checks that the schedule covers an experiment and holds a permutation of the cells of every grid,
+        e.g. after loading a schedule file which may be stale or edited by hand.
+
+        :param stages: Number of stages of the experiment.
+        :param rounds_per_stage: Number of rounds per stage.
+        :param max_grid_size: The largest grid size the difficulty scheduler can reach.
+        :return: None
+        """
+        if self.permutations.ndim != 4:
+            raise ValueError(f"The schedule has {self.permutations.ndim} dimensions instead of 4 "
+                             f"(stages, rounds, grid sizes, cells).")
+        schedule_stages, schedule_rounds, grid_sizes, cells = self.permutations.shape
+        if schedule_stages < stages or schedule_rounds < rounds_per_stage or self.max_grid_size < max_grid_size:
+            raise ValueError(f"The schedule covers {schedule_stages} stages, {schedule_rounds} rounds per stage "
+                             f"and grids up to {self.max_grid_size}x{self.max_grid_size}, the experiment needs "
+                             f"{stages} stages, {rounds_per_stage} rounds per stage and grids up to "
+                             f"{max_grid_size}x{max_grid_size}.")
+        if cells != self.max_grid_size * self.max_grid_size:
+            raise ValueError(f"The schedule has {cells} cells per grid, grids up to "
+                             f"{self.max_grid_size}x{self.max_grid_size} need {self.max_grid_size ** 2}.")
+        for idx in range(grid_sizes):
+            grid_size: int = self.MIN_GRID_SIZE + idx
+            cell_count: int = grid_size * grid_size
+            permutations: np.ndarray = self.permutations[:, :, idx, :]
+            if (np.any(np.sort(permutations[..., :cell_count], axis=-1) != np.arange(cell_count))
+                    or np.any(permutations[..., cell_count:] != -1)):
+                raise ValueError(f"The schedule of the {grid_size}x{grid_size} grid is not a permutation "
+                                 f"of its cells.")
+
+    def save(self, filename: str) -> None:
+        """
+        Saves the schedule to a compressed NumPy file.
+
+        :param filename: The path of the file (with the .npz extension).
+        :return: None
+        """
+        np.savez_compressed(filename, permutations=self.permutations, seed=str(self.seed))
+
+    @classmethod
+    def load(cls, filename: str) -> "Schedule":
+        """
+        Loads a schedule saved with save.
+
+        :param filename: The path of the file (with the .npz extension).
+        :return: The loaded Schedule.
+        """
+        with np.load(filename) as data:
+            return cls(data["permutations"], int(str(data["seed"])))
@@ -0,0 +1,141 @@
+from Participant import Participant
+from Round import Round
+from Schedule import Schedule
+from DifficultyScheduler import DifficultyScheduler, StepScheduler
+from RoundRecord import RoundRecord
+from RoundRecords import RoundRecords
+
+from typing import List, Tuple, Dict, Any, Optional
+
+
+class Session(object):
+    """
+    Class to run the stages and rounds of a single session and collect the results,
+    independent of how the rounds are presented and answered.
+    """
+
+    def __init__(self, participant: Participant, session_number: int = 1, stages: int = 1,
+                 rounds_per_stage: int = 5, schedule: Optional[Schedule] = None,
+                 results_list: Optional[Any] = None, difficulty: Optional[DifficultyScheduler] = None) -> None:
+        """
+        Initializes the Session with the participant and the experiment parameters.
+
+        :param participant: The participant answering the rounds.
+        :param session_number: Number of the session stored in the results. Default is 1.
+        :param stages: Number of stages in the session. Default is 1.
+        :param rounds_per_stage: Number of rounds per stage. Default is 5.
+        :param schedule: Precomputed positions of the highlighted squares. Default is a newly generated one.
+        :param results_list: Object with an append method receiving every round result as a RoundRecord,
+                             e.g. a Journal. Default is new RoundRecords.
+        :param difficulty: The scheduler of the difficulty of the rounds. Default is the StepScheduler.
+        """
+        self.participant: Participant = participant
+        self.session_number: int = session_number
+        self.stages: int = stages
+        self.rounds_per_stage: int = rounds_per_stage
+        self.difficulty: DifficultyScheduler = StepScheduler() if difficulty is None else difficulty
+        self.schedule: Schedule = (Schedule.generate(stages, rounds_per_stage,
+                                                     self.difficulty.max_grid_size(rounds_per_stage))
+                                   if schedule is None else schedule)
+        if self.schedule.max_grid_size < self.difficulty.max_grid_size(rounds_per_stage):
+            raise ValueError(f"{self.schedule} does not cover the grids up to "
+                             f"{self.difficulty.max_grid_size(rounds_per_stage)} reached by {self.difficulty}.")
+        self.results_list: Any = RoundRecords() if results_list is None else results_list
+        self.spans: List[Optional[float]] = []
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Session object.
+
+        :return: String representation of the Session object.
+        """
+        return f"Session {self.session_number} with {self.stages} stages and {self.rounds_per_stage} rounds per stage."
+
+    def _record(self, stage_number: int, round_number: int, selected_squares: List[Tuple[int, int]],
+                clicked_positions: List[Tuple[int, int]], mistakes_in_stage: int,
+                click_times: List[float]) -> None:
+        """
+        Appends a single round result to the results list.
+
+        :param stage_number: The current stage number.
+        :param round_number: The current round number.
+        :param selected_squares: Positions of the highlighted squares.
+        :param clicked_positions: Positions clicked by the participant.
+        :param mistakes_in_stage: The number of mistakes made in the current stage.
+        :param click_times: Times of the clicks in seconds since the response grid was shown.
+        :return: None
+        """
+        self.results_list.append(RoundRecord(self.session_number, stage_number + 1, round_number + 1,
+                                             selected_squares, clicked_positions, mistakes_in_stage, click_times))
+
+    def run(self, completed: Optional[List[Dict[str, Any]]] = None) -> Any:
+        """
+        Runs all stages and rounds of the session.
+
+        :param completed: Results of rounds already played in an interrupted session, in order.
+                          They are replayed to restore the state and the session continues with the next round.
+        :return: The results list with the results of every round.
+        """
+        completed = completed or []
+        for stage_number in range(self.stages):
+            stage_completed: List[Dict[str, Any]] = [record for record in completed
+                                                     if record["Stage"] == stage_number + 1]
+            if len(stage_completed) < self.rounds_per_stage:
+                self._run_stage(stage_number, stage_completed)
+
+        return self.results_list
+
+    def _run_stage(self, stage_number: int, completed: List[Dict[str, Any]]) -> None:
+        """
+        Runs the rounds of a single stage.
+
+        :param stage_number: The current stage number.
+        :param completed: Results of rounds of this stage already played, replayed without the participant.
+        :return: None
+        """
+        if not completed:
+            self.participant.show_stage_start(stage_number)
+        self.difficulty.start_stage(stage_number)
+        mistakes_in_stage: int = 0
+
+        for round_number in range(self.rounds_per_stage):
+            replayed: bool = round_number < len(completed)
+            if not replayed:
+                self.participant.show_stage_info(stage_number, round_number, mistakes_in_stage)
+
+            grid_size, selected_squares_count = self.difficulty.next_round()
+
+            if replayed:
+                record: Dict[str, Any] = completed[round_number]
+                round_: Round = Round.replay(grid_size, record["Selected_squares"], record["Clicked_positions"],
+                                             record["Click_times"])
+            else:
+                selected_squares: List[Tuple[int, int]] = self.schedule.get(stage_number, round_number, grid_size,
+                                                                            selected_squares_count)
+                round_ = Round(grid_size, selected_squares)
+                self.participant.play_round(round_)
+            self.difficulty.update(round_)
+
+            if round_.failed:
+                mistakes_in_stage += 1
+                if not replayed:
+                    self.participant.show_result(False)
+                    self._record(stage_number, round_number, round_.selected_squares, round_.clicked_positions,
+                                 mistakes_in_stage, round_.click_times)
+                if self.difficulty.finished(mistakes_in_stage):
+                    break
+                continue
+
+            if not replayed:
+                self._record(stage_number, round_number, round_.selected_squares, round_.clicked_positions,
+                             mistakes_in_stage, round_.click_times)
+                self.participant.show_result(round_.correct)
+                self.participant.show_stage_info(stage_number, round_number, mistakes_in_stage)
+            if self.difficulty.finished(mistakes_in_stage):
+                break
+
+        for remaining_round in range(max(round_number + 1, len(completed)), self.rounds_per_stage):
+            self._record(stage_number, remaining_round, [], [], mistakes_in_stage, [])
+
+        self.spans.append(self.difficulty.span())
+        self.participant.show_stage_end(stage_number)
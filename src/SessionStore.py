@@ -0,0 +1,172 @@
+from Columns import Columns
+
+from typing import List, Tuple, Dict, Any, Iterable, Optional, Sequence, TYPE_CHECKING
+
+import sqlite3
+import datetime
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class SessionStore(object):
+    """
+    Class to keep the results of all sessions in a local SQLite database.
+
+    Every session gets its own id when it starts, rounds are indexed by session, stage and round.
+    Positions and click times are stored as binary arrays (int16 pairs and float64 values).
+    """
+
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TEXT NOT NULL,
+            label TEXT
+        );
+        CREATE TABLE IF NOT EXISTS rounds (
+            session_id INTEGER NOT NULL REFERENCES sessions (session_id),
+            stage INTEGER NOT NULL,
+            round INTEGER NOT NULL,
+            mistakes_in_stage INTEGER NOT NULL,
+            selected_squares BLOB NOT NULL,
+            clicked_positions BLOB NOT NULL,
+            click_times BLOB NOT NULL,
+            PRIMARY KEY (session_id, stage, round)
+        );
+        CREATE INDEX IF NOT EXISTS rounds_stage_round ON rounds (stage, round);
+    """
+
+    def __init__(self, path: str = "results/sessions.sqlite") -> None:
+        """
+        Opens the database, creating it if needed.
+
+        :param path: The path of the database file. Default is "results/sessions.sqlite".
+        """
+        self.path: str = path
+        self.connection: sqlite3.Connection = sqlite3.connect(path, timeout=30)
+        self.connection.executescript(self.SCHEMA)
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the SessionStore object.
+
+        :return: String representation of the SessionStore object.
+        """
+        return f"SessionStore in: {self.path}"
+
+    def close(self) -> None:
+        """
+        Closes the database.
+
+        :return: None
+        """
+        self.connection.close()
+
+    def new_session(self, label: Optional[str] = None) -> int:
+        """
+        Registers a new session.
+
+        :param label: Optional description of the session, e.g. the station name. Default is None.
+        :return: The id of the new session.
+        """
+        with self.connection:
+            cursor: sqlite3.Cursor = self.connection.execute(
+                "INSERT INTO sessions (started_at, label) VALUES (?, ?)",
+                (datetime.datetime.now().isoformat(timespec="seconds"), label))
+        return int(cursor.lastrowid)
+
+    def insert(self, results_list: Iterable[Dict[str, Any]], session_id: Optional[int] = None) -> int:
+        """
+        Inserts round results in a single transaction, replacing rounds that are already stored.
+
+        :param results_list: Dictionaries containing the results of every round.
+        :param session_id: The id under which the rounds are stored. Default is the Session value of every result.
+        :return: Number of inserted rounds.
+        """
+        rows: List[Tuple[Any, ...]] = [
+            (result["Session"] if session_id is None else session_id, result["Stage"], result["Round"],
+             result["Mistakes_in_stage"],
+             np.asarray(result["Selected_squares"], dtype=np.int16).reshape(-1, 2).tobytes(),
+             np.asarray(result["Clicked_positions"], dtype=np.int16).reshape(-1, 2).tobytes(),
+             np.asarray(result["Click_times"], dtype=np.float64).tobytes())
+            for result in results_list]
+        started_at: str = datetime.datetime.now().isoformat(timespec="seconds")
+        with self.connection:
+            self.connection.executemany("INSERT OR IGNORE INTO sessions (session_id, started_at) VALUES (?, ?)",
+                                        [(sid, started_at) for sid in sorted({row[0] for row in rows})])
+            self.connection.executemany("INSERT OR REPLACE INTO rounds VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def sessions(self) -> "pd.DataFrame":
+        """
+        Returns the registered sessions.
+
+        :return: DataFrame with the session id, start time, label and number of stored rounds.
+        """
+        import pandas as pd
+
+        return pd.read_sql_query("SELECT s.session_id, s.started_at, s.label, COUNT(r.round) AS rounds "
+                                 "FROM sessions s LEFT JOIN rounds r ON r.session_id = s.session_id "
+                                 "GROUP BY s.session_id ORDER BY s.session_id", self.connection)
+
+    def _select(self, session_ids: Optional[Sequence[int]], stages: Optional[Sequence[int]],
+                rounds: Optional[Sequence[int]]) -> List[Tuple[Any, ...]]:
+        """
+        Selects the stored rounds matching the filters, ordered by session, stage and round.
+
+        :param session_ids: Session ids to select, or None for all.
+        :param stages: Stage numbers to select, or None for all.
+        :param rounds: Round numbers to select, or None for all.
+        :return: List of database rows.
+        """
+        conditions: List[str] = []
+        parameters: List[int] = []
+        for column, values in (("session_id", session_ids), ("stage", stages), ("round", rounds)):
+            if values is not None:
+                conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+                parameters.extend(int(value) for value in values)
+        where: str = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self.connection.execute(
+            "SELECT session_id, stage, round, mistakes_in_stage, selected_squares, clicked_positions, click_times "
+            f"FROM rounds{where} ORDER BY session_id, stage, round", parameters).fetchall()
+
+    def query_columns(self, session_ids: Optional[Sequence[int]] = None, stages: Optional[Sequence[int]] = None,
+                      rounds: Optional[Sequence[int]] = None) -> Columns:
+        """
+        Returns the stored rounds matching the filters as typed columns.
+
+        :param session_ids: Session ids to select. Default is None (all sessions).
+        :param stages: Stage numbers to select. Default is None (all stages).
+        :param rounds: Round numbers to select. Default is None (all rounds).
+        :return: Columns with the selected rounds.
+        """
+        rows: List[Tuple[Any, ...]] = self._select(session_ids, stages, rounds)
+        arrays: Dict[str, np.ndarray] = {}
+        for idx, name in enumerate(Columns.SCALAR_COLUMNS):
+            arrays[name] = np.fromiter((row[idx] for row in rows), dtype=np.int32, count=len(rows))
+        for idx, name, dtype, width in ((4, "Selected_squares", np.int16, 4), (5, "Clicked_positions", np.int16, 4),
+                                        (6, "Click_times", np.float64, 8)):
+            offsets: np.ndarray = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum(np.fromiter((len(row[idx]) // width for row in rows), dtype=np.int64, count=len(rows)),
+                      out=offsets[1:])
+            values: np.ndarray = np.frombuffer(b"".join(row[idx] for row in rows), dtype=dtype)
+            arrays[name] = values.reshape(-1, 2) if dtype == np.int16 else values
+            arrays[f"{name}_offsets"] = offsets
+        return Columns(arrays)
+
+    def query(self, session_ids: Optional[Sequence[int]] = None, stages: Optional[Sequence[int]] = None,
+              rounds: Optional[Sequence[int]] = None) -> "pd.DataFrame":
+        """
+        Returns the stored rounds matching the filters as a DataFrame with the same columns as the result files.
+
+        :param session_ids: Session ids to select. Default is None (all sessions).
+        :param stages: Stage numbers to select. Default is None (all stages).
+        :param rounds: Round numbers to select. Default is None (all rounds).
+        :return: DataFrame with one row per round, positions as lists of tuples.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.query_columns(session_ids, stages, rounds).to_records(),
+                            columns=["Session", "Stage", "Round", "Selected_squares", "Clicked_positions",
+                                     "Mistakes_in_stage", "Click_times"])
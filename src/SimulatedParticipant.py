@@ -0,0 +1,73 @@
+from Participant import Participant
+from Round import Round
+from CellState import CellState
+
+from typing import Optional
+
+import numpy as np
+
+
+class SimulatedParticipant(Participant):
+    """
+    Class to answer the rounds without a window, with configurable recall accuracy and response times.
+    """
+
+    def __init__(self, recall_accuracy: float = 0.9, span: Optional[float] = None, rt_mean: float = 0.8,
+                 rt_sd: float = 0.3, rng: Optional[np.random.Generator] = None) -> None:
+        """
+        Initializes the SimulatedParticipant with the given parameters.
+
+        :param recall_accuracy: Probability that a click hits a highlighted square. Default is 0.9.
+        :param span: Number of squares above which the accuracy drops proportionally. Default is None (no drop).
+        :param rt_mean: Mean time between clicks in seconds. Default is 0.8.
+        :param rt_sd: Standard deviation of the time between clicks in seconds. Default is 0.3.
+        :param rng: Random number generator. Default is a new unseeded generator.
+        """
+        self.recall_accuracy: float = recall_accuracy
+        self.span: Optional[float] = span
+        self.rt_mean: float = rt_mean
+        self.rt_sd: float = rt_sd
+        self.rng: np.random.Generator = np.random.default_rng() if rng is None else rng
+        self._sigma: float = float(np.sqrt(np.log1p((rt_sd / rt_mean) ** 2)))
+        self._mu: float = float(np.log(rt_mean) - self._sigma ** 2 / 2)
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the SimulatedParticipant object.
+
+        :return: String representation of the SimulatedParticipant object.
+        """
+        return f"Simulated participant with {self.recall_accuracy:.0%} recall accuracy and span {self.span}."
+
+    def accuracy(self, squares_count: int) -> float:
+        """
+        Returns the probability that a single click hits a highlighted square.
+
+        :param squares_count: Number of highlighted squares in the round.
+        :return: Probability of a correct click.
+        """
+        if self.span is None or squares_count <= self.span:
+            return self.recall_accuracy
+        return self.recall_accuracy * self.span / squares_count
+
+    def play_round(self, round_: Round) -> None:
+        """
+        Clicks squares until the round finishes, drawing each click and the time since the previous one.
+
+        :param round_: The round to be played.
+        :return: None
+        """
+        accuracy: float = self.accuracy(len(round_.selected_squares))
+        targets: np.ndarray = np.zeros(round_.states.shape, dtype=bool)
+        for cell in round_.selected_squares:
+            targets[cell] = True
+        click_time: float = 0.0
+
+        while not round_.finished:
+            click_time += float(self.rng.lognormal(self._mu, self._sigma))
+            blank: np.ndarray = round_.states == CellState.BLANK
+            hits: np.ndarray = np.argwhere(blank & targets)
+            misses: np.ndarray = np.argwhere(blank & ~targets)
+            candidates: np.ndarray = hits if len(misses) == 0 or self.rng.random() < accuracy else misses
+            row, col = candidates[self.rng.integers(len(candidates))]
+            round_.click((int(row), int(col)), click_time)
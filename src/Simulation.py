@@ -0,0 +1,88 @@
+from Session import Session
+from SimulatedParticipant import SimulatedParticipant
+from Schedule import Schedule
+from DifficultyScheduler import DifficultyScheduler
+from RoundRecords import RoundRecords
+
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+
+import os
+import numpy as np
+
+
+class Simulation(object):
+    """
+    Class to run sessions with simulated participants, without a window and without waiting.
+    """
+
+    def __init__(self, stages: int = 1, rounds_per_stage: int = 5, recall_accuracy: float = 0.9,
+                 span: Optional[float] = None, rt_mean: float = 0.8, rt_sd: float = 0.3,
+                 seed: Optional[int] = None, difficulty: str = "step") -> None:
+        """
+        Initializes the Simulation with the experiment and participant parameters.
+
+        :param stages: Number of stages in each session. Default is 1.
+        :param rounds_per_stage: Number of rounds per stage. Default is 5.
+        :param recall_accuracy: Probability that a click hits a highlighted square. Default is 0.9.
+        :param span: Number of squares above which the accuracy drops proportionally. Default is None (no drop).
+        :param rt_mean: Mean time between clicks in seconds. Default is 0.8.
+        :param rt_sd: Standard deviation of the time between clicks in seconds. Default is 0.3.
+        :param seed: Seed from which every session derives its own generator. Default is a random seed.
+        :param difficulty: Name of the registered difficulty scheduler. Default is "step".
+        """
+        self.stages: int = stages
+        self.rounds_per_stage: int = rounds_per_stage
+        self.recall_accuracy: float = recall_accuracy
+        self.span: Optional[float] = span
+        self.rt_mean: float = rt_mean
+        self.rt_sd: float = rt_sd
+        self.seed: int = np.random.SeedSequence().entropy if seed is None else seed
+        self.difficulty: str = difficulty
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Simulation object.
+
+        :return: String representation of the Simulation object.
+        """
+        return (f"Simulation with {self.stages} stages and {self.rounds_per_stage} rounds per stage, "
+                f"{self.difficulty} difficulty (seed {self.seed}).")
+
+    def run_session(self, session_number: int) -> RoundRecords:
+        """
+        Runs a single simulated session.
+
+        The generators are derived from the simulation seed and the session number,
+        so the same session is reproduced regardless of the process it runs in.
+
+        :param session_number: Number of the session stored in the results.
+        :return: RoundRecords with the results of every round.
+        """
+        seed_sequence: np.random.SeedSequence = np.random.SeedSequence(self.seed, spawn_key=(session_number,))
+        participant_seed, session_seed = seed_sequence.spawn(2)
+        participant: SimulatedParticipant = SimulatedParticipant(self.recall_accuracy, self.span, self.rt_mean,
+                                                                 self.rt_sd, np.random.default_rng(participant_seed))
+        difficulty: DifficultyScheduler = DifficultyScheduler.create(self.difficulty)
+        schedule: Schedule = Schedule.generate(self.stages, self.rounds_per_stage,
+                                               difficulty.max_grid_size(self.rounds_per_stage),
+                                               seed=int(session_seed.generate_state(1)[0]))
+        session: Session = Session(participant, session_number, self.stages, self.rounds_per_stage, schedule,
+                                   difficulty=difficulty)
+        return session.run()
+
+    def run_batch(self, sessions: int, workers: Optional[int] = None) -> RoundRecords:
+        """
+        Runs many simulated sessions spread over a pool of processes.
+
+        :param sessions: Number of sessions to run, numbered from 1.
+        :param workers: Number of worker processes. Default is the number of CPUs.
+        :return: RoundRecords with the results of every round of every session, in session order.
+        """
+        workers = workers or os.cpu_count() or 1
+        chunksize: int = max(1, sessions // (workers * 4))
+        results_list: RoundRecords = RoundRecords()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for session_results in executor.map(self.run_session, range(1, sessions + 1), chunksize=chunksize):
+                results_list.extend(session_results)
+        return results_list
@@ -0,0 +1,50 @@
+from Experiment import Experiment
+
+from typing import List, Optional
+
+
+class Station(object):
+    """
+    Class to run back-to-back sessions of many participants at one station.
+
+    The experiment window, the stimuli and the post-processor workers are created once and reused,
+    between participants only the per-session state is reset and the next session starts with a keypress.
+    Every session gets the next session number from the session store.
+    """
+
+    def __init__(self, experiment: Experiment, sessions: Optional[int] = None) -> None:
+        """
+        Initializes the Station with the experiment run for every participant.
+
+        :param experiment: The experiment with the window reused by all sessions.
+        :param sessions: Number of sessions to run, or None to run until escape is pressed.
+        """
+        self.experiment: Experiment = experiment
+        self.sessions: Optional[int] = sessions
+        self.session_numbers: List[int] = []
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Station object.
+
+        :return: String representation of the Station object.
+        """
+        numbers: str = ", ".join(str(number) for number in self.session_numbers) or "none"
+        return f"Station with {len(self.session_numbers)} sessions run: {numbers}"
+
+    def run(self) -> int:
+        """
+        Runs sessions until the given number is reached or escape is pressed between participants.
+
+        :return: 0 if all sessions were successful.
+        """
+        while True:
+            result: int = self.experiment.run()
+            self.session_numbers.append(self.experiment.session_number)
+            if result != 0:
+                return result
+            if self.sessions is not None and len(self.session_numbers) >= self.sessions:
+                return 0
+            if not self.experiment.show_next_participant():
+                return 0
+            self.experiment.reset()
@@ -0,0 +1,58 @@
+from Colors import Colors
+
+from typing import Dict, Any, Optional
+
+from psychopy import visual
+
+
+class TextCache(object):
+    """
+    Class to build the text stimuli once and reuse them between screens.
+
+    Screens with changing content reuse a single stimulus and only update its text.
+    """
+
+    def __init__(self, win: visual.Window) -> None:
+        """
+        Initializes the TextCache for the given window.
+
+        :param win: The window in which the texts will be drawn.
+        """
+        self.win: visual.Window = win
+        self.stimuli: Dict[str, visual.TextStim] = {}
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the TextCache object.
+
+        :return: String representation of the TextCache object.
+        """
+        return f"TextCache with {len(self.stimuli)} texts: {', '.join(self.stimuli)}"
+
+    def add(self, name: str, text: str, height: float = 0.05, **kwargs: Any) -> visual.TextStim:
+        """
+        Builds a text stimulus and stores it under the given name.
+
+        :param name: The name of the stimulus.
+        :param text: The initial text.
+        :param height: The height of the letters. Default is 0.05 (height units).
+        :param kwargs: Other arguments passed to visual.TextStim.
+        :return: The built stimulus.
+        """
+        stimulus: visual.TextStim = visual.TextStim(self.win, text=text, color=Colors.WHITE.value, height=height,
+                                                    **kwargs)
+        self.stimuli[name] = stimulus
+        return stimulus
+
+    def get(self, name: str, text: Optional[str] = None) -> visual.TextStim:
+        """
+        Returns the stored stimulus, updating its text if a different one is given.
+
+        :param name: The name of the stimulus.
+        :param text: The new text. Default is None (keep the current text).
+        :return: The stimulus ready to be drawn.
+        """
+        stimulus: visual.TextStim = self.stimuli[name]
+        if text is not None and stimulus.text != text:
+            stimulus.text = text
+        return stimulus
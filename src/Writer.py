@@ -0,0 +1,286 @@
+from Columns import Columns
+
+from typing import List, Dict, Any, Type, Callable, Optional, IO
+from abc import ABC, abstractmethod
+
+import os
+import csv
+import json
+import tempfile
+import textwrap
+
+
+class Writer(ABC):
+    """
+    Base class of the result file writers used by Converter.
+
+    A writer receives the round results one by one and writes them to a temporary file next to the target,
+    which replaces the target only when the writer is closed, so a file is never left half written.
+    Subclasses are registered under a format name with Writer.register.
+    """
+
+    registry: Dict[str, Type["Writer"]] = {}
+    EXTENSION: str = ""
+    BINARY: bool = False
+
+    def __init__(self, filename: str, **options: Any) -> None:
+        """
+        Initializes the Writer with the base name of the file.
+
+        :param filename: The base name of the file (without extension).
+        :param options: Format specific options, unknown options are ignored.
+        """
+        self.path: str = f"{filename}{self.EXTENSION}"
+        self.options: Dict[str, Any] = options
+        self.file: Optional[IO] = None
+        self._temp_path: str = ""
+
+    def __str__(self) -> str:
+        """
+        Return a string representation of the Writer object.
+
+        :return: String representation of the Writer object.
+        """
+        return f"{self.__class__.__name__} for: {self.path}"
+
+    @classmethod
+    def register(cls, name: str) -> Callable[[Type["Writer"]], Type["Writer"]]:
+        """
+        Class decorator registering a writer under a format name.
+
+        :param name: The name of the format, e.g. "csv".
+        :return: The decorator.
+        """
+        def decorator(writer_class: Type["Writer"]) -> Type["Writer"]:
+            cls.registry[name] = writer_class
+            return writer_class
+        return decorator
+
+    def open(self) -> None:
+        """
+        Opens the temporary file.
+
+        :return: None
+        """
+        directory: str = os.path.dirname(self.path) or "."
+        fd, self._temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(self.path)}.",
+                                               suffix=".tmp")
+        self.file = os.fdopen(fd, "wb") if self.BINARY else os.fdopen(fd, "w", newline=self._newline())
+
+    @abstractmethod
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Writes a single round result.
+
+        :param record: Dictionary containing the result of a round.
+        :return: None
+        """
+
+    def write_columns(self, columns: Columns) -> bool:
+        """
+        Takes all results at once as columns, if the writer supports it.
+
+        :param columns: The columnar results.
+        :return: True if the writer took the columns and needs no write calls.
+        """
+        return False
+
+    def finish(self) -> None:
+        """
+        Writes whatever has to follow the last result.
+
+        :return: None
+        """
+
+    def close(self) -> None:
+        """
+        Finishes the file and moves it over the target file.
+
+        :return: None
+        """
+        self.finish()
+        self.commit()
+
+    def commit(self) -> None:
+        """
+        Closes the finished temporary file and moves it over the target file.
+
+        The temporary file is created readable by the owner only, so it gets the mode of a newly created file
+        (0666 without the umask) first.
+
+        :return: None
+        """
+        self.file.close()
+        umask: int = os.umask(0)
+        os.umask(umask)
+        os.chmod(self._temp_path, 0o666 & ~umask)
+        os.replace(self._temp_path, self.path)
+
+    def abort(self) -> None:
+        """
+        Closes and removes the temporary file, leaving the target file untouched.
+
+        :return: None
+        """
+        if self.file is not None:
+            self.file.close()
+        if self._temp_path and os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+    def _newline(self) -> Optional[str]:
+        """
+        Returns the newline mode of text files.
+
+        :return: The newline argument passed to open.
+        """
+        return None
+
+
+@Writer.register("csv")
+class CsvWriter(Writer):
+    """
+    Writer saving the results to a CSV file, one round per row.
+    """
+
+    EXTENSION: str = ".csv"
+
+    def open(self) -> None:
+        """
+        Opens the temporary file and the CSV writer.
+
+        :return: None
+        """
+        super().open()
+        self._csv: Any = csv.writer(self.file, lineterminator=os.linesep)
+        self._header: bool = False
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Writes a single round result as a row, preceded by the header for the first one.
+
+        :param record: Dictionary containing the result of a round.
+        :return: None
+        """
+        if not self._header:
+            self._csv.writerow(record.keys())
+            self._header = True
+        self._csv.writerow(record.values())
+
+    def _newline(self) -> Optional[str]:
+        """
+        Returns the newline mode of the file, line endings are written by the CSV writer.
+
+        :return: The newline argument passed to open.
+        """
+        return ""
+
+
+@Writer.register("txt")
+class TxtWriter(Writer):
+    """
+    Writer saving the results to a TXT file, every key and value on a separate line.
+    """
+
+    EXTENSION: str = ".txt"
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Writes a single round result followed by an empty line.
+
+        :param record: Dictionary containing the result of a round.
+        :return: None
+        """
+        self.file.write("".join(f"{key}: {value}\n" for key, value in record.items()))
+        self.file.write("\n")
+
+
+@Writer.register("json")
+class JsonWriter(Writer):
+    """
+    Writer saving the results to a JSON file as a list of objects.
+
+    The compact option drops the indentation and spaces.
+    """
+
+    EXTENSION: str = ".json"
+
+    def open(self) -> None:
+        """
+        Opens the temporary file.
+
+        :return: None
+        """
+        super().open()
+        self._compact: bool = bool(self.options.get("compact_json", False))
+        self._count: int = 0
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Writes a single round result as an element of the list.
+
+        :param record: Dictionary containing the result of a round.
+        :return: None
+        """
+        if self._compact:
+            self.file.write(("," if self._count else "[") + json.dumps(record, separators=(",", ":")))
+        else:
+            self.file.write((",\n" if self._count else "[\n") + textwrap.indent(json.dumps(record, indent=4), "    "))
+        self._count += 1
+
+    def finish(self) -> None:
+        """
+        Closes the list.
+
+        :return: None
+        """
+        if self._count == 0:
+            self.file.write("[]")
+        else:
+            self.file.write("]" if self._compact else "\n]")
+
+
+@Writer.register("npz")
+class NpzWriter(Writer):
+    """
+    Writer saving the results to a typed columnar NumPy file.
+    """
+
+    EXTENSION: str = ".npz"
+    BINARY: bool = True
+
+    def open(self) -> None:
+        """
+        Opens the temporary file.
+
+        :return: None
+        """
+        super().open()
+        self._records: List[Dict[str, Any]] = []
+        self._columns: Optional[Columns] = None
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Collects a single round result, the columns are built when the writer is closed.
+
+        :param record: Dictionary containing the result of a round.
+        :return: None
+        """
+        self._records.append(record)
+
+    def write_columns(self, columns: Columns) -> bool:
+        """
+        Takes all results at once as columns, which are written without conversion.
+
+        :param columns: The columnar results.
+        :return: True
+        """
+        self._columns = columns
+        return True
+
+    def finish(self) -> None:
+        """
+        Builds the columns, unless they were given, and writes them.
+
+        :return: None
+        """
+        (self._columns if self._columns is not None else Columns.from_records(self._records)).save(self.file)
@@ -1,6 +1,123 @@
-from Experiment import Experiment
+from typing import List, Dict, Any, Optional
 
-from typing import Any
+import argparse
+import os
+import datetime
+
+
+def simulate(sessions: int, workers: Optional[int], seed: Optional[int] = None,
+             path_to_results: str = "results/", difficulty: str = "step") -> int:
+    """
+    Runs a batch of simulated sessions without a window and saves the results to files
+    named by the time (with seconds) and the seed of the simulation, so batches started in the same minute
+    do not overwrite each other.
+
+    :param sessions: Number of sessions to simulate.
+    :param workers: Number of worker processes, or None to use all CPUs.
+    :param seed: Seed of the simulation, or None for a random seed.
+    :param path_to_results: Path where the results will be saved. Default is "results/".
+    :param difficulty: Name of the difficulty scheduler. Default is "step".
+    :return: 0 if the simulation was successful.
+    """
+    from Simulation import Simulation
+    from Converter import Converter
+    from RoundRecords import RoundRecords
+
+    simulation: Simulation = Simulation(seed=seed, difficulty=difficulty)
+    results_list: RoundRecords = simulation.run_batch(sessions, workers)
+
+    timestamp: str = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+    converter: Converter = Converter(results_list, f"{path_to_results}{timestamp}_simulated_{simulation.seed}")
+    converter.save(("csv", "json"))
+
+    played: int = int((results_list.columns().lengths("Selected_squares") > 0).sum())
+    print(f"{simulation} Sessions: {sessions}, rounds: {len(results_list)}, played rounds: {played}")
+
+    return 0
+
+
+def cohort(path: str, workers: Optional[int]) -> int:
+    """
+    Aggregates all result files in a directory and plots the group-level results.
+
+    :param path: The directory with the result files.
+    :param workers: Number of worker processes, or None to use all CPUs.
+    :return: 0 if the aggregation was successful.
+    """
+    from Cohort import Cohort
+    from CohortStats import CohortStats
+
+    cohort_: Cohort = Cohort.from_directory(path, workers=workers)
+    stats: CohortStats = cohort_.run()
+    cohort_.plot_average_time_per_square()
+    cohort_.plot_overall_average_accuracy()
+
+    print(stats)
+    print(stats.span_per_stage().to_string(index=False))
+
+    return 0
+
+
+def plot(path: str, workers: Optional[int]) -> int:
+    """
+    Regenerates the plots of all result files in a directory in worker processes,
+    reusing the metrics cached in the .cache subdirectory for unchanged files.
+
+    :param path: The directory with the result files.
+    :param workers: Number of worker processes, or None to use all CPUs.
+    :return: 0 if the plots were saved.
+    """
+    from Cohort import Cohort
+    from Plotter import Plotter
+
+    plotted: int = Plotter.render_all(Cohort.result_files(path), workers=workers,
+                                      cache_dir=os.path.join(path, ".cache"))
+
+    print(f"Plotted result files: {plotted}")
+
+    return 0
+
+
+def rescore(path: str, workers: Optional[int], max_mistakes: Optional[int] = None, difficulty: str = "step") -> int:
+    """
+    Re-scores all result files in a directory with the scoring rules of Round and the stage rule
+    of the difficulty scheduler the sessions were run with, and saves the scores to the rescored subdirectory.
+
+    :param path: The directory with the result files.
+    :param workers: Number of worker processes, or None to use all CPUs.
+    :param max_mistakes: The number of mistakes allowed in a round, or None for the rule of Round.
+    :param difficulty: Name of the difficulty scheduler, whose MAX_MISTAKES failed rounds end a stage.
+                       Default is "step".
+    :return: 0 if the results were re-scored.
+    """
+    from Cohort import Cohort
+    from Rescorer import Rescorer
+    from DifficultyScheduler import DifficultyScheduler
+    import pandas as pd
+
+    rules: Dict[str, Any] = {"max_failed_rounds": DifficultyScheduler.registry[difficulty].MAX_MISTAKES}
+    if max_mistakes is not None:
+        rules["max_mistakes"] = max_mistakes
+    rescorer: Rescorer = Rescorer(**rules)
+    frames: List[pd.DataFrame] = [pd.DataFrame(scores).assign(File=os.path.basename(filename))
+                                  for filename, scores in rescorer.rescore_all(Cohort.result_files(path), workers)]
+    if not frames:
+        print(f"No result files in: {path}")
+        return 0
+    data: pd.DataFrame = pd.concat(frames, ignore_index=True)
+
+    save_dir: str = os.path.join(path, "rescored")
+    if not os.path.exists(save_dir):
+        os.makedirs(save_dir)
+    timestamp: str = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+    data[["File"] + [name for name in data.columns if name != "File"]].to_csv(
+        os.path.join(save_dir, f"{timestamp}_rescored_{difficulty}.csv"), index=False)
+
+    print(rescorer)
+    print(f"Rescored files: {len(frames)}, played rounds: {int(data['Played'].sum())}, "
+          f"correct: {int(data['Correct'].sum())}, changed: {int(data['Changed'].sum())}")
+
+    return 0
 
 
 def main() -> int:
@@ -9,12 +126,67 @@ def main() -> int:
 
     :return: 0 if the experiment was successful.
     """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Visual Memory Test")
+    parser.add_argument("--simulate", type=int, metavar="SESSIONS",
+                        help="run the given number of simulated sessions without a window")
+    parser.add_argument("--cohort", metavar="DIR",
+                        help="aggregate all result files in the given directory and plot the group-level results")
+    parser.add_argument("--plot", metavar="DIR", help="regenerate the plots of all result files in the given directory")
+    parser.add_argument("--rescore", metavar="DIR",
+                        help="re-score all result files in the given directory with the current scoring rules")
+    parser.add_argument("--max-mistakes", type=int,
+                        help="number of mistakes allowed in a round when re-scoring (default: the rule of Round)")
+    parser.add_argument("--workers", type=int,
+                        help="number of worker processes for simulated sessions, cohort aggregation, plotting "
+                             "or re-scoring")
+    parser.add_argument("--seed", type=int, help="seed of the trial schedule or of the simulation")
+    parser.add_argument("--schedule", metavar="FILE",
+                        help="trial schedule file (.npz) to load, or to create if it does not exist; "
+                             "a file not covering the stages, rounds and grid sizes is rejected")
+    parser.add_argument("--difficulty", choices=("step", "staircase"), default="step",
+                        help="difficulty scheduler: the step rule or the adaptive staircase, when re-scoring the one "
+                             "the sessions were run with (default: step)")
+    parser.add_argument("--instrument", action="store_true",
+                        help="record frame timing and latencies and save them with the results")
+    parser.add_argument("--station", action="store_true",
+                        help="run back-to-back sessions of many participants in one window")
+    parser.add_argument("--sessions", type=int,
+                        help="number of sessions in station mode (default: until escape is pressed)")
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.simulate:
+        return simulate(args.simulate, args.workers, args.seed, difficulty=args.difficulty)
+    if args.cohort:
+        return cohort(args.cohort, args.workers)
+    if args.plot:
+        return plot(args.plot, args.workers)
+    if args.rescore:
+        return rescore(args.rescore, args.workers, args.max_mistakes, args.difficulty)
+
+    from Experiment import Experiment
+    from DifficultyScheduler import DifficultyScheduler
+
     #experiment = Experiment(fullscreen=False)
-    experiment = Experiment()
-    result: int = experiment.run()
+    experiment = Experiment(seed=args.seed, schedule_file=args.schedule, instrument=args.instrument,
+                            difficulty=DifficultyScheduler.create(args.difficulty))
+    if args.station:
+        from Station import Station
+
+        station: Station = Station(experiment, args.sessions)
+        result: int = station.run()
+        print(station)
+    else:
+        result = experiment.run()
 
     print("Experiment result: ", result)
 
+    pending: List[str] = experiment.post_processor.pending()
+    if pending:
+        print("Waiting for the results to be saved: ", ", ".join(pending))
+    experiment.post_processor.shutdown()
+    for filename, error in experiment.post_processor.failed().items():
+        print(f"Saving {filename} failed: {error!r}")
+
     return 0
 
 
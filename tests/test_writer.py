@@ -0,0 +1,29 @@
+import os
+import stat
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from Converter import Converter
+
+RECORDS = [{"Session": 1, "Stage": 1, "Round": 1, "Selected_squares": [(0, 0), (1, 2)],
+            "Clicked_positions": [(0, 0), (2, 2)], "Mistakes_in_stage": 1, "Click_times": [0.5, 0.9]}]
+
+
+def test_committed_files_get_the_umask_mode(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        Converter(RECORDS, str(tmp_path / "results")).save(("csv", "txt", "json", "npz"))
+    finally:
+        os.umask(umask)
+    for extension in (".csv", ".txt", ".json", ".npz"):
+        assert stat.S_IMODE(os.stat(tmp_path / f"results{extension}").st_mode) == 0o644
+
+
+def test_committed_files_follow_a_stricter_umask(tmp_path):
+    umask = os.umask(0o077)
+    try:
+        Converter(RECORDS, str(tmp_path / "results")).save(("csv",))
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(os.stat(tmp_path / "results.csv").st_mode) == 0o600